@@ -0,0 +1,86 @@
+"""Benchmark the per-experiment git commit against workspace size.
+
+Builds a synthetic git workspace of N committed experiments. Before each
+timed commit, a fraction of the experiments write new output files (as
+running experiments do), then one new experiment directory is committed:
+
+- ``scoped``: ``git.add_and_commit(paths=[...])`` (``git add`` +
+  ``git commit -- <path>``), as ``create`` does;
+- ``git add .``: the old behavior, which walks the whole work tree and
+  hashes (and commits) every new output.
+
+    uv run python benchmarks/bench_commit.py --counts 100 1000 5000
+    uv run python benchmarks/bench_commit.py --counts 1000 --churn 0.5 --output-kb 1024
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from novo.core import git
+
+
+def _populate(workspace: Path, count: int, files: int) -> None:
+    git.init(workspace)
+    for key, value in (("user.name", "bench"), ("user.email", "bench@example.com"), ("gc.auto", "0")):
+        subprocess.run(["git", "config", key, value], cwd=workspace, check=True)
+    for i in range(count):
+        exp_dir = workspace / f"exp-{i:05d}"
+        exp_dir.mkdir()
+        for j in range(files):
+            (exp_dir / f"file-{j}.py").write_text(f"# {i} {j}\n")
+    git.add_and_commit(workspace, "populate")
+    # Packed, as auto-gc leaves a long-lived repo (but no gc during the timed commits)
+    subprocess.run(["git", "gc", "-q"], cwd=workspace, check=True)
+
+
+def _write_outputs(workspace: Path, count: int, churn: float, size: int, tag: str) -> None:
+    step = max(1, round(1 / churn)) if churn else 0
+    for i in range(0, count, step) if step else ():
+        (workspace / f"exp-{i:05d}" / f"output-{tag}.bin").write_bytes(os.urandom(size))
+
+
+STRATEGIES = {
+    "scoped": lambda workspace, message, name: git.add_and_commit(workspace, message, paths=[name]),
+    "git add .": lambda workspace, message, name: git.add_and_commit(workspace, message),
+}
+
+
+def _time_commits(workspace: Path, args: argparse.Namespace, count: int, strategy: str) -> list[float]:
+    timings = []
+    commit = STRATEGIES[strategy]
+    for r in range(args.repeat):
+        name = f"new-{list(STRATEGIES).index(strategy)}-{r}"
+        _write_outputs(workspace, count, args.churn, args.output_kb * 1024, name)
+        (workspace / name).mkdir()
+        (workspace / name / ".novo.toml").write_text(f'[experiment]\nname = "{name}"\n')
+        start = time.perf_counter()
+        commit(workspace, f"create {name}", name)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--files", type=int, default=5, help="Tracked files per experiment")
+    parser.add_argument("--churn", type=float, default=0.1, help="Fraction of experiments writing outputs per round")
+    parser.add_argument("--output-kb", type=int, default=64, help="Size of each new output file")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'experiments':>11}" + "".join(f"  {strategy:>10}" for strategy in STRATEGIES))
+    for count in args.counts:
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            _populate(workspace, count, args.files)
+            medians = [statistics.median(_time_commits(workspace, args, count, s)) for s in STRATEGIES]
+            print(f"{count:>11}" + "".join(f"  {median * 1000:>8.1f}ms" for median in medians))
+
+
+if __name__ == "__main__":
+    main()
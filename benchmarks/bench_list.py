@@ -0,0 +1,108 @@
+"""Benchmark per-experiment overhead of the list_all read path.
+
+Fills an index with N synthetic experiments, then compares loading them as
+slot-based ``ExperimentRecord`` views (what ``list_all`` returns) against
+validating a full pydantic ``Experiment`` per row, and against the batched
+``TypeAdapter`` path used when validation is still required.
+
+    uv run python benchmarks/bench_list.py --count 10000
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from novo.core import index
+from novo.models.experiment import TAG_SEPARATOR, Experiment, ExperimentRecord, validate_experiments
+
+
+def _populate(workspace: Path, count: int) -> None:
+    entries = [
+        (
+            Experiment(
+                name=f"exp-{i:05d}",
+                tags=["bench", f"group-{i % 10}"],
+                description="synthetic benchmark experiment",
+                dir_name=f"2026-01-01-exp-{i:05d}",
+            ),
+            0.0,
+            (0, 0, i),
+        )
+        for i in range(count)
+    ]
+    with index.open_index(workspace) as conn:
+        index.replace_all(conn, entries)
+
+
+def _rows(workspace: Path) -> list[tuple]:
+    with index.open_index(workspace) as conn:
+        return conn.execute(f"SELECT {index._RECORD_COLUMNS} FROM experiments ORDER BY dir_name").fetchall()
+
+
+def _as_dict(row: tuple) -> dict:
+    dir_name, name, seed, tags, description, python, created_at = row
+    return {
+        "name": name,
+        "seed": seed,
+        "tags": tags.split(TAG_SEPARATOR) if tags else [],
+        "description": description,
+        "python": python,
+        "created_at": created_at,
+        "dir_name": dir_name,
+    }
+
+
+def _pydantic_per_row(rows: list[tuple]) -> None:
+    for row in rows:
+        data = _as_dict(row)
+        data["created_at"] = datetime.fromisoformat(data["created_at"])
+        Experiment(**data).model_dump(mode="json")
+
+
+def _records(rows: list[tuple]) -> None:
+    for row in rows:
+        ExperimentRecord.from_row(row).to_dict()
+
+
+def _batched(rows: list[tuple]) -> None:
+    for exp in validate_experiments([_as_dict(row) for row in rows]):
+        exp.model_dump(mode="json")
+
+
+def _bench(fn, rows: list[tuple], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(rows)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = Path(tmp)
+        _populate(workspace, args.count)
+        rows = _rows(workspace)
+
+    baseline = _bench(_pydantic_per_row, rows, args.repeat)
+    print(f"{'path':<24}  {'total':>10}  {'per exp':>10}  {'speedup':>8}")
+    for label, fn in (
+        ("pydantic per row", _pydantic_per_row),
+        ("batched TypeAdapter", _batched),
+        ("ExperimentRecord", _records),
+    ):
+        median = _bench(fn, rows, args.repeat)
+        per_exp = median / len(rows) * 1e6
+        print(f"{label:<24}  {median * 1000:>8.1f}ms  {per_exp:>8.2f}us  {baseline / median:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
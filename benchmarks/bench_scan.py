@@ -0,0 +1,77 @@
+"""Benchmark the cold workspace scan against the number of worker threads.
+
+Builds a synthetic workspace of N experiments (or uses --path to scan an
+existing one, e.g. on an NFS mount) and times ``_scan_workspace`` for each
+worker count. ``--latency-ms`` adds a fixed delay to every .novo.toml read
+to emulate network filesystem round trips on a local disk.
+
+    uv run python benchmarks/bench_scan.py --count 5000 --workers 1 2 4 8 16
+    uv run python benchmarks/bench_scan.py --count 2000 --latency-ms 1
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from novo.core import experiment
+from novo.models.experiment import Experiment
+
+
+def _populate(workspace: Path, count: int) -> None:
+    for i in range(count):
+        exp_dir = workspace / f"2026-01-01-exp-{i:05d}"
+        exp_dir.mkdir()
+        exp = Experiment(name=f"exp-{i:05d}", tags=["bench", f"group-{i % 10}"], dir_name=exp_dir.name)
+        experiment._write_novo_toml(exp_dir, exp)
+
+
+def _time_scan(workspace: Path, workers: int, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entries = experiment._scan_workspace(workspace, workers)
+        timings.append(time.perf_counter() - start)
+    assert entries is not None
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Synthetic experiments to create")
+    parser.add_argument("--path", type=Path, help="Scan an existing workspace instead")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Emulated delay per .novo.toml read")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workspace = args.path
+        if workspace is None:
+            workspace = Path(tmp)
+            _populate(workspace, args.count)
+
+        read = experiment._parse_novo_toml
+        delay = args.latency_ms / 1000
+
+        def slow_read(path: Path) -> dict | None:
+            time.sleep(delay)
+            return read(path)
+
+        with patch.object(experiment, "_parse_novo_toml", slow_read if delay else read):
+            baseline = None
+            print(f"{'workers':>8}  {'median':>10}  {'min':>10}  {'speedup':>8}")
+            for workers in args.workers:
+                timings = _time_scan(workspace, workers, args.repeat)
+                median = statistics.median(timings)
+                baseline = baseline or median
+                print(
+                    f"{workers:>8}  {median * 1000:>8.1f}ms  {min(timings) * 1000:>8.1f}ms  "
+                    f"{baseline / median:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
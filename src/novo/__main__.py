@@ -1,5 +1,5 @@
 """Allow running novo as `python -m novo`."""
 
-from novo.cli import app
+from novo.launcher import main
 
-app()
+main()
@@ -33,4 +33,21 @@ def main(
 
 
 # Import and register subcommands
-from novo.cli import config, delete, info, init, list, new, open, search, seed  # noqa: E402, F401
+from novo.cli import (  # noqa: E402, F401
+    archive,
+    commit,
+    config,
+    delete,
+    du,
+    index,
+    info,
+    init,
+    list,
+    new,
+    open,
+    pool,
+    restore,
+    search,
+    seed,
+    trash,
+)
@@ -0,0 +1,58 @@
+"""novo archive command."""
+
+from typing import Optional
+
+import typer
+from rich import print as rprint
+
+from novo.cli import app
+from novo.cli.common import parse_age, resolve_experiment
+from novo.utils.format import format_size
+
+
+@app.command()
+def archive(
+    name: Optional[str] = typer.Argument(None, help="Experiment to archive"),
+    older_than: Optional[str] = typer.Option(
+        None, "--older-than", help="Archive every experiment inactive this long (e.g. 90d, 12w, 36h)"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Only list what would be archived"),
+) -> None:
+    """Pack experiments into compressed cold storage (`novo open` unpacks them)."""
+    from novo.core.config import current_config
+    from novo.core.experiment import archive as archive_experiments
+    from novo.core.experiment import archived_names, inactive
+
+    if (name is None) == (older_than is None):
+        rprint("[red]Error:[/red] give either an experiment name or --older-than")
+        raise typer.Exit(1)
+
+    config = current_config()
+    if name is not None:
+        dir_name = resolve_experiment(name, fuzzy=False, config=config).dir_name
+        if dir_name in archived_names(config):
+            rprint(f"[dim]Already archived:[/dim] {dir_name}")
+            return
+        targets = [dir_name]
+    else:
+        targets = inactive(parse_age(older_than, "--older-than"), config)
+        if not targets:
+            rprint(f"[dim]No unarchived experiments inactive for {older_than}.[/dim]")
+            return
+
+    if dry_run:
+        for dir_name in targets:
+            rprint(f"[dim]Would archive:[/dim] {dir_name}")
+        return
+
+    try:
+        results = archive_experiments(targets, config)
+    except Exception as e:
+        rprint(f"[red]Error archiving:[/red] {e}")
+        raise typer.Exit(1)
+
+    for dir_name, stats in results:
+        rprint(
+            f"[green]Archived:[/green] {dir_name} "
+            f"[dim]({stats.files} files, {format_size(stats.size)} -> {format_size(stats.compressed)})[/dim]"
+        )
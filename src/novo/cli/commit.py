@@ -0,0 +1,56 @@
+"""novo commit command."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print as rprint
+
+from novo.cli import app
+
+
+@app.command("commit")
+def commit(
+    flush: bool = typer.Option(False, "--flush", help="Commit journaled changes now"),
+    background: bool = typer.Option(False, "--background", hidden=True, help="Run the batching committer"),
+    workspace: Optional[Path] = typer.Option(None, "--workspace", hidden=True, help="Workspace to act on"),
+    window: Optional[float] = typer.Option(None, "--window", hidden=True, help="Override commit.window"),
+    max_ops: Optional[int] = typer.Option(None, "--max-ops", hidden=True, help="Override commit.max_ops"),
+) -> None:
+    """Show or flush changes waiting in the deferred-commit journal."""
+    from novo.core import journal
+    from novo.core.config import current_config
+    from novo.core.workspace import ensure_initialized
+
+    workspace = workspace or ensure_initialized()
+
+    if background:
+        config = current_config()
+        journal.run_committer(
+            workspace,
+            config.commit.window if window is None else window,
+            max_ops or config.commit.max_ops,
+        )
+        return
+
+    if flush:
+        try:
+            count = journal.flush(workspace)
+        except Exception as e:
+            rprint(f"[red]Error committing:[/red] {e}")
+            raise typer.Exit(1)
+        if count:
+            rprint(f"[green]Committed[/green] {count} change{'s' if count != 1 else ''}")
+        else:
+            rprint("[dim]Nothing to commit.[/dim]")
+        return
+
+    entries = journal.pending(workspace)
+    if not entries:
+        rprint("[dim]Nothing to commit.[/dim]")
+        return
+    rprint(f"[bold]{len(entries)}[/bold] change{'s' if len(entries) != 1 else ''} waiting to be committed:")
+    for entry in entries:
+        rprint(f"  {entry['message'].splitlines()[0]}")
+    if not journal.committer_running(workspace):
+        rprint("[dim]No committer running; run `novo commit --flush`.[/dim]")
@@ -0,0 +1,98 @@
+"""Helpers shared by CLI commands."""
+
+import json
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+import typer
+from rich import print as rprint
+
+if TYPE_CHECKING:
+    from novo.models.config import NovoConfig
+    from novo.models.experiment import ExperimentRecord
+
+
+def resolve_experiment(
+    name: str, fuzzy: bool = True, quiet: bool = False, config: "NovoConfig | None" = None
+) -> "ExperimentRecord":
+    """Resolve *name* to an experiment or exit with a "did you mean" hint.
+
+    With *fuzzy*, an unambiguous typo (``imge-clasifier``) resolves to the
+    intended experiment and a note says so. *quiet* suppresses all output
+    (for machine-read commands like `_open-path`). *config* is passed on to
+    the core lookups.
+    """
+    from novo.core.experiment import resolve, suggest
+
+    record = resolve(name, fuzzy=fuzzy, config=config)
+    if record is not None:
+        if not quiet and name not in (record.name, record.dir_name):
+            rprint(f"[dim]Matched[/dim] {record.name} [dim]for '{name}'[/dim]")
+        return record
+
+    if not quiet:
+        rprint(f"[red]Experiment not found:[/red] {name}")
+        candidates = suggest(name, config=config)
+        if candidates:
+            rprint(f"[dim]Did you mean:[/dim] {', '.join(c.name for c in candidates)}")
+    raise typer.Exit(1)
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Split a comma-separated ``--fields`` value, exiting on unknown names."""
+    if fields is None:
+        return None
+    from novo.models.experiment import ExperimentRecord
+
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in names if f not in ExperimentRecord.FIELDS]
+    if unknown or not names:
+        rprint(f"[red]Unknown field(s):[/red] {', '.join(unknown) or fields!r}")
+        rprint(f"[dim]Available: {', '.join(ExperimentRecord.FIELDS)}[/dim]")
+        raise typer.Exit(1)
+    return names
+
+
+def parse_date(value: str | None, option: str, end: bool = False) -> datetime | None:
+    """Parse a ``--since``/``--until`` bound, exiting on a malformed value.
+
+    A bare date used as an *end* bound covers that whole day (the result is
+    the following midnight, to be compared exclusively).
+    """
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        rprint(f"[red]Invalid date for {option}:[/red] {value} [dim](expected YYYY-MM-DD)[/dim]")
+        raise typer.Exit(1)
+    if end and "T" not in value and " " not in value:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def parse_age(value: str, option: str) -> float:
+    """Parse an age like ``90d``, ``12w`` or ``36h`` into seconds, exiting on a malformed value."""
+    units = {"h": 3600, "d": 86400, "w": 7 * 86400}
+    number, unit = value[:-1], value[-1:].lower()
+    if unit not in units or not number.isdigit():
+        rprint(f"[red]Invalid age for {option}:[/red] {value} [dim](expected e.g. 36h, 90d, 12w)[/dim]")
+        raise typer.Exit(1)
+    return int(number) * units[unit]
+
+
+def echo_json(
+    records: Iterable["ExperimentRecord"], fields: list[str] | None = None, ndjson: bool = False
+) -> None:
+    """Print records as a JSON array, or one object per line with *ndjson*.
+
+    NDJSON lines are written as records arrive, so a streaming *records*
+    iterable is never materialized.
+    """
+    if ndjson:
+        for record in records:
+            typer.echo(json.dumps(record.to_dict(fields), default=str))
+        return
+    data = [record.to_dict(fields) for record in records]
+    typer.echo(json.dumps(data, indent=2, default=str))
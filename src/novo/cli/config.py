@@ -15,6 +15,20 @@ CONFIG_KEYS: dict[str, type] = {
     "defaults.auto_commit": bool,
     "defaults.python": str,
     "naming.date_prefix": bool,
+    "index.scan_workers": int,
+    "index.activity_interval": float,
+    "batch.workers": int,
+    "pool.size": int,
+    "pool.evict_stale": bool,
+    "template.copy_mode": str,
+    "template.copy_workers": int,
+    "commit.deferred": bool,
+    "commit.window": float,
+    "commit.max_ops": int,
+    "trash.retention_hours": float,
+    "archive.compression": str,
+    "archive.level": int,
+    "archive.workers": int,
 }
 
 
@@ -93,12 +107,12 @@ def config_set(
             parsed = _parse_bool(value)
         else:
             parsed = key_type(value)
+        config = load_config()
+        _set_nested(config, key, parsed)
     except ValueError as e:
         rprint(f"[red]Invalid value:[/red] {e}")
         raise typer.Exit(1)
 
-    config = load_config()
-    _set_nested(config, key, parsed)
     save_config(config)
 
     rprint(f"[green]Set[/green] {key} = {parsed}")
@@ -4,6 +4,7 @@ import typer
 from rich import print as rprint
 
 from novo.cli import app
+from novo.cli.common import resolve_experiment
 
 
 @app.command()
@@ -12,13 +13,12 @@ def delete(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ) -> None:
     """Delete an experiment."""
+    from novo.core.config import current_config
     from novo.core.experiment import delete as delete_experiment
-    from novo.core.experiment import get
 
-    exp = get(name)
-    if exp is None:
-        rprint(f"[red]Experiment not found:[/red] {name}")
-        raise typer.Exit(1)
+    config = current_config()
+    # Never act on a guessed name without a confirmation prompt.
+    exp = resolve_experiment(name, fuzzy=not force, config=config)
 
     if not force:
         confirm = typer.confirm(f"Delete experiment '{exp.name}' ({exp.dir_name})?")
@@ -26,8 +26,9 @@ def delete(
             rprint("[dim]Cancelled.[/dim]")
             raise typer.Exit()
 
-    if delete_experiment(name):
+    if delete_experiment(exp.dir_name, config):
         rprint(f"[green]Deleted:[/green] {exp.name}")
+        rprint(f"[dim]Undo with `novo restore {exp.dir_name}`.[/dim]")
     else:
         rprint(f"[red]Failed to delete:[/red] {name}")
         raise typer.Exit(1)
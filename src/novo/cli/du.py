@@ -0,0 +1,56 @@
+"""novo du command."""
+
+import json
+from typing import Optional
+
+import typer
+from rich import print as rprint
+from rich.table import Table
+
+from novo.cli import app
+from novo.cli.common import resolve_experiment
+from novo.utils.format import format_size
+
+
+@app.command("du")
+def du(
+    names: Optional[list[str]] = typer.Argument(None, help="Experiments to measure (default: all)"),
+    top: Optional[int] = typer.Option(None, "--top", "-n", min=1, help="Show only the N largest"),
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON (sizes in bytes)"),
+    rescan: bool = typer.Option(False, "--rescan", help="Ignore cached directory sizes"),
+) -> None:
+    """Show disk usage per experiment, split into venv, data and source."""
+    from novo.core.config import current_config
+    from novo.core.experiment import disk_usage
+
+    config = current_config()
+    dir_names = None
+    if names:
+        dir_names = [resolve_experiment(name, fuzzy=False, config=config).dir_name for name in names]
+    measured = disk_usage(dir_names, rescan=rescan, config=config)
+    sizes = sorted(measured.items(), key=lambda item: item[1].total, reverse=True)
+    grand_total = sum(size.total for _, size in sizes)
+    shown = sizes[:top] if top else sizes
+
+    if output_json:
+        data = [{"dir_name": dir_name, **size._asdict(), "total": size.total} for dir_name, size in shown]
+        typer.echo(json.dumps(data, indent=2))
+        return
+
+    if not shown:
+        rprint("[dim]No experiments found.[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Directory", style="cyan")
+    for column in ("Venv", "Data", "Source", "Archive"):
+        table.add_column(column, justify="right", style="dim")
+    table.add_column("Total", justify="right", style="bold")
+    for dir_name, size in shown:
+        table.add_row(
+            dir_name,
+            *(format_size(part) if part else "-" for part in size),
+            format_size(size.total),
+        )
+    rprint(table)
+    rprint(f"[dim]{len(sizes)} experiment{'s' if len(sizes) != 1 else ''}, {format_size(grand_total)} total[/dim]")
@@ -0,0 +1,42 @@
+"""novo index subcommands."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print as rprint
+
+from novo.cli import app
+
+index_app = typer.Typer(help="Manage the workspace metadata index.")
+app.add_typer(index_app, name="index")
+
+
+@index_app.command("rebuild")
+def index_rebuild() -> None:
+    """Repopulate the index from every experiment's .novo.toml."""
+    from novo.core.experiment import rebuild_index
+
+    try:
+        count = rebuild_index()
+    except Exception as e:
+        rprint(f"[red]Error rebuilding index:[/red] {e}")
+        raise typer.Exit(1)
+
+    rprint(f"[green]Indexed[/green] {count} experiment{'s' if count != 1 else ''}")
+
+
+@index_app.command("activity")
+def index_activity(
+    workspace: Optional[Path] = typer.Option(None, "--workspace", hidden=True, help="Workspace to act on"),
+) -> None:
+    """Rescan every experiment's last activity (what `--sort modified` orders by)."""
+    from novo.core.config import current_config
+    from novo.core.experiment import refresh_activity
+
+    config = current_config()
+    if workspace is not None:
+        config = config.model_copy(deep=True)
+        config.workspace.path = str(workspace)
+    changed = refresh_activity(config)
+    rprint(f"[green]Updated[/green] {changed} experiment{'s' if changed != 1 else ''}")
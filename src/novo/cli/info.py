@@ -8,6 +8,8 @@ from rich.panel import Panel
 from rich.table import Table
 
 from novo.cli import app
+from novo.cli.common import resolve_experiment
+from novo.utils.format import format_size
 
 
 @app.command()
@@ -22,14 +24,12 @@ def info(
 
 
 def _show_experiment_info(name: str) -> None:
-    from novo.core.experiment import get, get_path
+    from novo.core.config import current_config
+    from novo.core.experiment import archive_file, disk_usage, get, get_path
 
-    exp = get(name)
-    if exp is None:
-        rprint(f"[red]Experiment not found:[/red] {name}")
-        raise typer.Exit(1)
-
-    path = get_path(name)
+    config = current_config()
+    exp = get(resolve_experiment(name, config=config).dir_name, config)
+    path = get_path(exp.dir_name, config)
 
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold")
@@ -43,6 +43,15 @@ def _show_experiment_info(name: str) -> None:
     table.add_row("Description", exp.description or "none")
     table.add_row("Created", exp.created_at.strftime("%Y-%m-%d %H:%M:%S"))
     table.add_row("Path", str(path) if path else "unknown")
+    size = disk_usage([exp.dir_name], config=config)[exp.dir_name]
+    table.add_row(
+        "Size",
+        f"{format_size(size.total)} [dim](venv {format_size(size.venv)}, data {format_size(size.data)}, "
+        f"source {format_size(size.source)})[/dim]",
+    )
+    archived = archive_file(exp.dir_name, config)
+    if archived:
+        table.add_row("Archived", f"{archived} ({format_size(archived.stat().st_size)}; unpacked by `novo open`)")
 
     # Check for .claude and .agents
     if path:
@@ -55,12 +64,12 @@ def _show_experiment_info(name: str) -> None:
 
 
 def _show_workspace_info() -> None:
-    from novo.core.config import get_workspace_path, load_config
+    from novo.core.config import current_config, get_workspace_path
     from novo.core.experiment import list_all
 
-    config = load_config()
+    config = current_config()
     workspace = get_workspace_path(config)
-    experiments = list_all()
+    experiments = list_all(config=config)
 
     table = Table(show_header=False, box=None, padding=(0, 2))
     table.add_column("Key", style="bold")
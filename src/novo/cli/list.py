@@ -1,6 +1,5 @@
 """novo list command."""
 
-import json
 from typing import Optional
 
 import typer
@@ -8,24 +7,51 @@ from rich import print as rprint
 from rich.table import Table
 
 from novo.cli import app
+from novo.cli.common import echo_json, parse_date, parse_fields
 
 
 @app.command("list")
 def list_experiments(
     sort: str = typer.Option("created", "--sort", help="Sort by: name, created, modified"),
-    tag: Optional[str] = typer.Option(None, "--tag", "-t", help="Filter by tag"),
+    tag: Optional[list[str]] = typer.Option(None, "--tag", "-t", help="Filter by tag (repeatable; all must match)"),
+    any_tag: bool = typer.Option(False, "--any", help="Match any --tag instead of all"),
+    seed: Optional[str] = typer.Option(None, "--seed", "-s", help="Filter by seed"),
+    since: Optional[str] = typer.Option(None, "--since", help="Created on or after (YYYY-MM-DD or ISO datetime)"),
+    until: Optional[str] = typer.Option(None, "--until", help="Created on or before (YYYY-MM-DD or ISO datetime)"),
+    python: Optional[str] = typer.Option(None, "--python", "-p", help="Filter by Python version (3.12 matches 3.12.x)"),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Stream one JSON object per line"),
+    fields: Optional[str] = typer.Option(
+        None, "--fields", help="Comma-separated fields for JSON output (e.g. name,dir_name,tags)"
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=1, help="Maximum number of experiments"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Skip this many experiments"),
 ) -> None:
     """List all experiments."""
-    from novo.core.experiment import list_all
+    from novo.core.config import current_config
+    from novo.core.experiment import archived_names, iter_all
 
-    experiments = list_all(sort_by=sort, tag=tag)
+    config = current_config()
+    selected = parse_fields(fields)
+    experiments = iter_all(
+        sort_by=sort,
+        tags=tag or (),
+        any_tag=any_tag,
+        seed=seed,
+        since=parse_date(since, "--since"),
+        until=parse_date(until, "--until", end=True),
+        python=python,
+        limit=limit,
+        offset=offset,
+        config=config,
+    )
 
-    if output_json:
-        data = [exp.model_dump(mode="json") for exp in experiments]
-        typer.echo(json.dumps(data, indent=2, default=str))
+    if output_json or ndjson:
+        echo_json(experiments, selected, ndjson=ndjson)
         return
 
+    experiments = list(experiments)
+
     if not experiments:
         rprint("[dim]No experiments found.[/dim]")
         return
@@ -37,9 +63,11 @@ def list_experiments(
     table.add_column("Tags", style="green")
     table.add_column("Created", style="dim")
 
+    archived = archived_names(config)
     for exp in experiments:
         tags = ", ".join(exp.tags) if exp.tags else ""
         created = exp.created_at.strftime("%Y-%m-%d %H:%M")
-        table.add_row(exp.name, exp.dir_name, exp.seed, tags, created)
+        name = f"{exp.name} [yellow](archived)[/yellow]" if exp.dir_name in archived else exp.name
+        table.add_row(name, exp.dir_name, exp.seed, tags, created)
 
     rprint(table)
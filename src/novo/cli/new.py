@@ -1,25 +1,49 @@
 """novo new <name> command."""
 
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich import print as rprint
+from rich.table import Table
 
 from novo.cli import app
 
+if TYPE_CHECKING:
+    from novo.core.seed import CopyStats
+
 
 @app.command()
 def new(
-    name: str = typer.Argument(help="Name for the new experiment"),
+    name: Optional[str] = typer.Argument(None, help="Name for the new experiment"),
     seed: Optional[str] = typer.Option(None, "--seed", "-s", help="Seed template to use"),
     python: Optional[str] = typer.Option(None, "--python", "-p", help="Python version"),
     description: str = typer.Option("", "--desc", "-d", help="Description"),
     tags: Optional[list[str]] = typer.Option(None, "--tag", "-t", help="Tags"),
     no_date: bool = typer.Option(False, "--no-date", help="Don't add date prefix to directory"),
+    timings: bool = typer.Option(False, "--timings", help="Print how long each creation stage took"),
+    from_file: Optional[Path] = typer.Option(
+        None, "--from-file", "-f", help="Create every [[experiment]] in a TOML spec file", exists=True, dir_okay=False
+    ),
+    workers: Optional[int] = typer.Option(
+        None, "--workers", "-j", min=1, help="Experiments scaffolded concurrently with --from-file"
+    ),
 ) -> None:
     """Create a new experiment."""
-    from novo.core.experiment import create
+    if from_file is not None:
+        if name is not None:
+            rprint("[red]Error:[/red] pass either a name or --from-file, not both")
+            raise typer.Exit(1)
+        _new_batch(from_file, workers)
+        return
+    if name is None:
+        rprint("[red]Error:[/red] missing experiment name (or --from-file)")
+        raise typer.Exit(1)
+
+    from novo.core.config import current_config
+    from novo.core.experiment import create, read_template_stats, read_timings
 
+    config = current_config()
     try:
         exp = create(
             name=name,
@@ -28,6 +52,7 @@ def new(
             description=description,
             tags=tags or [],
             no_date=no_date,
+            config=config,
         )
         rprint(f"[green]Created experiment:[/green] {exp.dir_name}")
     except FileExistsError as e:
@@ -36,3 +61,60 @@ def new(
     except Exception as e:
         rprint(f"[red]Error creating experiment:[/red] {e}")
         raise typer.Exit(1)
+
+    if timings:
+        _print_timings(read_timings(exp.dir_name, config) or {})
+        copied = read_template_stats(exp.dir_name, config)
+        if copied is not None:
+            _print_copy_stats(copied)
+
+
+def _print_copy_stats(copied: "CopyStats") -> None:
+    """Print how much of the template was shared (reflinked/hardlinked) rather than written."""
+    from novo.utils.format import format_size
+
+    line = f"[bold]Template:[/bold] {copied.files} files, {format_size(copied.bytes)}"
+    if copied.shared:
+        line += f" [dim]({format_size(copied.shared)} {copied.mode}ed, not written)[/dim]"
+    rprint(line)
+
+
+def _print_timings(stages: dict[str, float]) -> None:
+    """Print the per-stage breakdown recorded by `create`."""
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Stage")
+    table.add_column("Seconds", justify="right")
+    for stage, seconds in stages.items():
+        style = "bold" if stage == "total" else ""
+        table.add_row(stage, f"{seconds:.3f}", style=style)
+    rprint(table)
+    rprint("[dim]copy_template overlaps uv_init; metadata overlaps dependencies[/dim]")
+
+
+def _new_batch(path: Path, workers: int | None) -> None:
+    """Create every experiment in a spec file, reporting each outcome."""
+    from novo.core.experiment import create_many, load_specs
+
+    try:
+        specs = load_specs(path)
+    except Exception as e:
+        rprint(f"[red]Error reading {path}:[/red] {e}")
+        raise typer.Exit(1)
+
+    try:
+        results = create_many(specs, workers=workers)
+    except Exception as e:
+        rprint(f"[red]Error creating experiments:[/red] {e}")
+        raise typer.Exit(1)
+
+    failed = 0
+    for spec, outcome in results:
+        if isinstance(outcome, Exception):
+            failed += 1
+            rprint(f"[red]Failed:[/red] {spec.name}: {outcome}")
+        else:
+            rprint(f"[green]Created experiment:[/green] {outcome.dir_name}")
+
+    rprint(f"{len(results) - failed} created, {failed} failed")
+    if failed:
+        raise typer.Exit(1)
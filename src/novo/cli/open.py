@@ -1,9 +1,15 @@
 """novo open <name> command (+ hidden _open-path)."""
 
+from typing import TYPE_CHECKING
+
 import typer
 from rich import print as rprint
 
 from novo.cli import app
+from novo.cli.common import resolve_experiment
+
+if TYPE_CHECKING:
+    from novo.models.config import NovoConfig
 
 
 @app.command()
@@ -15,23 +21,44 @@ def open(
         "[yellow]Note:[/yellow] `novo open` requires shell integration.\n"
         'Add this to your shell rc: [cyan]eval "$(novo --shell-init)"[/cyan]'
     )
+    from novo.core.config import current_config
     from novo.core.experiment import get_path
 
-    path = get_path(name)
-    if path is None:
-        rprint(f"[red]Experiment not found:[/red] {name}")
-        raise typer.Exit(1)
-    rprint(f"[dim]Path:[/dim] {path}")
+    config = current_config()
+    exp = resolve_experiment(name, config=config)
+    _unarchive(exp.dir_name, config)
+    rprint(f"[dim]Path:[/dim] {get_path(exp.dir_name, config)}")
 
 
-@app.command(hidden=True)
+@app.command("_open-path", hidden=True)
 def _open_path(
     name: str = typer.Argument(help="Name of the experiment"),
 ) -> None:
     """Print the path to an experiment (used by shell function)."""
+    from novo.core.config import current_config
     from novo.core.experiment import get_path
 
-    path = get_path(name)
-    if path is None:
+    config = current_config()
+    exp = resolve_experiment(name, quiet=True, config=config)
+    _unarchive(exp.dir_name, config, quiet=True)
+    typer.echo(str(get_path(exp.dir_name, config)))
+
+
+def _unarchive(dir_name: str, config: "NovoConfig", quiet: bool = False) -> None:
+    """Unpack an archived experiment (and recreate its .venv) before it is opened."""
+    from novo.core.experiment import archived_names, unarchive
+
+    if dir_name not in archived_names(config):
+        return
+    if not quiet:
+        rprint(f"[dim]Unpacking archived experiment {dir_name}...[/dim]")
+    try:
+        unarchive(dir_name, config=config)
+    except RuntimeError as e:
+        if not quiet:
+            rprint(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    typer.echo(str(path))
+    except Exception as e:
+        # The files are back; only re-syncing the environment failed
+        if not quiet:
+            rprint(f"[yellow]Warning:[/yellow] {e}")
@@ -0,0 +1,79 @@
+"""novo pool subcommands."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print as rprint
+from rich.table import Table
+
+from novo.cli import app
+
+pool_app = typer.Typer(help="Manage the pool of pre-warmed experiment skeletons.")
+app.add_typer(pool_app, name="pool")
+
+
+@pool_app.command("fill")
+def pool_fill(
+    seed: Optional[str] = typer.Option(None, "--seed", "-s", help="Seed template (default: defaults.seed)"),
+    python: Optional[str] = typer.Option(None, "--python", "-p", help="Python version (default: defaults.python)"),
+    size: Optional[int] = typer.Option(None, "--size", "-n", min=1, help="Skeletons to keep ready (default: pool.size)"),
+    workspace: Optional[Path] = typer.Option(None, "--workspace", hidden=True, help="Workspace to act on"),
+    evict_stale: Optional[bool] = typer.Option(
+        None, "--evict-stale/--keep-stale", hidden=True, help="Override pool.evict_stale"
+    ),
+) -> None:
+    """Build skeletons until the (seed, python) pool is full."""
+    from novo.core.config import current_config
+    from novo.core.pool import fill
+    from novo.core.workspace import ensure_initialized
+
+    config = current_config()
+    target = size or config.pool.size
+    if not target:
+        rprint("[yellow]Pool disabled[/yellow] [dim](pool.size = 0; pass --size or `novo config set pool.size N`)[/dim]")
+        return
+
+    try:
+        built = fill(
+            workspace or ensure_initialized(config),
+            seed or config.defaults.seed,
+            python or config.defaults.python or None,
+            target,
+            evict_stale=config.pool.evict_stale if evict_stale is None else evict_stale,
+        )
+    except Exception as e:
+        rprint(f"[red]Error filling pool:[/red] {e}")
+        raise typer.Exit(1)
+
+    rprint(f"[green]Built[/green] {built} skeleton{'s' if built != 1 else ''}")
+
+
+@pool_app.command("status")
+def pool_status() -> None:
+    """Show how many skeletons are ready per (seed, python)."""
+    from novo.core.pool import status
+    from novo.core.workspace import ensure_initialized
+
+    pools = status(ensure_initialized())
+    if not pools:
+        rprint("[dim]Pool is empty.[/dim]")
+        return
+
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Seed", style="cyan")
+    table.add_column("Python")
+    table.add_column("Ready", justify="right", style="green")
+    for seed_name, python, ready in pools:
+        table.add_row(seed_name, python, str(ready))
+    rprint(table)
+
+
+@pool_app.command("clear")
+def pool_clear() -> None:
+    """Discard every pooled skeleton."""
+    from novo.core.pool import clear
+    from novo.core.workspace import ensure_initialized
+
+    removed = clear(ensure_initialized())
+    rprint(f"[green]Removed[/green] {removed} skeleton{'s' if removed != 1 else ''}")
@@ -0,0 +1,26 @@
+"""novo restore <name> command."""
+
+import typer
+from rich import print as rprint
+
+from novo.cli import app
+
+
+@app.command()
+def restore(
+    name: str = typer.Argument(help="Name or directory of a deleted experiment"),
+) -> None:
+    """Bring back a deleted experiment from the trash."""
+    from novo.core.experiment import restore as restore_experiment
+
+    try:
+        exp = restore_experiment(name)
+    except FileExistsError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    if exp is None:
+        rprint(f"[red]Not in trash:[/red] {name}")
+        rprint("[dim]See `novo trash list`.[/dim]")
+        raise typer.Exit(1)
+    rprint(f"[green]Restored:[/green] {exp.name} ({exp.dir_name})")
@@ -1,27 +1,37 @@
 """novo search <query> command."""
 
-import json
+from typing import Optional
 
 import typer
 from rich import print as rprint
 from rich.table import Table
 
 from novo.cli import app
+from novo.cli.common import echo_json, parse_fields
 
 
 @app.command()
 def search(
     query: str = typer.Argument(help="Search query"),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Maximum number of results"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Skip this many results"),
     output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Print one JSON object per line"),
+    fields: Optional[str] = typer.Option(
+        None, "--fields", help="Comma-separated fields for JSON output (e.g. name,dir_name,tags)"
+    ),
 ) -> None:
-    """Search experiments by name, description, or tags."""
+    """Search experiments by name, description, or tags (best match first)."""
+    from novo.core.config import current_config
+    from novo.core.experiment import archived_names
     from novo.core.experiment import search as search_experiments
 
-    results = search_experiments(query)
+    config = current_config()
+    selected = parse_fields(fields)
+    results = search_experiments(query, limit=limit, offset=offset, config=config)
 
-    if output_json:
-        data = [exp.model_dump(mode="json") for exp in results]
-        typer.echo(json.dumps(data, indent=2, default=str))
+    if output_json or ndjson:
+        echo_json(results, selected, ndjson=ndjson)
         return
 
     if not results:
@@ -34,8 +44,10 @@ def search(
     table.add_column("Tags", style="green")
     table.add_column("Description", style="dim")
 
+    archived = archived_names(config)
     for exp in results:
         tags = ", ".join(exp.tags) if exp.tags else ""
-        table.add_row(exp.name, exp.dir_name, tags, exp.description[:50])
+        name = f"{exp.name} [yellow](archived)[/yellow]" if exp.dir_name in archived else exp.name
+        table.add_row(name, exp.dir_name, tags, exp.description[:50])
 
     rprint(table)
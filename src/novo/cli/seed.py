@@ -15,7 +15,8 @@ app.add_typer(seed_app, name="seed")
 @seed_app.command("list")
 def seed_list() -> None:
     """List available seeds."""
-    from novo.core.seed import list_seeds
+    from novo.utils.format import format_size
+    from novo.core.seed import list_seeds, template_usage
 
     seeds = list_seeds()
 
@@ -23,18 +24,26 @@ def seed_list() -> None:
         rprint("[dim]No seeds found.[/dim]")
         return
 
+    usage, total = template_usage(seeds)
+
     table = Table(show_header=True, header_style="bold")
     table.add_column("Name", style="cyan")
     table.add_column("Description")
     table.add_column("Type", style="dim")
     table.add_column("Packages", style="green")
+    table.add_column("Size", justify="right")
+    table.add_column("On disk", justify="right", style="dim")
 
     for seed in seeds:
         seed_type = "built-in" if seed.builtin else "user"
         packages = ", ".join(seed.dependencies.packages) if seed.dependencies.packages else ""
-        table.add_row(seed.name, seed.description, seed_type, packages)
+        size = usage[seed.name]
+        table.add_row(
+            seed.name, seed.description, seed_type, packages, format_size(size.logical), format_size(size.physical)
+        )
 
     rprint(table)
+    rprint(f"[dim]Templates:[/dim] {format_size(total.logical)} [dim]logical,[/dim] {format_size(total.physical)} [dim]on disk[/dim]")
 
 
 @seed_app.command("init")
@@ -123,3 +132,73 @@ def seed_remove(
     else:
         rprint(f"[red]Failed to remove seed:[/red] {name}")
         raise typer.Exit(1)
+
+
+@seed_app.command("pack")
+def seed_pack(
+    name: str = typer.Argument(help="Seed whose template/ to move into the shared blob store"),
+) -> None:
+    """Store a seed's template files once, shared with every other seed."""
+    from novo.utils.format import format_size
+    from novo.core.seed import pack_seed
+
+    try:
+        added = pack_seed(name)
+    except ValueError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    rprint(f"[green]Packed seed:[/green] {name} [dim]({format_size(added)} newly stored)[/dim]")
+
+
+@seed_app.command("unpack")
+def seed_unpack(
+    name: str = typer.Argument(help="Packed seed to restore template/ for"),
+) -> None:
+    """Restore a packed seed's template/ directory for editing."""
+    from novo.core.seed import unpack_seed
+
+    try:
+        unpack_seed(name)
+    except ValueError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    rprint(f"[green]Unpacked seed:[/green] {name}")
+
+
+@seed_app.command("refresh")
+def seed_refresh(
+    name: Optional[str] = typer.Argument(None, help="Seed whose cached lockfiles to drop (default: all seeds)"),
+) -> None:
+    """Drop cached dependency lockfiles so the next create re-resolves."""
+    from novo.core.seed import get_seed, refresh_locks
+
+    if name is not None and get_seed(name) is None:
+        rprint(f"[red]Seed not found:[/red] {name}")
+        raise typer.Exit(1)
+
+    removed = refresh_locks(name)
+    rprint(f"[green]Dropped[/green] {removed} cached lockfile{'s' if removed != 1 else ''}")
+
+
+@seed_app.command("bake")
+def seed_bake(
+    name: str = typer.Argument(help="Seed to bake"),
+    python: Optional[str] = typer.Option(None, "--python", "-p", help="Python version (default: defaults.python)"),
+) -> None:
+    """Pre-build a seed so `novo new` copies it instead of re-running its stages."""
+    from novo.core.config import current_config
+    from novo.core.seed import bake_seed
+
+    config = current_config()
+    try:
+        path = bake_seed(name, python or config.defaults.python or None)
+    except ValueError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except Exception as e:
+        rprint(f"[red]Error baking seed:[/red] {e}")
+        raise typer.Exit(1)
+
+    rprint(f"[green]Baked seed:[/green] {name} [dim]({path})[/dim]")
@@ -0,0 +1,59 @@
+"""novo trash subcommands."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich import print as rprint
+from rich.table import Table
+
+from novo.cli import app
+
+trash_app = typer.Typer(help="Manage deleted experiments awaiting reclamation.")
+app.add_typer(trash_app, name="trash")
+
+
+@trash_app.command("list")
+def trash_list() -> None:
+    """Show deleted experiments that `novo restore` can still bring back."""
+    from novo.core.config import current_config
+    from novo.core.trash import entries
+    from novo.core.workspace import ensure_initialized
+
+    trashed = entries(ensure_initialized())
+    if not trashed:
+        rprint("[dim]Trash is empty.[/dim]")
+        return
+
+    retention = current_config().trash.retention_hours * 3600
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Directory", style="cyan")
+    table.add_column("Deleted")
+    table.add_column("Reclaimable from", style="dim")
+    for entry in trashed:
+        table.add_row(
+            entry.dir_name,
+            datetime.fromtimestamp(entry.deleted_at).strftime("%Y-%m-%d %H:%M"),
+            datetime.fromtimestamp(entry.deleted_at + retention).strftime("%Y-%m-%d %H:%M"),
+        )
+    rprint(table)
+
+
+@trash_app.command("purge")
+def trash_purge(
+    everything: bool = typer.Option(False, "--all", help="Also reclaim entries still within trash.retention_hours"),
+    workspace: Optional[Path] = typer.Option(None, "--workspace", hidden=True, help="Workspace to act on"),
+    retention: Optional[float] = typer.Option(None, "--retention", hidden=True, help="Retention in seconds"),
+) -> None:
+    """Permanently delete trashed experiments past the retention window."""
+    from novo.core.config import current_config
+    from novo.core.trash import purge
+    from novo.core.workspace import ensure_initialized
+
+    if everything:
+        retention = 0
+    elif retention is None:
+        retention = current_config().trash.retention_hours * 3600
+    removed = purge(workspace or ensure_initialized(), retention)
+    rprint(f"[green]Reclaimed[/green] {removed} experiment{'s' if removed != 1 else ''}")
@@ -0,0 +1,115 @@
+"""Last-activity timestamps for experiments.
+
+An experiment's activity is the newest mtime across its files and
+directories, skipping virtualenvs and tool caches. Scans are incremental:
+each directory is remembered as ``(mtime_ns, newest, files)``, where
+*files* are the names of the files directly in it and *newest* the latest
+mtime among the directory itself and those files. A directory whose own
+mtime is unchanged still has the same entries, so its known files are
+``stat``-ed (which catches files rewritten in place) and its known
+subdirectories visited, but it isn't listed again. Only directories that
+gained, lost or renamed an entry are re-read with ``scandir``.
+
+A scan therefore costs one ``stat`` per file and directory, which is why
+``--sort modified`` never runs one itself: it reads the timestamps stored
+in the index, and a detached ``novo index activity`` (``refresh_async``)
+brings them up to date in the background.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Directory names never descended into.
+EXCLUDED_DIRS = frozenset(
+    {
+        ".git",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".ipynb_checkpoints",
+        ".tox",
+        ".nox",
+        "node_modules",
+    }
+)
+
+# Relative directory path ("" for the experiment root) -> (mtime_ns, newest, file names)
+DirCache = dict[str, tuple[int, float, tuple[str, ...]]]
+
+
+def _parent(rel: str) -> str:
+    return rel.rpartition("/")[0]
+
+
+def scan(root: str | os.PathLike, cache: DirCache | None = None) -> DirCache:
+    """Walk *root*, reusing *cache* for directories whose mtime is unchanged.
+
+    Returns the new cache; ``latest(result)`` is the experiment's activity.
+    """
+    cache = cache or {}
+    children: dict[str, list[str]] = {}
+    for rel in cache:
+        if rel:
+            children.setdefault(_parent(rel), []).append(rel)
+
+    result: DirCache = {}
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        path = os.path.join(root, rel) if rel else os.fspath(root)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+
+        newest = mtime_ns / 1e9
+        cached = cache.get(rel)
+        if cached is not None and cached[0] == mtime_ns:
+            # Same entries as last time: only their mtimes can have moved
+            for name in cached[2]:
+                try:
+                    newest = max(newest, os.stat(os.path.join(path, name), follow_symlinks=False).st_mtime)
+                except OSError:
+                    continue
+            result[rel] = (mtime_ns, newest, cached[2])
+            stack.extend(children.get(rel, ()))
+            continue
+
+        files = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDED_DIRS:
+                                stack.append(f"{rel}/{entry.name}" if rel else entry.name)
+                        else:
+                            newest = max(newest, entry.stat(follow_symlinks=False).st_mtime)
+                            files.append(entry.name)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        result[rel] = (mtime_ns, newest, tuple(sorted(files)))
+    return result
+
+
+def latest(dirs: DirCache) -> float | None:
+    """The newest mtime recorded in a scan, or ``None`` for an empty scan."""
+    return max((newest for _, newest, _ in dirs.values()), default=None)
+
+
+def refresh_async(workspace: Path) -> None:
+    """Rescan every experiment's activity in a detached `novo index activity` process."""
+    subprocess.Popen(
+        [sys.executable, "-m", "novo", "index", "activity", "--workspace", str(workspace)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
@@ -0,0 +1,166 @@
+"""Compressed cold storage for inactive experiments.
+
+Archiving streams an experiment directory into
+``.novo/archive/<dir_name>.tar.zst`` and empties it down to its
+``.novo.toml``, which stays behind so the experiment keeps its place in the
+index, listings and search. ``.venv`` is left out: uv recreates it on
+unarchive. The tar is written straight into the compressor, never staged
+uncompressed.
+
+Zstandard comes from the optional ``zstandard`` package (``novo[archive]``)
+and compresses on several threads. Without it, archives fall back to the
+standard library's ``.tar.xz``. Either is unpacked transparently.
+"""
+
+import lzma
+import os
+import shutil
+import tarfile
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from novo.core.workspace import state_dir
+
+try:
+    import zstandard
+except ImportError:  # optional: novo[archive]
+    zstandard = None
+
+ARCHIVE_DIR = "archive"
+SUFFIXES = (".tar.zst", ".tar.xz")
+STASH_NAME = ".novo-archive"  # an archive travelling with its experiment through the trash
+_KEEP = ".novo.toml"
+_SKIP = {".venv", _KEEP}
+
+
+class ArchiveStats(NamedTuple):
+    """What archiving one experiment did."""
+
+    path: Path
+    files: int
+    size: int  # bytes archived (uncompressed)
+    compressed: int
+
+
+def archive_dir(workspace: Path) -> Path:
+    """Return the workspace's archive directory, creating it if needed."""
+    path = state_dir(workspace) / ARCHIVE_DIR
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def archive_path(workspace: Path, dir_name: str) -> Path | None:
+    """Return the archive of an experiment, or None if it isn't archived."""
+    root = state_dir(workspace) / ARCHIVE_DIR
+    for suffix in SUFFIXES:
+        path = root / f"{dir_name}{suffix}"
+        if path.exists():
+            return path
+    return None
+
+
+def archived(workspace: Path) -> set[str]:
+    """Return the dir_names of every archived experiment (one ``scandir``)."""
+    root = state_dir(workspace) / ARCHIVE_DIR
+    if not root.exists():
+        return set()
+    names = set()
+    with os.scandir(root) as it:
+        for entry in it:
+            for suffix in SUFFIXES:
+                if entry.name.endswith(suffix):
+                    names.add(entry.name[: -len(suffix)])
+    return names
+
+
+def pack(
+    workspace: Path, exp_dir: Path, compression: str = "zst", level: int = 6, workers: int = 0
+) -> ArchiveStats:
+    """Archive *exp_dir* and remove everything in it but ``.novo.toml``.
+
+    *compression* is ``"zst"`` (falling back to ``"xz"`` without the
+    ``zstandard`` package) or ``"xz"``; *level* is the zstd level (1-19;
+    capped to 9 as an xz preset). *workers* compression threads, 0 for one
+    per core (zstd only). The archive is published by rename once complete,
+    and only then is the directory emptied.
+    """
+    if compression == "zst" and zstandard is None:
+        compression = "xz"
+    target = archive_dir(workspace) / f"{exp_dir.name}.tar.{compression}"
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+
+    members = sorted(name for name in os.listdir(exp_dir) if name not in _SKIP)
+    try:
+        with open(tmp, "wb") as raw:
+            stream = _compressor(raw, compression, level, workers)
+            with stream, tarfile.open(fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT) as tar:
+                for name in members:
+                    tar.add(exp_dir / name, arcname=name)
+            files, size = _count(tar)
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+    for name in os.listdir(exp_dir):
+        if name == _KEEP:
+            continue
+        path = exp_dir / name
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+    return ArchiveStats(target, files, size, target.stat().st_size)
+
+
+def unpack(workspace: Path, exp_dir: Path) -> bool:
+    """Extract an archived experiment back into *exp_dir* and drop the archive.
+
+    Returns False if the experiment isn't archived.
+    """
+    path = archive_path(workspace, exp_dir.name)
+    if path is None:
+        return False
+    with open(path, "rb") as raw:
+        stream = _decompressor(raw, path)
+        with stream, tarfile.open(fileobj=stream, mode="r|") as tar:
+            # Our own archive: keep symlinks that point outside (e.g. to a dataset mount)
+            tar.extractall(exp_dir, **({"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}))
+    path.unlink()
+    return True
+
+
+def stash(workspace: Path, dir_name: str, into: Path) -> None:
+    """Move an experiment's archive, if any, into *into* (its trash entry)."""
+    path = archive_path(workspace, dir_name)
+    if path is not None:
+        os.rename(path, into / f"{STASH_NAME}{path.name[len(dir_name):]}")
+
+
+def unstash(workspace: Path, exp_dir: Path) -> None:
+    """Move an archive brought back from the trash inside *exp_dir* to the archive directory."""
+    for suffix in SUFFIXES:
+        stashed = exp_dir / f"{STASH_NAME}{suffix}"
+        if stashed.exists():
+            os.rename(stashed, archive_dir(workspace) / f"{exp_dir.name}{suffix}")
+
+
+def _compressor(raw: BinaryIO, compression: str, level: int, workers: int) -> BinaryIO:
+    if compression == "zst":
+        cctx = zstandard.ZstdCompressor(level=level, threads=workers or -1)
+        return cctx.stream_writer(raw, closefd=False)
+    return lzma.LZMAFile(raw, "w", preset=min(level, 9))
+
+
+def _decompressor(raw: BinaryIO, path: Path) -> BinaryIO:
+    if path.name.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError(f"{path.name} needs the zstandard package: pip install 'novo[archive]'")
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+    return lzma.LZMAFile(raw, "r")
+
+
+def _count(tar: tarfile.TarFile) -> tuple[int, int]:
+    """(regular files, their total size) written to a closed stream-mode tar."""
+    files = [member for member in tar.members if member.isfile()]
+    return len(files), sum(member.size for member in files)
@@ -0,0 +1,74 @@
+"""Content-addressed store for seed template files.
+
+A packed seed keeps a manifest of ``(path, sha256, size, mode)`` entries
+instead of a ``template/`` directory, and the file contents live here,
+keyed by their SHA-256::
+
+    ~/.local/share/novo/blobs/<sha256[:2]>/<sha256>
+
+A file carried by several seeds is stored once. Blobs are read-only, so an
+experiment that hardlinks one (``template.copy_mode = "hardlink"``) can't
+edit it in place.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from novo.utils.paths import blobs_dir
+
+_CHUNK = 1 << 20
+
+
+def blob_path(digest: str) -> Path:
+    """Return where the blob with SHA-256 *digest* is stored."""
+    return blobs_dir() / digest[:2] / digest
+
+
+def digest_file(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def put(path: Path) -> tuple[str, bool]:
+    """Store *path*'s contents. Returns ``(sha256, whether it was new)``.
+
+    The file is hashed first and only copied if the store lacks it, so
+    duplicates cost a read but no write.
+    """
+    digest = digest_file(path)
+    target = blob_path(digest)
+    if target.exists():
+        return digest, False
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp-", dir=target.parent)
+    os.close(fd)
+    try:
+        shutil.copyfile(path, tmp)
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return digest, True
+
+
+def gc(referenced: set[str]) -> int:
+    """Delete every blob not in *referenced*. Returns the bytes freed."""
+    root = blobs_dir()
+    if not root.exists():
+        return 0
+    freed = 0
+    for bucket in root.iterdir():
+        for blob in bucket.iterdir():
+            if blob.name not in referenced and not blob.name.startswith(".tmp-"):
+                freed += blob.stat().st_size
+                blob.unlink()
+    return freed
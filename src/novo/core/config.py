@@ -1,4 +1,12 @@
-"""Config load/save."""
+"""Config load/save.
+
+``load_config()`` parses ``config.toml`` into a fresh ``NovoConfig`` every
+call, for code that edits and saves it. Everything else reads
+``current_config()``: one parse per process, reused for as long as the
+file's stat signature is unchanged, so a long-lived process (the TUI) picks
+up edits for the cost of a ``stat``. Core functions also take the config
+explicitly, so a command loads it once and passes it down.
+"""
 
 import sys
 from pathlib import Path
@@ -13,6 +21,9 @@ import tomli_w
 from novo.models.config import NovoConfig
 from novo.utils.paths import config_file
 
+# Per-process config context: (path, (mtime_ns, size) or None if missing, parsed config)
+_current: tuple[Path, tuple[int, int] | None, NovoConfig] | None = None
+
 
 def load_config() -> NovoConfig:
     """Load config from config.toml, creating defaults if missing."""
@@ -26,20 +37,42 @@ def load_config() -> NovoConfig:
     return NovoConfig(**data)
 
 
+def current_config() -> NovoConfig:
+    """Return this process's config, re-parsing config.toml only when it changed.
+
+    The result is shared by every caller: treat it as read-only, and use
+    ``load_config()`` for a copy to modify and save.
+    """
+    global _current
+    path = config_file()
+    try:
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        signature = None
+    if _current is not None and _current[0] == path and _current[1] == signature:
+        return _current[2]
+    config = load_config()
+    _current = (path, signature, config)
+    return config
+
+
 def save_config(config: NovoConfig) -> None:
     """Save config to config.toml."""
+    global _current
     path = config_file()
     path.parent.mkdir(parents=True, exist_ok=True)
 
     data = config.model_dump()
     with open(path, "wb") as f:
         tomli_w.dump(data, f)
+    _current = None  # don't trust the stat signature of a file rewritten within the same tick
 
 
 def get_workspace_path(config: NovoConfig | None = None) -> Path:
     """Resolve the workspace path from config or default."""
     if config is None:
-        config = load_config()
+        config = current_config()
 
     if config.workspace.path:
         return Path(config.workspace.path)
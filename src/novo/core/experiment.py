@@ -1,9 +1,15 @@
 """Experiment CRUD operations."""
 
+import os
 import shutil
 import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any, TypeVar
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -12,13 +18,23 @@ else:
 
 import tomli_w
 
-from novo.core import git
-from novo.core.config import load_config
-from novo.core.workspace import ensure_initialized
-from novo.models.experiment import Experiment
+from novo.core import activity, git, index, journal, trash, usage
+from novo.core import archive as archives
+from novo.core.config import current_config
+from novo.core.archive import ArchiveStats
+from novo.core.seed import CopyStats
+from novo.core.workspace import ensure_initialized, state_dir
+from novo.models.config import NovoConfig
+from novo.models.experiment import Experiment, ExperimentRecord, ExperimentSpec, validate_experiments
 from novo.utils import uv
 
 
+T = TypeVar("T")
+
+# Sidecar recording how long each creation stage took (see _scaffold).
+TIMINGS_FILE = ".novo-timings.toml"
+
+
 def _make_dir_name(name: str, use_date_prefix: bool) -> str:
     """Create directory name, optionally with date prefix."""
     if use_date_prefix:
@@ -42,22 +58,26 @@ def _write_novo_toml(path: Path, experiment: Experiment) -> None:
         tomli_w.dump(data, f)
 
 
-def _read_novo_toml(path: Path) -> Experiment | None:
-    """Read .novo.toml and return an Experiment, or None if invalid."""
-    toml_path = path / ".novo.toml"
-    if not toml_path.exists():
+def _parse_novo_toml(path: Path) -> dict | None:
+    """Read .novo.toml into raw, not yet validated Experiment fields."""
+    try:
+        with open(path / ".novo.toml", "rb") as f:
+            data = tomllib.load(f)
+    except (FileNotFoundError, NotADirectoryError):
         return None
 
-    with open(toml_path, "rb") as f:
-        data = tomllib.load(f)
-
     exp_data = data.get("experiment", {})
-    if "created_at" in exp_data:
-        exp_data["created_at"] = datetime.fromisoformat(exp_data["created_at"])
     exp_data["dir_name"] = path.name
     if "name" not in exp_data:
         exp_data["name"] = path.name
+    return exp_data
+
 
+def _read_novo_toml(path: Path) -> Experiment | None:
+    """Read .novo.toml and return an Experiment, or None if invalid."""
+    exp_data = _parse_novo_toml(path)
+    if exp_data is None:
+        return None
     return Experiment(**exp_data)
 
 
@@ -68,139 +88,765 @@ def create(
     description: str = "",
     tags: list[str] | None = None,
     no_date: bool = False,
+    config: NovoConfig | None = None,
 ) -> Experiment:
     """Create a new experiment."""
-    config = load_config()
-    workspace = ensure_initialized()
+    config, workspace = _context(config)
+
+    spec = ExperimentSpec(
+        name=name,
+        seed=seed_name,
+        python=python,
+        description=description,
+        tags=tags or [],
+        no_date=no_date,
+    )
+    experiment = _scaffold(config, workspace, spec)
+
+    with index.open_index(workspace) as conn:
+        index.upsert(conn, experiment, *_stat_entry(workspace / experiment.dir_name))
+        index.write_path_map(conn, workspace)
+
+    # Git commit
+    if config.defaults.auto_commit:
+        _commit(config, workspace, f"novo: create {name} (seed: {experiment.seed})", [experiment.dir_name])
+
+    _refill_pools(config, workspace, [experiment])
+    return experiment
+
+
+def create_many(
+    specs: list[ExperimentSpec], workers: int | None = None, config: NovoConfig | None = None
+) -> list[tuple[ExperimentSpec, Experiment | Exception]]:
+    """Create many experiments concurrently, with a single index update and commit.
+
+    Specs are scaffolded (``uv init``, seed, ``.novo.toml``) on a pool of
+    *workers* threads (default ``batch.workers``). A failing spec doesn't
+    stop the batch: its partial directory is removed and the exception is
+    returned in its slot. Returns ``(spec, Experiment or exception)`` pairs
+    in input order.
+    """
+    config, workspace = _context(config)
+
+    def scaffold(spec: ExperimentSpec) -> Experiment | Exception:
+        try:
+            return _scaffold(config, workspace, spec)
+        except Exception as e:
+            return e
+
+    workers = workers or config.batch.workers
+    if workers > 1 and len(specs) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(scaffold, specs))
+    else:
+        outcomes = [scaffold(spec) for spec in specs]
+
+    created = [exp for exp in outcomes if isinstance(exp, Experiment)]
+    if created:
+        with index.open_index(workspace) as conn:
+            for experiment in created:
+                index.upsert(conn, experiment, *_stat_entry(workspace / experiment.dir_name))
+            index.write_path_map(conn, workspace)
+
+        if config.defaults.auto_commit:
+            summary = "\n".join(f"- {exp.dir_name} (seed: {exp.seed})" for exp in created)
+            _commit(
+                config,
+                workspace,
+                f"novo: create {len(created)} experiments\n\n{summary}",
+                [exp.dir_name for exp in created],
+            )
+        _refill_pools(config, workspace, created)
+
+    return list(zip(specs, outcomes))
+
+
+def _context(config: NovoConfig | None) -> tuple[NovoConfig, Path]:
+    """The config a core call runs with (the process's by default) and its initialized workspace."""
+    if config is None:
+        config = current_config()
+    return config, ensure_initialized(config)
 
-    # Resolve settings
-    seed = seed_name or config.defaults.seed
-    python_version = python or config.defaults.python or None
-    use_date = (not no_date) and config.naming.date_prefix
-    dir_name = _make_dir_name(name, use_date)
-    exp_dir = workspace / dir_name
 
-    if exp_dir.exists():
-        raise FileExistsError(f"Experiment directory already exists: {dir_name}")
+def _commit(config: NovoConfig, workspace: Path, message: str, paths: list[str]) -> None:
+    """Commit changes under top-level *paths*, or journal them when ``commit.deferred``."""
+    if config.commit.deferred:
+        journal.record(workspace, message, paths, config.commit.window, config.commit.max_ops)
+        return
+    with journal.commit_lock(workspace):
+        git.add_and_commit(workspace, message, paths=paths)
 
-    exp_dir.mkdir(parents=True)
 
-    # Run uv init
-    uv.uv_init(exp_dir, python=python_version)
+def _refill_pools(config: NovoConfig, workspace: Path, experiments: list[Experiment]) -> None:
+    """Top up the skeleton pool of each (seed, python) pair just used, in the background."""
+    if config.pool.size == 0:
+        return
+    from novo.core import pool
 
-    # Apply seed template
-    from novo.core.seed import apply_seed
+    for seed_name, python in dict.fromkeys((exp.seed, exp.python or None) for exp in experiments):
+        pool.refill_async(workspace, seed_name, python, config.pool.size, config.pool.evict_stale)
 
-    apply_seed(seed, exp_dir)
 
-    # Build experiment model
+def load_specs(path: Path) -> list[ExperimentSpec]:
+    """Read experiment specs from a TOML file.
+
+    The file holds an ``[[experiment]]`` array of tables; an optional
+    ``[defaults]`` table supplies values for fields an entry leaves out::
+
+        [defaults]
+        seed = "torch"
+        tags = ["sweep"]
+
+        [[experiment]]
+        name = "lr-1e-3"
+
+        [[experiment]]
+        name = "lr-1e-4"
+        tags = ["sweep", "baseline"]
+    """
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+
+    defaults = data.get("defaults", {})
+    entries = data.get("experiment", [])
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"No [[experiment]] entries in {path}")
+    return [ExperimentSpec(**{**defaults, **entry}) for entry in entries]
+
+
+def _scaffold(config: NovoConfig, workspace: Path, spec: ExperimentSpec) -> Experiment:
+    """Create one experiment directory: ``uv init``, seed, ``.novo.toml``.
+
+    With ``pool.size`` set, a pre-warmed skeleton for the (seed, python)
+    pair is claimed instead when one is ready (see ``core.pool``).
+    Otherwise, an up-to-date bake of the seed (``novo seed bake``) is
+    copied in place of running the creation stages. Neither carries a
+    ``.venv``, so it is then recreated from their uv.lock. Each
+    stage's wall time is saved to ``TIMINGS_FILE``. Leaves indexing,
+    committing and pool refills to the caller. On failure the partially
+    created directory is removed.
+    """
+    from novo.core import pool
+    from novo.core.seed import get_seed, materialize_bake, sync_environment
+
+    # Resolve settings
+    seed_name = spec.seed or config.defaults.seed
+    python_version = spec.python or config.defaults.python or None
+    use_date = (not spec.no_date) and config.naming.date_prefix
+    dir_name = _make_dir_name(spec.name, use_date)
+    exp_dir = workspace / dir_name
+
+    try:
+        exp_dir.mkdir(parents=True)
+    except FileExistsError:
+        raise FileExistsError(f"Experiment directory already exists: {dir_name}") from None
+
     experiment = Experiment(
-        name=name,
-        seed=seed,
-        tags=tags or [],
-        description=description,
+        name=spec.name,
+        seed=seed_name,
+        tags=spec.tags,
+        description=spec.description,
         python=python_version or "",
         dir_name=dir_name,
     )
+    timings: dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        prebuilt = False
+        if config.pool.size:
+            prebuilt = _timed(
+                timings,
+                "pool_claim",
+                pool.claim,
+                workspace,
+                seed_name,
+                python_version,
+                exp_dir,
+                evict_stale=config.pool.evict_stale,
+            )
+        if not prebuilt:
+            seed = get_seed(seed_name)
+            if seed is not None:
+                bake_start = time.perf_counter()
+                prebuilt = materialize_bake(seed, python_version, exp_dir)
+                if prebuilt:
+                    timings["bake"] = time.perf_counter() - bake_start
+        copied = None
+        if prebuilt:
+            _timed(timings, "sync", sync_environment, exp_dir)
+            _timed(timings, "metadata", _write_novo_toml, exp_dir, experiment)
+        else:
+            copied = _run_stages(config, timings, workspace, exp_dir, experiment)
+        timings["total"] = time.perf_counter() - start
+        _write_timings(exp_dir, timings, copied)
+    except BaseException:
+        shutil.rmtree(exp_dir, ignore_errors=True)
+        raise
 
-    # Write .novo.toml
-    _write_novo_toml(exp_dir, experiment)
+    return experiment
 
-    # Git commit
-    if config.defaults.auto_commit:
-        git.add_and_commit(workspace, f"novo: create {name} (seed: {seed})")
 
-    return experiment
+def _run_stages(
+    config: NovoConfig, timings: dict[str, float], workspace: Path, exp_dir: Path, experiment: Experiment
+) -> CopyStats | None:
+    """Scaffold *exp_dir* from scratch, overlapping independent stages.
+
+    The seed template is copied into a staging directory while ``uv init``
+    runs (then moved into place by rename), and ``.novo.toml`` is written
+    while dependencies install. Returns the template copy's stats, or None
+    without a seed.
+    """
+    from novo.core.seed import copy_template, get_seed, install_dependencies, merge_template, run_post_create
+
+    python_version = experiment.python or None
+    seed = get_seed(experiment.seed)  # None: unknown seed, skipped silently
+    staging = Path(tempfile.mkdtemp(prefix=f"{experiment.dir_name}-", dir=state_dir(workspace)))
+    try:
+        with ThreadPoolExecutor(max_workers=1) as side:
+            if seed is not None:
+                staged = side.submit(
+                    _timed,
+                    timings,
+                    "copy_template",
+                    copy_template,
+                    seed,
+                    staging,
+                    mode=config.template.copy_mode,
+                    workers=config.template.copy_workers,
+                )
+            _timed(timings, "uv_init", uv.uv_init, exp_dir, python=python_version)
+            if seed is not None:
+                copied = staged.result()
+                _timed(timings, "merge_template", merge_template, staging, exp_dir)
+
+            written = side.submit(_timed, timings, "metadata", _write_novo_toml, exp_dir, experiment)
+            if seed is not None:
+                _timed(timings, "dependencies", install_dependencies, seed, exp_dir)
+            written.result()
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    if seed is None:
+        return None
+    _timed(timings, "post_create", run_post_create, seed, exp_dir)
+    return copied
+
+
+def _timed(timings: dict[str, float], stage: str, fn: Callable[..., T], *args, **kwargs) -> T:
+    """Run one creation stage, recording its wall time in *timings*."""
+    start = time.perf_counter()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def _write_timings(path: Path, timings: dict[str, float], copied: CopyStats | None = None) -> None:
+    """Write per-stage creation timings (seconds), and template copy stats, to the experiment's sidecar file."""
+    data: dict[str, Any] = {"timings": {stage: round(seconds, 4) for stage, seconds in timings.items()}}
+    if copied is not None:
+        data["template"] = {"mode": copied.mode, "files": copied.files, "bytes": copied.bytes, "shared": copied.shared}
+    with open(path / TIMINGS_FILE, "wb") as f:
+        tomli_w.dump(data, f)
+
+
+def _read_sidecar(name: str, config: NovoConfig | None) -> dict[str, Any]:
+    path = get_path(name, config)
+    if path is None:
+        return {}
+    try:
+        with open(path / TIMINGS_FILE, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def read_timings(name: str, config: NovoConfig | None = None) -> dict[str, float] | None:
+    """Per-stage creation timings (seconds) of an experiment, if recorded."""
+    return _read_sidecar(name, config).get("timings")
+
+
+def read_template_stats(name: str, config: NovoConfig | None = None) -> CopyStats | None:
+    """How an experiment's seed template was copied at creation, if recorded."""
+    stats = _read_sidecar(name, config).get("template")
+    return CopyStats(**stats) if stats is not None else None
+
+
+def _toml_signature(path: Path) -> index.Signature | None:
+    """Stat signature of an experiment's .novo.toml, or None if it has none."""
+    try:
+        st = os.stat(path / ".novo.toml")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _stat_entry(path: Path) -> tuple[float, index.Signature]:
+    """Return (directory mtime, .novo.toml signature) for an indexed experiment."""
+    return path.stat().st_mtime, _toml_signature(path)
+
+
+def _read_raw_entry(path: Path) -> tuple[dict, float, index.Signature] | None:
+    """Parse one experiment directory into an unvalidated index entry.
+
+    The signature is taken *before* parsing, so a concurrent edit leaves a
+    stale signature behind and is re-read on the next refresh.
+    """
+    signature = _toml_signature(path)
+    if signature is None:
+        return None
+    exp_data = _parse_novo_toml(path)
+    if exp_data is None:
+        return None
+    return exp_data, path.stat().st_mtime, signature
+
+
+def _scan_workspace(
+    workspace: Path, workers: int = 1
+) -> list[tuple[Experiment, float, index.Signature]]:
+    """Read every experiment's .novo.toml into index entries.
+
+    Candidate directories come from a single ``scandir`` (its cached entry
+    type avoids a ``stat`` per entry); the per-experiment stat/open/parse
+    round trips are then fanned out over up to *workers* threads, which is
+    what makes a cold scan bearable on network filesystems. The parsed
+    fields are validated in one batch at the end.
+    """
+    with os.scandir(workspace) as it:
+        dirs = sorted(
+            Path(entry.path)
+            for entry in it
+            if not entry.name.startswith(".") and entry.is_dir()
+        )
+
+    if workers <= 1 or len(dirs) <= 1:
+        results = list(map(_read_raw_entry, dirs))
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(dirs))) as pool:
+            results = list(pool.map(_read_raw_entry, dirs))
+
+    raw = [entry for entry in results if entry is not None]
+    experiments = validate_experiments([exp_data for exp_data, _, _ in raw])
+    return [(exp, mtime, sig) for exp, (_, mtime, sig) in zip(experiments, raw)]
+
+
+def rebuild_index(config: NovoConfig | None = None) -> int:
+    """Repopulate the workspace index from the .novo.toml files. Returns the count."""
+    config, workspace = _context(config)
+    entries = _scan_workspace(workspace, config.index.scan_workers)
+    with index.open_index(workspace) as conn:
+        count = index.replace_all(conn, entries)
+        index.write_path_map(conn, workspace)
+    return count
+
+
+def _refresh_index(conn, workspace: Path, config: NovoConfig) -> None:
+    """Bring the index up to date with the .novo.toml files on disk.
+
+    One ``scandir`` of the workspace plus one ``stat`` per experiment; only
+    entries whose (mtime_ns, size, inode) signature changed, or which were
+    added, are parsed again. Entries whose directory vanished are dropped.
+    A never-built index falls back to a full scan. The `_open-path` map is
+    rewritten whenever anything changed.
+    """
+    if not index.is_built(conn):
+        index.replace_all(conn, _scan_workspace(workspace, config.index.scan_workers))
+        index.write_path_map(conn, workspace)
+        return
+
+    known = index.signatures(conn)
+    seen: set[str] = set()
+    changed = False
+    with os.scandir(workspace) as it:
+        for entry in it:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            path = Path(entry.path)
+            signature = _toml_signature(path)
+            if signature is None:
+                continue
+            seen.add(entry.name)
+            if known.get(entry.name) == signature:
+                continue
+            parsed = _read_raw_entry(path)
+            if parsed is not None:
+                exp_data, mtime, sig = parsed
+                index.upsert(conn, Experiment(**exp_data), mtime, sig)
+                changed = True
+
+    for dir_name in known.keys() - seen:
+        index.remove(conn, dir_name)
+        changed = True
+
+    if changed or not index.path_map_current(workspace):
+        index.write_path_map(conn, workspace)
+
+
+def _refresh_activity(conn, workspace: Path, config: NovoConfig) -> None:
+    """Make last-activity timestamps ready for a ``modified`` listing without walking every tree.
+
+    Only experiments never scanned (new or re-indexed) are scanned here; the
+    rest keep their stored timestamp, and once the last full rescan is
+    ``index.activity_interval`` seconds old a detached `novo index activity`
+    (``refresh_activity``) is started. The very first listing, or an
+    interval of 0, rescans everything in place.
+    """
+    interval = config.index.activity_interval
+    last = index.activity_refreshed(conn)
+    full = interval == 0 or not last
+    state = index.activity_state(conn, unscanned=not full)
+    if state:
+        _store_activity(conn, state, _scan_activity(workspace, state, config.index.scan_workers))
+
+    now = time.time()
+    if full:
+        index.mark_activity_refreshed(conn, now)
+    elif now - last >= interval:
+        index.mark_activity_refreshed(conn, now)  # started: don't spawn another meanwhile
+        activity.refresh_async(workspace)
+
+
+def refresh_activity(config: NovoConfig | None = None) -> int:
+    """Rescan every experiment's last activity. Returns how many changed.
+
+    Exact, including files rewritten in place, at the cost of a ``stat`` per
+    file and directory (see ``core.activity``). Scans run on
+    ``index.scan_workers`` threads without holding the index's write lock.
+    """
+    config, workspace = _context(config)
+    started = time.time()
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        state = index.activity_state(conn)
+    scans = _scan_activity(workspace, state, config.index.scan_workers)
+    with index.open_index(workspace) as conn:
+        changed = _store_activity(conn, state, scans)
+        index.mark_activity_refreshed(conn, started)
+    return changed
+
+
+def _scan_activity(
+    workspace: Path, state: dict[str, tuple[float | None, activity.DirCache]], workers: int
+) -> list[activity.DirCache]:
+    """Rescan each experiment in *state* from its cache, on up to *workers* threads."""
+
+    def rescan(dir_name: str) -> activity.DirCache:
+        return activity.scan(workspace / dir_name, state[dir_name][1])
+
+    if workers > 1 and len(state) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(rescan, state))
+    return [rescan(dir_name) for dir_name in state]
+
+
+def _store_activity(
+    conn, state: dict[str, tuple[float | None, activity.DirCache]], scans: list[activity.DirCache]
+) -> int:
+    """Write back the scans that differ from their cache. Returns how many were written."""
+    changed = 0
+    for (dir_name, (current, cached)), dirs in zip(state.items(), scans):
+        if dirs != cached or current is None:
+            index.set_activity(conn, dir_name, activity.latest(dirs), dirs)
+            changed += 1
+    return changed
+
+
+def _find_indexed(workspace: Path, name: str, config: NovoConfig) -> ExperimentRecord | None:
+    """Look up one experiment by name or dir_name in a freshly revalidated index."""
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        return index.find(conn, name)
 
 
 def list_all(
     sort_by: str = "created",
-    tag: str | None = None,
-) -> list[Experiment]:
-    """List all experiments in the workspace."""
-    config = load_config()
-    workspace = ensure_initialized()
-
-    experiments = []
-    for item in sorted(workspace.iterdir()):
-        if not item.is_dir() or item.name.startswith("."):
-            continue
-        exp = _read_novo_toml(item)
-        if exp is not None:
-            if tag and tag not in exp.tags:
-                continue
-            experiments.append(exp)
-
-    # Sort
-    if sort_by == "name":
-        experiments.sort(key=lambda e: e.name)
-    elif sort_by == "created":
-        experiments.sort(key=lambda e: e.created_at, reverse=True)
-    elif sort_by == "modified":
-        experiments.sort(
-            key=lambda e: (workspace / e.dir_name).stat().st_mtime,
-            reverse=True,
-        )
+    tags: Sequence[str] = (),
+    config: NovoConfig | None = None,
+    **filters: Any,
+) -> list[ExperimentRecord]:
+    """List experiments in the workspace as read-only records.
+
+    Accepts the same filters as ``iter_all``.
+    """
+    return list(iter_all(sort_by=sort_by, tags=tags, config=config, **filters))
+
+
+def iter_all(
+    sort_by: str = "created",
+    tags: Sequence[str] = (),
+    any_tag: bool = False,
+    seed: str | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    python: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    config: NovoConfig | None = None,
+) -> Iterator[ExperimentRecord]:
+    """Yield experiments as read-only records, streamed from the index.
+
+    Filters (all *tags*, or any with *any_tag*; *seed*; *since* inclusive /
+    *until* exclusive on created_at; *python* version prefix), ordering and
+    *limit*/*offset* run in SQLite against its secondary indexes, so records
+    are produced one at a time and selective queries read only the matching
+    rows. ``modified`` orders by each experiment's cached last-activity
+    timestamp, brought up to date incrementally first (``_refresh_activity``).
+    """
+    config, workspace = _context(config)
+    filters = {
+        "seed": seed,
+        "tags": tags,
+        "any_tag": any_tag,
+        "since": since,
+        "until": until,
+        "python": python,
+    }
 
-    return experiments
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        if sort_by == "modified":
+            _refresh_activity(conn, workspace, config)
+        # Release the write lock before handing rows to a possibly slow consumer.
+        conn.commit()
 
+        order = sort_by if sort_by in index.ORDERINGS else "dir_name"
+        yield from index.iter_experiments(conn, order, limit=limit, offset=offset, **filters)
 
-def get(name: str) -> Experiment | None:
+
+def get(name: str, config: NovoConfig | None = None) -> Experiment | None:
     """Get a single experiment by name (matches name or dir_name)."""
-    workspace = ensure_initialized()
-    for item in workspace.iterdir():
-        if not item.is_dir() or item.name.startswith("."):
-            continue
-        exp = _read_novo_toml(item)
-        if exp is not None and (exp.name == name or exp.dir_name == name or item.name == name):
-            return exp
-    return None
+    config, workspace = _context(config)
+    record = _find_indexed(workspace, name, config)
+    return record.to_experiment() if record is not None else None
 
 
-def get_path(name: str) -> Path | None:
+def get_path(name: str, config: NovoConfig | None = None) -> Path | None:
     """Get the path to an experiment directory."""
-    workspace = ensure_initialized()
-    for item in workspace.iterdir():
-        if not item.is_dir() or item.name.startswith("."):
-            continue
-        exp = _read_novo_toml(item)
-        if exp is not None and (exp.name == name or exp.dir_name == name or item.name == name):
-            return item
+    config, workspace = _context(config)
+    exp = _find_indexed(workspace, name, config)
+    if exp is None:
+        return None
+    return workspace / exp.dir_name
+
+
+# Fuzzy resolution accepts the best candidate only if it is this similar and
+# leads the runner-up by at least this margin.
+RESOLVE_MIN_SCORE = 0.5
+RESOLVE_MARGIN = 0.1
+
+
+def suggest(name: str, limit: int = 5, config: NovoConfig | None = None) -> list[ExperimentRecord]:
+    """Fuzzy "did you mean" candidates for a name, best first."""
+    config, workspace = _context(config)
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        return [record for record, _ in index.fuzzy(conn, name, limit)]
+
+
+def resolve(name: str, fuzzy: bool = True, config: NovoConfig | None = None) -> ExperimentRecord | None:
+    """Resolve a name or dir_name, tolerating typos when the match is unambiguous.
+
+    Exact matches always win. Otherwise the best trigram candidate is used
+    if it scores at least ``RESOLVE_MIN_SCORE`` and beats the runner-up by
+    ``RESOLVE_MARGIN``; anything less returns None (see ``suggest``).
+    """
+    config, workspace = _context(config)
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        exact = index.find(conn, name)
+        if exact is not None or not fuzzy:
+            return exact
+        candidates = index.fuzzy(conn, name, limit=2)
+
+    if not candidates:
+        return None
+    record, score = candidates[0]
+    runner_up = candidates[1][1] if len(candidates) > 1 else 0.0
+    if score >= RESOLVE_MIN_SCORE and score - runner_up >= RESOLVE_MARGIN:
+        return record
     return None
 
 
-def delete(name: str) -> bool:
-    """Delete an experiment."""
-    config = load_config()
-    workspace = ensure_initialized()
+def delete(name: str, config: NovoConfig | None = None) -> bool:
+    """Delete an experiment: move it to the trash and commit its removal.
 
-    exp_path = get_path(name)
+    The move is a single rename, so this returns at once however large the
+    experiment is. Expired trash is reclaimed by a background process;
+    until then, `restore` can bring the experiment back.
+    """
+    config, workspace = _context(config)
+
+    exp_path = get_path(name, config)
     if exp_path is None:
         return False
 
     exp = _read_novo_toml(exp_path)
     exp_name = exp.name if exp else name
 
-    if config.defaults.auto_commit and git.is_git_repo(workspace):
-        git.remove_and_commit(workspace, exp_path.name, f"novo: delete {exp_name}")
-    else:
-        shutil.rmtree(exp_path)
+    entry = trash.move(workspace, exp_path)
+    archives.stash(workspace, exp_path.name, entry.path)
+    if config.defaults.auto_commit:
+        _commit(config, workspace, f"novo: delete {exp_name}", [exp_path.name])
+
+    with index.open_index(workspace) as conn:
+        index.remove(conn, exp_path.name)
+        index.write_path_map(conn, workspace)
 
+    retention = config.trash.retention_hours * 3600
+    if trash.expired(workspace, retention):
+        trash.purge_async(workspace, retention)
     return True
 
 
-def search(query: str) -> list[Experiment]:
-    """Simple token-based fuzzy search across experiments."""
-    all_exps = list_all()
-    query_lower = query.lower()
-    tokens = query_lower.split()
+def restore(name: str, config: NovoConfig | None = None) -> Experiment | None:
+    """Bring a deleted experiment back from the trash.
+
+    *name* is matched against the trashed directory name, then the
+    experiment name; the most recent deletion wins. Everything comes back
+    as it was, ignored files (``.venv``, data) included, and the re-addition
+    is committed like a creation. Returns None if nothing matches (or it
+    was reclaimed meanwhile); raises FileExistsError if the directory has
+    been reused.
+    """
+    config, workspace = _context(config)
+
+    candidates = trash.entries(workspace)
+    entry = next((e for e in candidates if e.dir_name == name), None)
+    if entry is None:
+        entry = next((e for e in candidates if (exp := _read_novo_toml(e.path)) and exp.name == name), None)
+    if entry is None:
+        return None
+
+    target = workspace / entry.dir_name
+    if target.exists():
+        raise FileExistsError(f"Directory '{entry.dir_name}' already exists")
+    if not trash.restore(entry, target):
+        return None
+    archives.unstash(workspace, target)
+
+    experiment = _read_novo_toml(target)
+    if experiment is not None:
+        with index.open_index(workspace) as conn:
+            index.upsert(conn, experiment, *_stat_entry(target))
+            index.write_path_map(conn, workspace)
+
+    if config.defaults.auto_commit:
+        label = experiment.name if experiment else entry.dir_name
+        _commit(config, workspace, f"novo: restore {label}", [entry.dir_name])
+    return experiment
+
+
+def archive(names: list[str], config: NovoConfig | None = None) -> list[tuple[str, ArchiveStats]]:
+    """Move experiments into compressed cold storage (see ``core.archive``).
+
+    Each stays in the index (its ``.novo.toml`` is kept); everything else
+    but ``.venv`` goes into ``.novo/archive/``. Already archived or unknown
+    names are skipped. The emptied directories are committed together; the
+    source remains in git history. Returns ``(dir_name, stats)`` pairs.
+    """
+    config, workspace = _context(config)
+    done = archives.archived(workspace)
+
+    results = []
+    for name in names:
+        exp_path = get_path(name, config)
+        if exp_path is None or exp_path.name in done:
+            continue
+        stats = archives.pack(
+            workspace, exp_path, config.archive.compression, config.archive.level, config.archive.workers
+        )
+        done.add(exp_path.name)
+        results.append((exp_path.name, stats))
+
+    if results and config.defaults.auto_commit:
+        if len(results) == 1:
+            message = f"novo: archive {results[0][0]}"
+        else:
+            summary = "\n".join(f"- {dir_name}" for dir_name, _ in results)
+            message = f"novo: archive {len(results)} experiments\n\n{summary}"
+        _commit(config, workspace, message, [dir_name for dir_name, _ in results])
+    return results
+
+
+def inactive(older_than: float, config: NovoConfig | None = None) -> list[str]:
+    """Return dir_names of unarchived experiments with no activity for *older_than* seconds."""
+    config, workspace = _context(config)
+    refresh_activity(config)  # exact: an experiment edited in place isn't stale
+    with index.open_index(workspace) as conn:
+        stale = index.inactive(conn, time.time() - older_than)
+    done = archives.archived(workspace)
+    return [dir_name for dir_name in stale if dir_name not in done]
+
+
+def unarchive(name: str, sync: bool = True, config: NovoConfig | None = None) -> bool:
+    """Unpack an archived experiment in place and commit it back.
+
+    With *sync*, the ``.venv`` left out of the archive is then recreated
+    from ``uv.lock`` (``uv sync --locked``). Returns False if the experiment
+    isn't archived.
+    """
+    config, workspace = _context(config)
+    exp_path = get_path(name, config)
+    if exp_path is None or not archives.unpack(workspace, exp_path):
+        return False
+
+    if config.defaults.auto_commit:
+        _commit(config, workspace, f"novo: unarchive {exp_path.name}", [exp_path.name])
+    if sync and (exp_path / "uv.lock").exists():
+        uv.uv_sync_locked(exp_path)
+    return True
 
-    scored = []
-    for exp in all_exps:
-        searchable = f"{exp.name} {exp.description} {' '.join(exp.tags)} {exp.seed}".lower()
-        score = sum(1 for token in tokens if token in searchable)
-        if score > 0:
-            scored.append((score, exp))
 
-    scored.sort(key=lambda x: x[0], reverse=True)
-    return [exp for _, exp in scored]
+def archived_names(config: NovoConfig | None = None) -> set[str]:
+    """Return the dir_names of archived experiments."""
+    return archives.archived(ensure_initialized(config))
+
+
+def archive_file(name: str, config: NovoConfig | None = None) -> Path | None:
+    """Return the archive holding an experiment, or None if it isn't archived."""
+    return archives.archive_path(ensure_initialized(config), name)
+
+
+def disk_usage(
+    names: Sequence[str] | None = None, rescan: bool = False, config: NovoConfig | None = None
+) -> dict[str, usage.Usage]:
+    """Disk usage of experiments by dir_name (all of them by default), split into venv/data/source.
+
+    Incremental (see ``core.usage``): only directories whose mtime changed
+    since the last call are listed again, unless *rescan*. Listings run on
+    ``index.scan_workers`` threads. Archived experiments also count their
+    archive.
+    """
+    config, workspace = _context(config)
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        dir_names = list(index.signatures(conn)) if names is None else list(names)
+        caches = {} if rescan else index.usage_state(conn, dir_names)
+
+    # Scan without holding the index's write lock
+    scans = usage.scan({d: workspace / d for d in dir_names}, caches, config.index.scan_workers)
+    with index.open_index(workspace) as conn:
+        for dir_name, dirs in scans.items():
+            if dirs != caches.get(dir_name):
+                index.set_usage(conn, dir_name, dirs)
+
+    result = {}
+    for dir_name, dirs in scans.items():
+        archive_file = archives.archive_path(workspace, dir_name)
+        result[dir_name] = usage.total(dirs, archive_file.stat().st_size if archive_file else 0)
+    return result
+
+
+def search(
+    query: str, limit: int | None = None, offset: int = 0, config: NovoConfig | None = None
+) -> list[ExperimentRecord]:
+    """Ranked search across name, tags, seed and description (best match first).
+
+    Answered from the index's inverted postings with field-weighted BM25, so
+    only matching experiments are read; *limit* keeps the top-k after
+    skipping the first *offset*.
+    """
+    config, workspace = _context(config)
+    with index.open_index(workspace) as conn:
+        _refresh_index(conn, workspace, config)
+        return index.search(conn, query, limit, offset)
@@ -3,7 +3,6 @@
 import subprocess
 from pathlib import Path
 
-
 def init(directory: Path) -> None:
     """Initialize a git repository."""
     subprocess.run(
@@ -16,47 +15,50 @@ def init(directory: Path) -> None:
 
 
 def add_and_commit(directory: Path, message: str, paths: list[str] | None = None) -> None:
-    """Stage files and commit."""
-    add_cmd = ["git", "add"]
-    if paths:
-        add_cmd.extend(paths)
-    else:
-        add_cmd.append(".")
-
-    subprocess.run(add_cmd, cwd=directory, check=True, capture_output=True, text=True)
-    subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=directory,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+    """Stage files and commit.
 
+    With *paths*, only those paths are staged (additions, modifications and
+    deletions) and committed, so git never walks the rest of the work tree
+    and other pending changes stay out of the commit. Paths that are gone
+    and were never tracked are skipped. Without, everything is staged with
+    ``git add .``.
+    """
+    if not paths:
+        _git(directory, "add", ".")
+        _git(directory, "commit", "-m", message)
+        return
 
-def remove_and_commit(directory: Path, target: str, message: str) -> None:
-    """Remove a path and commit the removal."""
-    subprocess.run(
-        ["git", "rm", "-rf", target],
-        cwd=directory,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
-    subprocess.run(
-        ["git", "commit", "-m", message],
-        cwd=directory,
-        check=True,
-        capture_output=True,
-        text=True,
-    )
+    missing = [path for path in paths if not (directory / path).exists()]
+    if missing:
+        known = tracked(directory, missing)
+        paths = [path for path in paths if path not in missing or path in known]
+        if not paths:
+            return
+
+    _git(directory, "add", "--all", "--", *paths)
+    _git(directory, "commit", "-m", message, "--", *paths)
+
+
+def tracked(directory: Path, paths: list[str]) -> set[str]:
+    """Return the top-level *paths* that have entries in the index."""
+    if not paths:
+        return set()
+    files = _git(directory, "ls-files", "-z", "--", *paths).split("\0")
+    return {path.split("/", 1)[0] for path in files if path}
+
+
+def _git(directory: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=directory, check=True, capture_output=True, text=True).stdout
 
 
-def is_git_repo(directory: Path) -> bool:
-    """Check if a directory is inside a git repository."""
+def git_dir(directory: Path) -> Path | None:
+    """Return the git directory of the repository *directory* is in, or None if it isn't in one."""
     result = subprocess.run(
-        ["git", "rev-parse", "--is-inside-work-tree"],
+        ["git", "rev-parse", "--absolute-git-dir"],
         cwd=directory,
         capture_output=True,
         text=True,
     )
-    return result.returncode == 0
+    if result.returncode != 0:
+        return None
+    return Path(result.stdout.strip())
@@ -0,0 +1,663 @@
+"""Persistent SQLite index of experiment metadata.
+
+The index lives at ``<workspace>/.novo/index.sqlite`` and mirrors every
+experiment's ``.novo.toml`` so read paths don't have to walk the workspace.
+``.novo.toml`` stays the source of truth — the index can always be dropped
+and rebuilt from it (see ``core.experiment.rebuild_index``).
+"""
+
+import heapq
+import math
+import os
+import re
+import sqlite3
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from novo.core.activity import DirCache
+from novo.core.usage import DirCache as UsageCache
+from novo.core.workspace import state_dir
+from novo.models.experiment import Experiment, ExperimentRecord, pack_tags
+from novo.utils.paths import config_file, open_paths_file
+
+INDEX_FILE = "index.sqlite"
+
+# Bump whenever the schema changes; a mismatch drops and rebuilds the index.
+SCHEMA_VERSION = 10
+
+_SCHEMA = """
+CREATE TABLE experiments (
+    dir_name    TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    seed        TEXT NOT NULL,
+    tags        TEXT NOT NULL,  -- packed with models.experiment.pack_tags
+    description TEXT NOT NULL,
+    python      TEXT NOT NULL,
+    created_at  TEXT NOT NULL,
+    mtime       REAL NOT NULL,
+    -- (st_mtime_ns, st_size, st_ino) of .novo.toml when it was last parsed
+    sig_mtime   INTEGER NOT NULL,
+    sig_size    INTEGER NOT NULL,
+    sig_inode   INTEGER NOT NULL,
+    -- newest file/dir mtime under the experiment (see core.activity); NULL until scanned
+    activity    REAL
+);
+-- Secondary indexes for list filters and pre-ordered listing
+CREATE INDEX experiments_name ON experiments(name, dir_name);
+CREATE INDEX experiments_created ON experiments(created_at, dir_name);
+CREATE INDEX experiments_seed ON experiments(seed);
+CREATE INDEX experiments_activity ON experiments(activity, dir_name);
+-- Per-directory activity scan cache (core.activity.DirCache)
+CREATE TABLE activity_dirs (
+    dir_name TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    newest   REAL NOT NULL,
+    files    TEXT NOT NULL,  -- names of the files directly in it, "/"-separated
+    PRIMARY KEY (dir_name, path)
+) WITHOUT ROWID;
+-- Per-directory disk usage scan cache (core.usage.DirCache)
+CREATE TABLE usage_dirs (
+    dir_name TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    venv     INTEGER NOT NULL,
+    data     INTEGER NOT NULL,
+    source   INTEGER NOT NULL,
+    PRIMARY KEY (dir_name, path)
+) WITHOUT ROWID;
+CREATE TABLE experiment_tags (
+    tag      TEXT NOT NULL,
+    dir_name TEXT NOT NULL,
+    PRIMARY KEY (tag, dir_name)
+) WITHOUT ROWID;
+CREATE INDEX experiment_tags_dir_name ON experiment_tags(dir_name);
+CREATE TABLE meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+-- Inverted index for search: term frequency per (term, experiment, field)
+CREATE TABLE postings (
+    term     TEXT NOT NULL,
+    dir_name TEXT NOT NULL,
+    field    TEXT NOT NULL,
+    tf       INTEGER NOT NULL,
+    PRIMARY KEY (term, dir_name, field)
+) WITHOUT ROWID;
+CREATE INDEX postings_dir_name ON postings(dir_name);
+CREATE TABLE field_lengths (
+    dir_name TEXT NOT NULL,
+    field    TEXT NOT NULL,
+    length   INTEGER NOT NULL,
+    PRIMARY KEY (dir_name, field)
+) WITHOUT ROWID;
+-- Trigram index for fuzzy lookup over names, dir_names and tags: one row
+-- per gram holding an array('q') of fuzzy_terms keys (id << 8 | gram count)
+CREATE TABLE fuzzy_terms (
+    id       INTEGER PRIMARY KEY,
+    dir_name TEXT NOT NULL,
+    term     TEXT NOT NULL,
+    grams    INTEGER NOT NULL
+);
+CREATE INDEX fuzzy_terms_dir_name ON fuzzy_terms(dir_name);
+CREATE TABLE trigrams (
+    gram TEXT PRIMARY KEY,
+    ids  BLOB NOT NULL
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = "dir_name, name, seed, tags, description, python, created_at, mtime"
+# Columns in ExperimentRecord field order.
+_RECORD_COLUMNS = "dir_name, name, seed, tags, description, python, created_at"
+_SIG_COLUMNS = "sig_mtime, sig_size, sig_inode"
+_INSERT = (
+    f"INSERT OR REPLACE INTO experiments ({_COLUMNS}, {_SIG_COLUMNS}) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Stat signature of a .novo.toml: (st_mtime_ns, st_size, st_ino).
+Signature = tuple[int, int, int]
+
+# Search ranking: per-field weights (a name hit outranks a description hit),
+# BM25 parameters, and the discount for a prefix rather than exact term match.
+FIELD_WEIGHTS = {"name": 3.0, "tags": 2.0, "seed": 1.0, "description": 1.0}
+BM25_K1 = 1.2
+BM25_B = 0.75
+PREFIX_WEIGHT = 0.7
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Fuzzy lookup: minimum Dice similarity between trigram sets to be a candidate.
+FUZZY_THRESHOLD = 0.3
+_GRAM_BITS = 8  # low bits of a trigram key hold the term's gram count (capped)
+
+
+def index_path(workspace: Path) -> Path:
+    """Return the path to the workspace index database."""
+    return workspace / ".novo" / INDEX_FILE
+
+
+def _prepare(conn: sqlite3.Connection) -> None:
+    """Create the schema, discarding any index written by another schema version."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == SCHEMA_VERSION:
+        return
+
+    tables = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    for (table,) in tables:
+        conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    conn.commit()
+
+
+@contextmanager
+def open_index(workspace: Path) -> Iterator[sqlite3.Connection]:
+    """Open the workspace index, committing on success and rolling back on error."""
+    path = state_dir(workspace) / INDEX_FILE
+    conn = sqlite3.connect(path, timeout=10)
+    try:
+        _prepare(conn)
+        with conn:
+            yield conn
+    finally:
+        conn.close()
+
+
+def is_built(conn: sqlite3.Connection) -> bool:
+    """Whether the index has been fully populated at least once."""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'built_at'").fetchone()
+    return row is not None
+
+
+def mark_built(conn: sqlite3.Connection) -> None:
+    """Record that the index now reflects the whole workspace."""
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('built_at', ?)",
+        (datetime.now().isoformat(),),
+    )
+
+
+def _to_row(experiment: Experiment, mtime: float, signature: Signature) -> tuple:
+    return (
+        experiment.dir_name,
+        experiment.name,
+        experiment.seed,
+        pack_tags(experiment.tags),
+        experiment.description,
+        experiment.python,
+        experiment.created_at.isoformat(),
+        mtime,
+        *signature,
+    )
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens (``image-classifier`` → image, classifier)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _field_tokens(experiment: Experiment) -> dict[str, list[str]]:
+    return {
+        "name": tokenize(experiment.name),
+        "tags": [token for tag in experiment.tags for token in tokenize(tag)],
+        "seed": tokenize(experiment.seed),
+        "description": tokenize(experiment.description),
+    }
+
+
+def _postings(experiment: Experiment) -> tuple[list[tuple], list[tuple]]:
+    """Return (postings rows, field length rows) for one experiment."""
+    postings, lengths = [], []
+    for field, tokens in _field_tokens(experiment).items():
+        lengths.append((experiment.dir_name, field, len(tokens)))
+        for term, tf in Counter(tokens).items():
+            postings.append((term, experiment.dir_name, field, tf))
+    return postings, lengths
+
+
+def trigrams(text: str) -> set[str]:
+    """Padded, lowercase character trigrams (``"ab"`` → ``"  a", " ab", "ab "``)."""
+    padded = f"  {text.lower()} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _fuzzy_terms(experiment: Experiment) -> set[str]:
+    return {experiment.name.lower(), experiment.dir_name.lower(), *(t.lower() for t in experiment.tags)}
+
+
+def _term_key(term_id: int, grams: int) -> int:
+    """Pack a fuzzy term id with its gram count, so lookups can score without a join."""
+    return term_id << _GRAM_BITS | min(grams, (1 << _GRAM_BITS) - 1)
+
+
+def _unpack_ids(blob: bytes) -> array:
+    ids = array("q")
+    ids.frombytes(blob)
+    return ids
+
+
+def _update_trigrams(conn: sqlite3.Connection, changes: dict[str, tuple[set[int], set[int]]]) -> None:
+    """Apply (added ids, removed ids) per gram to the packed trigram rows."""
+    sql = "SELECT gram, ids FROM trigrams WHERE gram IN ({})"
+    current = {gram: _unpack_ids(blob) for gram, blob in _select_in(conn, sql, changes)}
+    for gram, (added, removed) in changes.items():
+        ids = array("q", (i for i in current.get(gram, ()) if i not in removed))
+        ids.extend(sorted(added))
+        if ids:
+            conn.execute("INSERT OR REPLACE INTO trigrams (gram, ids) VALUES (?, ?)", (gram, ids.tobytes()))
+        else:
+            conn.execute("DELETE FROM trigrams WHERE gram = ?", (gram,))
+
+
+def _insert_postings(conn: sqlite3.Connection, experiments: Iterable[Experiment]) -> None:
+    postings, lengths, tags = [], [], []
+    added: dict[str, tuple[set[int], set[int]]] = defaultdict(lambda: (set(), set()))
+    for experiment in experiments:
+        p, n = _postings(experiment)
+        postings.extend(p)
+        lengths.extend(n)
+        tags.extend((tag, experiment.dir_name) for tag in dict.fromkeys(experiment.tags))
+        for term in sorted(_fuzzy_terms(experiment)):
+            term_grams = trigrams(term)
+            cursor = conn.execute(
+                "INSERT INTO fuzzy_terms (dir_name, term, grams) VALUES (?, ?, ?)",
+                (experiment.dir_name, term, len(term_grams)),
+            )
+            key = _term_key(cursor.lastrowid, len(term_grams))
+            for gram in term_grams:
+                added[gram][0].add(key)
+    conn.executemany("INSERT INTO postings (term, dir_name, field, tf) VALUES (?, ?, ?, ?)", postings)
+    conn.executemany("INSERT INTO field_lengths (dir_name, field, length) VALUES (?, ?, ?)", lengths)
+    conn.executemany("INSERT INTO experiment_tags (tag, dir_name) VALUES (?, ?)", tags)
+    _update_trigrams(conn, added)
+
+
+_DERIVED_TABLES = (
+    "postings",
+    "field_lengths",
+    "fuzzy_terms",
+    "trigrams",
+    "experiment_tags",
+    "activity_dirs",
+    "usage_dirs",
+)
+
+
+def _delete_postings(conn: sqlite3.Connection, dir_name: str) -> None:
+    removed: dict[str, tuple[set[int], set[int]]] = defaultdict(lambda: (set(), set()))
+    rows = conn.execute("SELECT id, term, grams FROM fuzzy_terms WHERE dir_name = ?", (dir_name,))
+    for term_id, term, grams in rows:
+        key = _term_key(term_id, grams)
+        for gram in trigrams(term):
+            removed[gram][1].add(key)
+    _update_trigrams(conn, removed)
+    for table in ("postings", "field_lengths", "fuzzy_terms", "experiment_tags"):
+        conn.execute(f"DELETE FROM {table} WHERE dir_name = ?", (dir_name,))
+
+
+def upsert(
+    conn: sqlite3.Connection, experiment: Experiment, mtime: float, signature: Signature
+) -> None:
+    """Insert or replace the entry (and search postings) for one experiment."""
+    conn.execute(_INSERT, _to_row(experiment, mtime, signature))
+    _delete_postings(conn, experiment.dir_name)
+    _insert_postings(conn, [experiment])
+
+
+def remove(conn: sqlite3.Connection, dir_name: str) -> None:
+    """Drop the entry (and search postings) for one experiment."""
+    conn.execute("DELETE FROM experiments WHERE dir_name = ?", (dir_name,))
+    conn.execute("DELETE FROM activity_dirs WHERE dir_name = ?", (dir_name,))
+    conn.execute("DELETE FROM usage_dirs WHERE dir_name = ?", (dir_name,))
+    _delete_postings(conn, dir_name)
+
+
+def replace_all(
+    conn: sqlite3.Connection, entries: Iterable[tuple[Experiment, float, Signature]]
+) -> int:
+    """Replace the whole index with *entries* and mark it built. Returns the count."""
+    entries = list(entries)
+    conn.execute("DELETE FROM experiments")
+    for table in _DERIVED_TABLES:
+        conn.execute(f"DELETE FROM {table}")
+    conn.executemany(_INSERT, [_to_row(exp, mtime, sig) for exp, mtime, sig in entries])
+    _insert_postings(conn, [exp for exp, _, _ in entries])
+    mark_built(conn)
+    return len(entries)
+
+
+def signatures(conn: sqlite3.Connection) -> dict[str, Signature]:
+    """Return the stored .novo.toml signature for every indexed experiment."""
+    rows = conn.execute(f"SELECT dir_name, {_SIG_COLUMNS} FROM experiments").fetchall()
+    return {dir_name: (mtime, size, inode) for dir_name, mtime, size, inode in rows}
+
+
+def activity_state(
+    conn: sqlite3.Connection, unscanned: bool = False
+) -> dict[str, tuple[float | None, DirCache]]:
+    """Return ``dir_name -> (activity, directory scan cache)`` for every experiment.
+
+    With *unscanned*, only for experiments that have no activity yet.
+    """
+    query = "SELECT dir_name, activity FROM experiments"
+    if unscanned:
+        query += " WHERE activity IS NULL"
+    state: dict[str, tuple[float | None, DirCache]] = {
+        dir_name: (activity, {}) for dir_name, activity in conn.execute(query)
+    }
+    if unscanned:
+        rows = _select_in(conn, "SELECT * FROM activity_dirs WHERE dir_name IN ({})", list(state))
+    else:
+        rows = conn.execute("SELECT * FROM activity_dirs")
+    for dir_name, path, mtime_ns, newest, files in rows:
+        if dir_name in state:
+            state[dir_name][1][path] = (mtime_ns, newest, tuple(files.split("/")) if files else ())
+    return state
+
+
+def set_activity(
+    conn: sqlite3.Connection, dir_name: str, activity: float | None, dirs: DirCache
+) -> None:
+    """Store an experiment's activity timestamp and the scan cache it came from.
+
+    A no-op if the experiment has left the index since it was scanned.
+    """
+    updated = conn.execute("UPDATE experiments SET activity = ? WHERE dir_name = ?", (activity, dir_name))
+    conn.execute("DELETE FROM activity_dirs WHERE dir_name = ?", (dir_name,))
+    if not updated.rowcount:
+        return
+    conn.executemany(
+        "INSERT INTO activity_dirs (dir_name, path, mtime_ns, newest, files) VALUES (?, ?, ?, ?, ?)",
+        [(dir_name, path, mtime_ns, newest, "/".join(files)) for path, (mtime_ns, newest, files) in dirs.items()],
+    )
+
+
+def activity_refreshed(conn: sqlite3.Connection) -> float:
+    """When every experiment's activity was last rescanned (Unix time; 0 if never)."""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'activity_refreshed_at'").fetchone()
+    return float(row[0]) if row is not None else 0.0
+
+
+def mark_activity_refreshed(conn: sqlite3.Connection, when: float) -> None:
+    """Record a full activity rescan (or that one has been started) at *when*."""
+    conn.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES ('activity_refreshed_at', ?)", (repr(when),)
+    )
+
+
+def usage_state(conn: sqlite3.Connection, dir_names: Iterable[str]) -> dict[str, UsageCache]:
+    """Return the cached disk usage scan of each of *dir_names* (empty if never scanned)."""
+    state: dict[str, UsageCache] = {dir_name: {} for dir_name in dir_names}
+    rows = _select_in(conn, "SELECT * FROM usage_dirs WHERE dir_name IN ({})", list(state))
+    for dir_name, path, mtime_ns, venv, data, source in rows:
+        state[dir_name][path] = (mtime_ns, venv, data, source)
+    return state
+
+
+def set_usage(conn: sqlite3.Connection, dir_name: str, dirs: UsageCache) -> None:
+    """Store an experiment's disk usage scan cache."""
+    conn.execute("DELETE FROM usage_dirs WHERE dir_name = ?", (dir_name,))
+    conn.executemany(
+        "INSERT INTO usage_dirs (dir_name, path, mtime_ns, venv, data, source) VALUES (?, ?, ?, ?, ?, ?)",
+        [(dir_name, path, *entry) for path, entry in dirs.items()],
+    )
+
+
+def inactive(conn: sqlite3.Connection, before: float) -> list[str]:
+    """Return dir_names whose last activity is older than *before* (Unix time), stalest first."""
+    rows = conn.execute(
+        "SELECT dir_name FROM experiments WHERE activity < ? ORDER BY activity", (before,)
+    ).fetchall()
+    return [dir_name for (dir_name,) in rows]
+
+
+# SQL orderings for ``iter_experiments``, each served by an index scan
+# (dir_name breaks ties deterministically).
+ORDERINGS = {
+    "dir_name": "dir_name",
+    "name": "name, dir_name",
+    "created": "created_at DESC, dir_name DESC",
+    "modified": "activity DESC, dir_name DESC",
+}
+
+
+def iter_experiments(
+    conn: sqlite3.Connection,
+    order: str = "dir_name",
+    *,
+    seed: str | None = None,
+    tags: Sequence[str] = (),
+    any_tag: bool = False,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    python: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> Iterator[ExperimentRecord]:
+    """Yield indexed experiments one row at a time, filtered and ordered in SQL.
+
+    *tags* must all match, or any of them with *any_tag*; *since* is
+    inclusive and *until* exclusive on ``created_at``; *python* matches a
+    version or its patch releases (``3.12`` matches ``3.12.4``). Filters are
+    answered from the secondary indexes on seed, tag and created_at, and
+    rows come straight off the cursor, so memory stays flat however many
+    experiments match; *limit*/*offset* are applied by SQLite.
+    """
+    where: list[str] = []
+    params: list = []
+    if seed is not None:
+        where.append("seed = ?")
+        params.append(seed)
+    if tags:
+        tags = list(dict.fromkeys(tags))
+        marks = ", ".join("?" * len(tags))
+        subquery = f"SELECT dir_name FROM experiment_tags WHERE tag IN ({marks})"
+        if not any_tag and len(tags) > 1:
+            subquery += f" GROUP BY dir_name HAVING COUNT(*) = {len(tags)}"
+        where.append(f"dir_name IN ({subquery})")
+        params += tags
+    if since is not None:
+        where.append("created_at >= ?")
+        params.append(since.isoformat())
+    if until is not None:
+        where.append("created_at < ?")
+        params.append(until.isoformat())
+    if python is not None:
+        where.append("(python = ? OR substr(python, 1, ?) = ?)")
+        params += [python, len(python) + 1, python + "."]
+
+    sql = f"SELECT {_RECORD_COLUMNS} FROM experiments"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY {ORDERINGS[order]} LIMIT ? OFFSET ?"
+    params += [-1 if limit is None else limit, offset]
+    for row in conn.execute(sql, params):
+        yield ExperimentRecord.from_row(row)
+
+
+def find(conn: sqlite3.Connection, name: str) -> ExperimentRecord | None:
+    """Find an experiment by directory name or name (directory name wins)."""
+    row = conn.execute(
+        f"SELECT {_RECORD_COLUMNS} FROM experiments WHERE dir_name = ? OR name = ? "
+        "ORDER BY dir_name = ? DESC, dir_name LIMIT 1",
+        (name, name, name),
+    ).fetchone()
+    return ExperimentRecord.from_row(row) if row else None
+
+
+def records(conn: sqlite3.Connection, dir_names: list[str]) -> dict[str, ExperimentRecord]:
+    """Fetch the records for specific experiments, keyed by dir_name."""
+    rows = _select_in(conn, f"SELECT {_RECORD_COLUMNS} FROM experiments WHERE dir_name IN ({{}})", dir_names)
+    return {row[0]: ExperimentRecord.from_row(row) for row in rows}
+
+
+def search(
+    conn: sqlite3.Connection, query: str, limit: int | None = None, offset: int = 0
+) -> list[ExperimentRecord]:
+    """Rank experiments against *query* with field-weighted BM25 over the postings.
+
+    Each query token matches index terms exactly or as a prefix (``clas``
+    finds ``classifier``, discounted by ``PREFIX_WEIGHT``). Per field, term
+    frequency is length-normalized against that field's average length and
+    weighted by ``FIELD_WEIGHTS``; the weighted sum is saturated with ``k1``
+    and scaled by the term's IDF. Only postings for the query terms and the
+    *limit* records after the first *offset* are read.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if not tokens:
+        return []
+
+    total = conn.execute("SELECT COUNT(*) FROM experiments").fetchone()[0]
+    if total == 0:
+        return []
+    avg_length = {
+        field: (length or 0) / total
+        for field, length in conn.execute("SELECT field, SUM(length) FROM field_lengths GROUP BY field")
+    }
+
+    scores: dict[str, float] = defaultdict(float)
+    for token in tokens:
+        # term -> dir_name -> field -> tf, for every term the token matches
+        matches: dict[str, dict[str, dict[str, int]]] = defaultdict(lambda: defaultdict(dict))
+        rows = conn.execute(
+            "SELECT term, dir_name, field, tf FROM postings WHERE term >= ? AND term < ?",
+            (token, token + "\U0010ffff"),
+        )
+        for term, dir_name, field, tf in rows:
+            matches[term][dir_name][field] = tf
+        if not matches:
+            continue
+
+        candidates = {d for docs in matches.values() for d in docs}
+        lengths: dict[str, dict[str, int]] = defaultdict(dict)
+        sql = "SELECT dir_name, field, length FROM field_lengths WHERE dir_name IN ({})"
+        for dir_name, field, length in _select_in(conn, sql, candidates):
+            lengths[dir_name][field] = length
+
+        best: dict[str, float] = {}
+        for term, docs in matches.items():
+            df = len(docs)
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            boost = 1.0 if term == token else PREFIX_WEIGHT
+            for dir_name, fields in docs.items():
+                weighted_tf = 0.0
+                for field, tf in fields.items():
+                    avg = avg_length.get(field) or 1.0
+                    norm = 1 - BM25_B + BM25_B * lengths[dir_name].get(field, 0) / avg
+                    weighted_tf += FIELD_WEIGHTS[field] * tf / norm
+                score = boost * idf * weighted_tf * (BM25_K1 + 1) / (weighted_tf + BM25_K1)
+                if score > best.get(dir_name, 0.0):
+                    best[dir_name] = score
+        for dir_name, score in best.items():
+            scores[dir_name] += score
+
+    if limit is None:
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[offset:]
+    else:
+        top = heapq.nsmallest(offset + limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        ranked = top[offset:]
+    found = records(conn, [dir_name for dir_name, _ in ranked])
+    return [found[dir_name] for dir_name, _ in ranked if dir_name in found]
+
+
+def fuzzy(
+    conn: sqlite3.Connection, text: str, limit: int = 5, threshold: float = FUZZY_THRESHOLD
+) -> list[tuple[ExperimentRecord, float]]:
+    """Typo-tolerant lookup over names, dir_names and tags.
+
+    Scores each indexed term by the Dice coefficient of its trigram set with
+    the query's (``2·shared / (|query| + |term|)``) and keeps each
+    experiment's best term. Returns up to *limit* (record, score) pairs at or
+    above *threshold*, best first.
+
+    Shared grams are counted in C over the packed key arrays of the query's
+    grams (one row read per gram). Each key carries its term's gram count,
+    so every candidate is scored without touching ``fuzzy_terms``; only the
+    best-scoring terms are then mapped back to their experiments.
+    """
+    if not text.strip():
+        return []
+    query_grams = trigrams(text)
+    size = len(query_grams)
+
+    shared: Counter[int] = Counter()
+    for (blob,) in _select_in(conn, "SELECT ids FROM trigrams WHERE gram IN ({})", query_grams):
+        shared.update(_unpack_ids(blob))
+
+    mask = (1 << _GRAM_BITS) - 1
+    scored = []
+    for key, count in shared.items():
+        score = 2 * count / (size + (key & mask))
+        if score >= threshold:
+            scored.append((score, key >> _GRAM_BITS))
+    scored.sort(reverse=True)
+
+    # Map terms back to experiments, best first. The first term seen for an
+    # experiment is its best, so stop once *limit* experiments are found.
+    best: dict[str, float] = {}
+    batch = max(limit * 4, 16)
+    for start in range(0, len(scored), batch):
+        chunk = scored[start : start + batch]
+        sql = "SELECT id, dir_name FROM fuzzy_terms WHERE id IN ({})"
+        dir_names = dict(_select_in(conn, sql, [term_id for _, term_id in chunk]))
+        for score, term_id in chunk:
+            dir_name = dir_names.get(term_id)
+            if dir_name is not None and dir_name not in best:
+                best[dir_name] = score
+        if len(best) >= limit:
+            break
+
+    ranked = heapq.nsmallest(limit, best.items(), key=lambda item: (-item[1], item[0]))
+    found = records(conn, [dir_name for dir_name, _ in ranked])
+    return [(found[dir_name], score) for dir_name, score in ranked if dir_name in found]
+
+
+def _select_in(conn: sqlite3.Connection, sql: str, values: Iterable[str]) -> Iterator[tuple]:
+    """Run *sql* (with one ``IN ({})`` slot) over *values* in chunks below SQLite's variable limit.
+
+    Callers must not aggregate across chunks in SQL.
+    """
+    values = list(values)
+    for start in range(0, len(values), 500):
+        chunk = values[start : start + 500]
+        yield from conn.execute(sql.format(", ".join("?" * len(chunk))), chunk)
+
+
+def path_map_current(workspace: Path) -> bool:
+    """Whether the `_open-path` map exists, targets *workspace* and postdates config.toml."""
+    map_file = open_paths_file()
+    try:
+        map_mtime = map_file.stat().st_mtime_ns
+        with open(map_file, encoding="utf-8") as f:
+            header = f.readline().rstrip("\n")
+    except OSError:
+        return False
+    try:
+        if config_file().stat().st_mtime_ns > map_mtime:
+            return False
+    except OSError:
+        pass
+    return header == f"workspace\t{workspace}"
+
+
+def write_path_map(conn: sqlite3.Connection, workspace: Path) -> None:
+    """Write the compact name→path map used by ``novo.launcher``.
+
+    Plain text so the shell integration can resolve a name without importing
+    sqlite3, tomllib or pydantic: a ``workspace\t<path>`` header followed by
+    one ``<dir_name>\t<name>`` line per experiment. Replaced atomically.
+    """
+    map_file = open_paths_file()
+    map_file.parent.mkdir(parents=True, exist_ok=True)
+    rows = conn.execute("SELECT dir_name, name FROM experiments ORDER BY dir_name").fetchall()
+    lines = [f"workspace\t{workspace}"]
+    lines.extend(f"{dir_name}\t{name}" for dir_name, name in rows)
+
+    tmp = map_file.with_name(f"{map_file.name}.{os.getpid()}.tmp")
+    tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp, map_file)
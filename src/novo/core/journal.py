@@ -0,0 +1,162 @@
+"""Deferred commit journal.
+
+With ``commit.deferred`` set, mutations don't commit synchronously: they
+append an entry to ``.novo/journal.jsonl`` and make sure a background
+committer is running. The committer (a detached ``novo commit
+--background``) commits everything journaled so far as one commit once the
+oldest entry is ``commit.window`` seconds old or ``commit.max_ops`` entries
+are waiting, and exits once the journal is empty.
+
+Three ``flock`` files in ``.novo`` keep this consistent:
+
+- ``journal.lock``: shared by appenders, exclusive while the committer
+  takes the journal (renames it aside) or decides to exit;
+- ``committer.lock``: held for the committer's lifetime, so there is only
+  ever one, and appenders can tell whether they need to start one;
+- ``commit.lock``: held around each flush, so only one process runs git
+  at a time (no ``index.lock`` races) and ``novo commit --flush`` simply
+  waits for an in-progress flush before doing its own.
+"""
+
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from pathlib import Path
+
+from novo.core import git
+from novo.core.workspace import state_dir
+
+JOURNAL_FILE = "journal.jsonl"
+FLUSHING_FILE = "journal.flushing.jsonl"  # entries taken by a flush that hasn't committed yet
+_POLL = 0.2  # seconds between committer checks
+
+
+def record(
+    workspace: Path, message: str, paths: list[str], window: float | None = None, max_ops: int | None = None
+) -> None:
+    """Journal a mutation of top-level *paths* for the background committer.
+
+    *window* and *max_ops* are handed to a committer started for this entry
+    (default: its own ``commit`` config).
+    """
+    entry = json.dumps({"time": time.time(), "message": message, "paths": paths}) + "\n"
+    with _locked(workspace, "journal.lock", fcntl.LOCK_SH):
+        fd = os.open(state_dir(workspace) / JOURNAL_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, entry.encode())  # one O_APPEND write: concurrent entries never interleave
+        finally:
+            os.close(fd)
+    if not committer_running(workspace):
+        _spawn_committer(workspace, window, max_ops)
+
+
+def pending(workspace: Path) -> list[dict]:
+    """Return journaled entries not yet committed, oldest first."""
+    entries = []
+    for name in (FLUSHING_FILE, JOURNAL_FILE):
+        path = state_dir(workspace) / name
+        if path.exists():
+            entries.extend(json.loads(line) for line in path.read_text().splitlines() if line.strip())
+    return entries
+
+
+def flush(workspace: Path) -> int:
+    """Commit every journaled entry now, as one commit. Returns the number of entries committed."""
+    with commit_lock(workspace):
+        return _flush(workspace)
+
+
+def commit_lock(workspace: Path) -> AbstractContextManager[None]:
+    """Hold the workspace's commit lock: one novo process runs git at a time."""
+    return _locked(workspace, "commit.lock", fcntl.LOCK_EX)
+
+
+def committer_running(workspace: Path) -> bool:
+    """Whether a background committer currently holds the workspace."""
+    try:
+        with _locked(workspace, "committer.lock", fcntl.LOCK_EX | fcntl.LOCK_NB):
+            return False
+    except BlockingIOError:
+        return True
+
+
+def run_committer(workspace: Path, window: float, max_ops: int) -> None:
+    """Flush the journal in batches until it's empty. Returns at once if another committer runs."""
+    lock = open(state_dir(workspace) / "committer.lock", "w")
+    try:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return
+        while True:
+            entries = pending(workspace)
+            if not entries:
+                with _locked(workspace, "journal.lock", fcntl.LOCK_EX):
+                    if not pending(workspace):
+                        # Let go of the committer lock while appenders are still held off: any
+                        # entry appended after this sees no committer and starts a new one.
+                        fcntl.flock(lock, fcntl.LOCK_UN)
+                        return
+                continue
+            if len(entries) >= max_ops or time.time() - entries[0]["time"] >= window:
+                flush(workspace)
+            else:
+                time.sleep(_POLL)
+    finally:
+        lock.close()
+
+
+def _flush(workspace: Path) -> int:
+    """Commit the journal; the caller holds ``commit.lock``."""
+    state = state_dir(workspace)
+    flushing = state / FLUSHING_FILE
+    if not flushing.exists():  # else a previous flush died before committing: retry its entries first
+        with _locked(workspace, "journal.lock", fcntl.LOCK_EX):
+            journal = state / JOURNAL_FILE
+            if not journal.exists() or journal.stat().st_size == 0:
+                return 0
+            os.replace(journal, flushing)
+
+    entries = [json.loads(line) for line in flushing.read_text().splitlines() if line.strip()]
+    _commit(workspace, entries)
+    flushing.unlink()
+    return len(entries)
+
+
+def _commit(workspace: Path, entries: list[dict]) -> None:
+    """Make one commit covering the paths of all *entries*."""
+    paths = list(dict.fromkeys(path for entry in entries for path in entry["paths"]))
+    if len(entries) == 1:
+        message = entries[0]["message"]
+    else:
+        summary = "\n".join(f"- {entry['message'].splitlines()[0]}" for entry in entries)
+        message = f"novo: {len(entries)} changes\n\n{summary}"
+    git.add_and_commit(workspace, message, paths=paths)
+
+
+@contextmanager
+def _locked(workspace: Path, name: str, operation: int) -> Iterator[None]:
+    with open(state_dir(workspace) / name, "w") as lock:
+        fcntl.flock(lock, operation)
+        yield
+
+
+def _spawn_committer(workspace: Path, window: float | None, max_ops: int | None) -> None:
+    """Start a detached `novo commit --background` process for *workspace*."""
+    cmd = [sys.executable, "-m", "novo", "commit", "--background", "--workspace", str(workspace)]
+    if window is not None:
+        cmd.extend(["--window", str(window)])
+    if max_ops is not None:
+        cmd.extend(["--max-ops", str(max_ops)])
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
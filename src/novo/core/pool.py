@@ -0,0 +1,202 @@
+"""Pre-warmed pool of experiment skeletons.
+
+A skeleton is an experiment directory that has been through ``uv init``
+and its seed (template, dependencies, post-create commands) under a
+placeholder project name, but has no ``.novo.toml`` and is not committed.
+Skeletons are kept per (seed, python) pair in the git-ignored
+``.novo/pool`` directory::
+
+    .novo/pool/<seed>@<python>/
+    ├── building/<id>/     # being scaffolded by `novo pool fill`
+    └── ready/<id>/        # published by rename once complete
+
+``create`` claims a ready skeleton by renaming it onto the new experiment
+directory. Both publishing and claiming are single ``rename`` calls, so two
+processes can never claim the same skeleton. The claimed skeleton's
+placeholder names are then rewritten. After a create, the pool is refilled
+by a detached ``novo pool fill`` process.
+
+Skeletons are built by :func:`novo.core.seed.build_skeleton`, so they keep
+their ``uv.lock`` but not their ``.venv``; ``create`` syncs one into the
+claimed directory.
+"""
+
+import fcntl
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+import tomli_w
+
+from novo.core.seed import build_skeleton, get_seed, rename_project, seed_fingerprint
+from novo.core.workspace import state_dir
+
+POOL_DIR = "pool"
+MARKER_FILE = ".novo-pool.toml"
+
+
+def pool_dir(workspace: Path) -> Path:
+    """Return the workspace's skeleton pool directory."""
+    return state_dir(workspace) / POOL_DIR
+
+
+def _key(seed_name: str, python: str | None) -> str:
+    return f"{seed_name}@{python or 'default'}"
+
+
+def _fingerprint(seed_name: str) -> str:
+    seed = get_seed(seed_name)
+    return seed_fingerprint(seed) if seed is not None else ""
+
+
+def _read_marker(skeleton: Path) -> dict:
+    try:
+        with open(skeleton / MARKER_FILE, "rb") as f:
+            return tomllib.load(f)
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def _discard(skeleton: Path) -> None:
+    """Delete a skeleton, first moving it aside so nobody can claim it half-deleted."""
+    doomed = skeleton.parent.parent / f"evicted-{skeleton.name}"
+    try:
+        os.rename(skeleton, doomed)
+    except OSError:
+        return  # already claimed or discarded
+    shutil.rmtree(doomed, ignore_errors=True)
+
+
+def claim(
+    workspace: Path, seed_name: str, python: str | None, exp_dir: Path, evict_stale: bool = True
+) -> bool:
+    """Move a ready skeleton for (seed, python) onto *exp_dir*.
+
+    *exp_dir* may already exist as an empty directory (reserving the name);
+    the rename replaces it. With *evict_stale*, skeletons built from an
+    older version of the seed are discarded instead of used. Returns
+    whether a skeleton was claimed.
+    """
+    ready = pool_dir(workspace) / _key(seed_name, python) / "ready"
+    try:
+        candidates = sorted(os.listdir(ready))
+    except FileNotFoundError:
+        return False
+
+    fingerprint = _fingerprint(seed_name) if evict_stale else None
+    for name in candidates:
+        skeleton = ready / name
+        if evict_stale and _read_marker(skeleton).get("fingerprint") != fingerprint:
+            _discard(skeleton)
+            continue
+        try:
+            os.rename(skeleton, exp_dir)
+        except FileNotFoundError:
+            continue  # claimed by a concurrent create
+        (exp_dir / MARKER_FILE).unlink(missing_ok=True)
+        rename_project(exp_dir, exp_dir.name)
+        return True
+    return False
+
+
+def fill(
+    workspace: Path, seed_name: str, python: str | None, size: int, evict_stale: bool = True
+) -> int:
+    """Build skeletons until *size* are ready for (seed, python).
+
+    Holds a per-pool lock; returns 0 immediately if another fill already
+    holds it. Stale skeletons are evicted first. Returns how many
+    skeletons were built.
+    """
+    key_dir = pool_dir(workspace) / _key(seed_name, python)
+    ready = key_dir / "ready"
+    building = key_dir / "building"
+    ready.mkdir(parents=True, exist_ok=True)
+
+    with open(key_dir / ".lock", "w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return 0
+
+        # Leftovers from an interrupted fill
+        shutil.rmtree(building, ignore_errors=True)
+        building.mkdir()
+
+        seed = get_seed(seed_name)
+        fingerprint = seed_fingerprint(seed) if seed is not None else ""
+        if evict_stale:
+            for name in os.listdir(ready):
+                if _read_marker(ready / name).get("fingerprint") != fingerprint:
+                    _discard(ready / name)
+
+        built = 0
+        while len(os.listdir(ready)) < size:
+            skeleton = Path(tempfile.mkdtemp(dir=building))
+            try:
+                build_skeleton(seed, skeleton, python)
+                marker = {"seed": seed_name, "python": python or "", "fingerprint": fingerprint}
+                with open(skeleton / MARKER_FILE, "wb") as f:
+                    tomli_w.dump(marker, f)
+                os.rename(skeleton, ready / skeleton.name)
+            except BaseException:
+                shutil.rmtree(skeleton, ignore_errors=True)
+                raise
+            built += 1
+        return built
+
+
+def refill_async(workspace: Path, seed_name: str, python: str | None, size: int, evict_stale: bool) -> None:
+    """Top up the (seed, python) pool of *workspace* to *size* in a detached `novo pool fill` process."""
+    cmd = [
+        sys.executable, "-m", "novo", "pool", "fill", "--seed", seed_name, "--size", str(size),
+        "--workspace", str(workspace), "--evict-stale" if evict_stale else "--keep-stale",
+    ]
+    if python:
+        cmd.extend(["--python", python])
+    subprocess.Popen(
+        cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def status(workspace: Path) -> list[tuple[str, str, int]]:
+    """Return ``(seed, python, ready skeletons)`` for every pool."""
+    root = pool_dir(workspace)
+    if not root.exists():
+        return []
+    result = []
+    for key_dir in sorted(root.iterdir()):
+        if not key_dir.is_dir() or "@" not in key_dir.name:
+            continue
+        seed_name, _, python = key_dir.name.rpartition("@")
+        ready = key_dir / "ready"
+        count = len(os.listdir(ready)) if ready.exists() else 0
+        result.append((seed_name, python, count))
+    return result
+
+
+def clear(workspace: Path) -> int:
+    """Discard every pooled skeleton. Returns how many were removed."""
+    root = pool_dir(workspace)
+    if not root.exists():
+        return 0
+    removed = 0
+    for key_dir in root.iterdir():
+        ready = key_dir / "ready"
+        if ready.is_dir():
+            for name in os.listdir(ready):
+                _discard(ready / name)
+                removed += 1
+    return removed
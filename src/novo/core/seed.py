@@ -1,10 +1,22 @@
 """Seed management."""
 
+import errno
+import fcntl
 import fnmatch
+import hashlib
+import json
+import os
+import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 if sys.version_info >= (3, 11):
     import tomllib
@@ -13,9 +25,28 @@ else:
 
 import tomli_w
 
-from novo.models.seed import Seed
+from novo.core import blobs
+from novo.models.seed import Seed, SeedDependencies, SeedFiles, SeedPostCreate
 from novo.utils import uv
-from novo.utils.paths import builtin_seeds_dir, seeds_dir
+from novo.utils.paths import bakes_dir, builtin_seeds_dir, lock_cache_dir, seed_registry_file, seeds_dir
+
+# Manifest replacing template/ in a packed seed (see core.blobs)
+MANIFEST_FILE = "template.toml"
+
+# Linux ioctl that clones a whole file copy-on-write (btrfs, XFS, bcachefs, ...)
+_FICLONE = 0x40049409
+# errnos meaning "can't clone/link here" (rather than a real I/O failure)
+_NO_CLONE = frozenset({errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EINVAL, errno.ENOTTY, errno.ENOSYS})
+_NO_LINK = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP})
+
+
+class CopyStats(NamedTuple):
+    """Outcome of a template copy."""
+
+    mode: str = "copy"  # How the shared bytes were placed: reflink, hardlink, or copy (nothing shared)
+    files: int = 0
+    bytes: int = 0
+    shared: int = 0  # Bytes reflinked or hardlinked instead of written
 
 
 def _load_seed_from_dir(seed_dir: Path, builtin: bool = False) -> Seed | None:
@@ -40,78 +71,714 @@ def _load_seed_from_dir(seed_dir: Path, builtin: bool = False) -> Seed | None:
     return Seed(**seed_data)
 
 
+# Parsed seed manifests are kept in a JSON registry in the cache dir, so
+# lookups re-parse (and re-validate) only seeds that changed:
+#
+#   roots: {root dir: {"sig": [mtime_ns] | None, "dirs": [seed dir, ...], "builtin": bool}}
+#   seeds: {seed dir: {"sig": [dir mtime_ns, toml mtime_ns, toml size] | None, "seed": dict | None}}
+#   names: {seed name: seed dir}  (first seed with a name wins, built-ins first)
+#
+# A signature this close to the scan is stored as None ("recheck"), since
+# filesystem timestamps are coarse and a change in the same tick would
+# otherwise look unchanged.
+_REGISTRY_VERSION = 1
+_RACY_NS = 2_000_000_000
+
+_registry: dict | None = None  # loaded once per process, revalidated on every lookup
+_registry_lock = threading.Lock()  # serializes loading, refreshing and saving it
+
+
+def _seed_roots() -> list[tuple[Path, bool]]:
+    return [(builtin_seeds_dir(), True), (seeds_dir(), False)]
+
+
+def _stamp(path: Path) -> list[int]:
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return [-1, -1]
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _seed_sig(seed_dir: str) -> list[int]:
+    return _stamp(Path(seed_dir))[:1] + _stamp(Path(seed_dir) / "seed.toml")
+
+
+def _settled(sig: list[int], mtimes: int, now: int) -> list[int] | None:
+    """*sig*, or None if any of its first *mtimes* entries is too recent to trust."""
+    return None if max(sig[:mtimes]) > now - _RACY_NS else sig
+
+
+def _load_registry() -> dict:
+    global _registry
+    if _registry is None:
+        try:
+            with open(seed_registry_file()) as f:
+                _registry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            _registry = {}
+        if _registry.get("version") != _REGISTRY_VERSION:
+            _registry = {"version": _REGISTRY_VERSION, "roots": {}, "seeds": {}, "names": {}}
+    return _registry
+
+
+def _refresh_registry() -> dict:
+    """Revalidate every registry entry, re-parsing seeds whose signature changed."""
+    global _registry
+    with _registry_lock:
+        old = _load_registry()
+        now = time.time_ns()
+        new: dict = {"version": _REGISTRY_VERSION, "roots": {}, "seeds": {}, "names": {}}
+
+        for root, builtin in _seed_roots():
+            sig = _stamp(root)[:1]
+            cached = old["roots"].get(str(root))
+            if cached is not None and cached["sig"] == sig:
+                dirs = cached["dirs"]
+            else:
+                dirs = sorted(str(item) for item in root.iterdir() if item.is_dir()) if root.is_dir() else []
+            new["roots"][str(root)] = {"sig": _settled(sig, 1, now), "dirs": dirs, "builtin": builtin}
+
+            for seed_dir in dirs:
+                sig = _seed_sig(seed_dir)
+                entry = old["seeds"].get(seed_dir)
+                if entry is None or entry["sig"] != sig:
+                    seed = _load_seed_from_dir(Path(seed_dir), builtin=builtin)
+                    entry = {"sig": _settled(sig, 2, now), "seed": seed.model_dump() if seed else None}
+                new["seeds"][seed_dir] = entry
+                if entry["seed"] is not None:
+                    new["names"].setdefault(entry["seed"]["name"], seed_dir)
+
+        _registry = new
+        if new != old:
+            _save_registry(new)
+        return new
+
+
+def _save_registry(registry: dict) -> None:
+    path = seed_registry_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(registry, f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _seed_from_registry(data: dict) -> Seed:
+    """Rebuild a Seed from registry data without re-running validation."""
+    return Seed.model_construct(
+        **{
+            **data,
+            "dependencies": SeedDependencies.model_construct(**data["dependencies"]),
+            "post_create": SeedPostCreate.model_construct(**data["post_create"]),
+            "files": SeedFiles.model_construct(**data["files"]),
+        }
+    )
+
+
 def list_seeds() -> list[Seed]:
     """List all available seeds (built-in + user-installed)."""
-    result = []
-
-    # Built-in seeds
-    builtin = builtin_seeds_dir()
-    if builtin.exists():
-        for item in sorted(builtin.iterdir()):
-            if item.is_dir():
-                seed = _load_seed_from_dir(item, builtin=True)
-                if seed:
-                    result.append(seed)
-
-    # User-installed seeds
-    user_seeds = seeds_dir()
-    if user_seeds.exists():
-        for item in sorted(user_seeds.iterdir()):
-            if item.is_dir():
-                seed = _load_seed_from_dir(item, builtin=False)
-                if seed:
-                    result.append(seed)
-
-    return result
+    registry = _refresh_registry()
+    return [
+        _seed_from_registry(entry["seed"])
+        for root in registry["roots"].values()
+        for entry in (registry["seeds"][seed_dir] for seed_dir in root["dirs"])
+        if entry["seed"] is not None
+    ]
 
 
 def get_seed(name: str) -> Seed | None:
-    """Get a seed by name."""
-    for seed in list_seeds():
-        if seed.name == name:
-            return seed
+    """Get a seed by name.
+
+    When neither seed directory has gained or lost entries, only the named
+    seed is checked for changes; otherwise the whole registry is revalidated.
+    """
+    with _registry_lock:
+        registry = _load_registry()
+    roots = _seed_roots()
+    if list(registry["roots"]) == [str(root) for root, _ in roots] and all(
+        registry["roots"][str(root)]["sig"] == _stamp(root)[:1] for root, _ in roots
+    ):
+        seed_dir = registry["names"].get(name)
+        if seed_dir is not None and registry["seeds"][seed_dir]["sig"] == _seed_sig(seed_dir):
+            return _seed_from_registry(registry["seeds"][seed_dir]["seed"])
+
+    registry = _refresh_registry()
+    seed_dir = registry["names"].get(name)
+    return _seed_from_registry(registry["seeds"][seed_dir]["seed"]) if seed_dir is not None else None
+
+
+def seed_fingerprint(seed: Seed) -> str:
+    """Hash identifying a seed's current contents.
+
+    Covers ``seed.toml`` bytes, the template manifest of a packed seed, and
+    the path, size and mtime of every template file, so any edit to the
+    seed (or a reinstall) changes it without reading template contents.
+    """
+    seed_dir = Path(seed.path)
+    digest = hashlib.sha256()
+    for name in ("seed.toml", MANIFEST_FILE):
+        try:
+            digest.update((seed_dir / name).read_bytes())
+        except FileNotFoundError:
+            pass
+    template_dir = seed_dir / "template"
+    for item in sorted(template_dir.rglob("*")):
+        st = item.stat()
+        digest.update(f"{item.relative_to(template_dir)}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def copy_template(seed: Seed, target_dir: Path, mode: str = "reflink", workers: int = 1) -> CopyStats:
+    """Copy a seed's template files into *target_dir* (which may be a staging dir).
+
+    Reads ``template/``, or the blob store for a packed seed. See
+    ``_place_files`` for *mode* and *workers*.
+    """
+    seed_dir = Path(seed.path)
+    if (seed_dir / "template").exists():
+        return _copy_template(seed_dir / "template", target_dir, seed.files.exclude, mode, workers)
+    manifest = _read_manifest(seed_dir)
+    if manifest is None:
+        return CopyStats()
+    return _copy_manifest(manifest, target_dir, seed.files.exclude, mode, workers)
+
+
+def merge_template(staging_dir: Path, target_dir: Path) -> None:
+    """Move template files staged by ``copy_template`` into an experiment.
+
+    Same rules as copying in place: staged files replace existing ones,
+    except a ``pyproject.toml`` already created by ``uv init``. Moves are
+    renames within the workspace filesystem, so this is cheap.
+    """
+    for item in sorted(staging_dir.rglob("*")):  # parents sort before their children
+        target = target_dir / item.relative_to(staging_dir)
+        if item.is_dir():
+            target.mkdir(parents=True, exist_ok=True)
+        elif not (target.name == "pyproject.toml" and target.exists()):
+            os.replace(item, target)
+
+
+def install_dependencies(seed: Seed, target_dir: Path) -> None:
+    """Install a seed's dependencies into an experiment.
+
+    The first install of a given (seed, requires-python, packages) runs
+    `uv add` and caches the resulting ``uv.lock`` and pyproject dependency
+    block. Later installs drop those in and run `uv sync --locked` (offline
+    first), so nothing is re-resolved. If the cached lock no longer applies,
+    it is discarded and `uv add` runs as before.
+    """
+    packages = seed.dependencies.packages
+    if not packages:
+        return
+
+    pyproject = target_dir / "pyproject.toml"
+    entry = lock_cache_dir() / _lock_key(seed, _requires_python(pyproject), packages)
+    if (entry / "uv.lock").exists():
+        original = pyproject.read_text()
+        try:
+            if _apply_cached_lock(entry, target_dir):
+                sync_environment(target_dir)
+                return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+        # Stale entry: undo it and resolve from scratch, replacing the cache below.
+        pyproject.write_text(original)
+        (target_dir / "uv.lock").unlink(missing_ok=True)
+        shutil.rmtree(entry, ignore_errors=True)
+
+    uv.uv_add(target_dir, packages)
+    _store_lock(entry, target_dir, seed, packages)
+
+
+# Lockfile cache (see install_dependencies). The root project's name in a
+# cached uv.lock is replaced by this placeholder, so any experiment can use it.
+_LOCK_PLACEHOLDER = "novo-locked-project"
+# A top-level ``dependencies = [...]`` array: on one line, or closed by a
+# ``]`` on a line of its own (as uv writes it). Entries can contain brackets
+# themselves (``uvicorn[standard]``), so a match is only trusted once it
+# parses back to the project's dependency list (see _dependencies_block).
+_DEPENDENCIES_RE = re.compile(r"^dependencies = \[(?:[^\n]*\]$|.*?^\])", re.MULTILINE | re.DOTALL)
+
+
+def _lock_key(seed: Seed, requires_python: str, packages: list[str]) -> str:
+    data = json.dumps([seed_fingerprint(seed), requires_python, sorted(packages)])
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
+def _pyproject(path: Path) -> dict:
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f).get("project", {})
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def sync_environment(target_dir: Path) -> None:
+    """Create *target_dir*'s ``.venv`` from its uv.lock, offline first, then online.
+
+    Offline succeeds whenever uv's cache already holds every pinned wheel,
+    which it does for any environment synced before. A no-op without a
+    uv.lock (a seed with no dependencies).
+    """
+    if not (target_dir / "uv.lock").exists():
+        return
+    try:
+        uv.uv_sync_locked(target_dir, offline=True)
+    except subprocess.CalledProcessError:
+        uv.uv_sync_locked(target_dir)
+
+
+def _dependencies_block(text: str) -> re.Match | None:
+    """Find ``[project].dependencies`` in a pyproject's *text*, or ``None``."""
+    try:
+        dependencies = tomllib.loads(text).get("project", {}).get("dependencies")
+    except tomllib.TOMLDecodeError:
+        return None
+    for match in _DEPENDENCIES_RE.finditer(text):
+        try:
+            if tomllib.loads(match.group(0)).get("dependencies") == dependencies:
+                return match
+        except tomllib.TOMLDecodeError:
+            continue
     return None
 
 
-def apply_seed(seed_name: str, target_dir: Path) -> None:
-    """Apply a seed template to an experiment directory."""
-    seed = get_seed(seed_name)
-    if seed is None:
-        return  # No seed found, skip silently
+def _requires_python(pyproject: Path) -> str:
+    return _pyproject(pyproject).get("requires-python", "")
+
+
+def _normalized_name(target_dir: Path) -> str | None:
+    """The project's name as uv writes it in uv.lock (PEP 503 normalized)."""
+    name = _pyproject(target_dir / "pyproject.toml").get("name")
+    return _normalize(name) if name else None
 
-    seed_path = Path(seed.path)
-    template_dir = seed_path / "template"
 
-    if template_dir.exists():
-        _copy_template(template_dir, target_dir, seed.files.exclude)
+def _normalize(name: str) -> str:
+    """PEP 503 normalized project *name*."""
+    return re.sub(r"[-_.]+", "-", name).lower()
 
-    # Install dependencies
-    if seed.dependencies.packages:
-        uv.uv_add(target_dir, seed.dependencies.packages)
 
-    # Run post-create commands
+def _store_lock(entry: Path, target_dir: Path, seed: Seed, packages: list[str]) -> None:
+    """Cache an experiment's freshly resolved uv.lock and dependency block."""
+    name = _normalized_name(target_dir)
+    block = _dependencies_block((target_dir / "pyproject.toml").read_text())
+    try:
+        lock = (target_dir / "uv.lock").read_text()
+    except FileNotFoundError:
+        return
+    if name is None or block is None:
+        return
+
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=entry.parent))
+    (staging / "uv.lock").write_text(lock.replace(f'name = "{name}"', f'name = "{_LOCK_PLACEHOLDER}"'))
+    (staging / "dependencies.toml").write_text(block.group(0))
+    meta = {
+        "seed": seed.name,
+        "requires_python": _requires_python(target_dir / "pyproject.toml"),
+        "packages": packages,
+    }
+    with open(staging / "meta.toml", "wb") as f:
+        tomli_w.dump(meta, f)
+    try:
+        os.rename(staging, entry)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)  # a concurrent create stored it first
+
+
+def _apply_cached_lock(entry: Path, target_dir: Path) -> bool:
+    """Write a cached dependency block and uv.lock into an experiment."""
+    pyproject = target_dir / "pyproject.toml"
+    text = pyproject.read_text()
+    name = _normalized_name(target_dir)
+    current = _dependencies_block(text)
+    if name is None or current is None:
+        return False
+
+    block = (entry / "dependencies.toml").read_text()
+    lock = (entry / "uv.lock").read_text()
+    pyproject.write_text(text[: current.start()] + block + text[current.end() :])
+    (target_dir / "uv.lock").write_text(lock.replace(f'name = "{_LOCK_PLACEHOLDER}"', f'name = "{name}"'))
+    return True
+
+
+def refresh_locks(name: str | None = None) -> int:
+    """Drop cached lockfiles for seed *name* (or every seed). Returns how many."""
+    cache = lock_cache_dir()
+    if not cache.exists():
+        return 0
+    removed = 0
+    for entry in cache.iterdir():
+        if name is not None:
+            try:
+                with open(entry / "meta.toml", "rb") as f:
+                    if tomllib.load(f).get("seed") != name:
+                        continue
+            except (FileNotFoundError, NotADirectoryError, tomllib.TOMLDecodeError):
+                pass  # unreadable entries are dropped too
+        shutil.rmtree(entry, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+def run_post_create(seed: Seed, target_dir: Path) -> None:
+    """Run a seed's post-create commands in an experiment directory."""
     for cmd in seed.post_create.commands:
         subprocess.run(cmd, shell=True, cwd=target_dir, check=False, capture_output=True)
 
 
-def _copy_template(src: Path, dst: Path, exclude: list[str]) -> None:
-    """Copy template files, skipping excluded patterns and not overwriting pyproject.toml."""
-    for item in src.rglob("*"):
-        rel = item.relative_to(src)
+def _copy_template(
+    src: Path, dst: Path, exclude: list[str], mode: str = "reflink", workers: int = 1
+) -> CopyStats:
+    """Copy template files, skipping excluded patterns and not overwriting pyproject.toml.
 
-        # Check exclusions
-        if any(fnmatch.fnmatch(str(rel), pat) or fnmatch.fnmatch(item.name, pat) for pat in exclude):
+    Excluded directories are pruned whole. See ``_place_files`` for *mode*
+    and *workers*.
+    """
+    dst.mkdir(parents=True, exist_ok=True)
+    files: list[_Placement] = []
+    for rel, source, size in _walk_template(src, _compile_excludes(exclude)):
+        target = dst / rel
+        if source is None:
+            target.mkdir(exist_ok=True)
+        # Don't overwrite pyproject.toml (created by uv init)
+        elif not (target.name == "pyproject.toml" and target.exists()):
+            files.append((source, target, size, None))
+    return _place_files(files, mode, workers)
+
+
+def _copy_manifest(
+    manifest: dict, dst: Path, exclude: list[str], mode: str = "reflink", workers: int = 1
+) -> CopyStats:
+    """``_copy_template`` for a packed seed: files come from the blob store."""
+    excluded = _compile_excludes(exclude)
+    dst.mkdir(parents=True, exist_ok=True)
+    for rel in manifest.get("dirs", []):
+        (dst / rel).mkdir(parents=True, exist_ok=True)
+
+    files: list[_Placement] = []
+    for entry in manifest.get("file", []):
+        rel = entry["path"]
+        if any(excluded(part) for part in rel.split("/")) or excluded(rel):
             continue
-
         target = dst / rel
-        if item.is_dir():
-            target.mkdir(parents=True, exist_ok=True)
-        else:
-            # Don't overwrite pyproject.toml (created by uv init)
-            if target.name == "pyproject.toml" and target.exists():
-                continue
-            target.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target)
+        if target.name == "pyproject.toml" and target.exists():
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        files.append((str(blobs.blob_path(entry["sha256"])), target, entry["size"], entry["mode"]))
+    return _place_files(files, mode, workers)
+
+
+def _walk_template(src: Path, excluded: Callable[[str], object]) -> Iterator[tuple[str, str | None, int]]:
+    """Yield ``(relative path, source path, size)`` under *src*, parents first.
+
+    Directories are yielded with a ``None`` source. Excluded entries (by
+    relative path or name) are skipped, and excluded directories pruned.
+    """
+    pending = [""]
+    while pending:
+        rel_dir = pending.pop()
+        with os.scandir(src / rel_dir) as entries:
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                if excluded(rel) or excluded(entry.name):
+                    continue
+                if entry.is_dir():
+                    yield rel, None, 0
+                    pending.append(rel)
+                else:
+                    yield rel, entry.path, entry.stat().st_size
+
+
+# (source, target, size, permission bits to set, or None to keep the source's)
+_Placement = tuple[str, Path, int, int | None]
+
+
+def _place_files(files: list[_Placement], mode: str, workers: int) -> CopyStats:
+    """Put each source file at its target.
+
+    ``reflink`` clones copy-on-write where the filesystem supports FICLONE
+    (copying otherwise), ``copy`` always copies. ``hardlink`` links only
+    read-only sources, i.e. blobs of a packed seed (copying across
+    filesystems): a writable source, such as an unpacked seed's
+    ``template/``, would be edited along with the experiment, so it is
+    reflinked instead. Runs on up to *workers* threads.
+    """
+    cloning = [mode in ("reflink", "hardlink")]  # switched off at the first refusal
+
+    def place(item: _Placement) -> tuple[str, int]:
+        source, target, size, perms = item
+        if mode == "hardlink" and not os.stat(source).st_mode & 0o222:
+            try:
+                target.unlink(missing_ok=True)
+                os.link(source, target)
+                return "hardlink", size
+            except OSError as e:
+                if e.errno not in _NO_LINK:
+                    raise
+        if cloning[0]:
+            try:
+                _clone(source, target)
+                if perms is not None:
+                    os.chmod(target, perms)
+                return "reflink", size
+            except OSError as e:
+                if e.errno not in _NO_CLONE:
+                    raise
+                cloning[0] = False
+        shutil.copy2(source, target)
+        if perms is not None:
+            os.chmod(target, perms)
+        return "copy", 0
+
+    if workers > 1 and len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            placed = list(pool.map(place, files))
+    else:
+        placed = list(map(place, files))
+    methods = {method for method, _ in placed}
+    used = next((method for method in ("hardlink", "reflink") if method in methods), "copy")
+    return CopyStats(used, len(files), sum(item[2] for item in files), sum(shared for _, shared in placed))
+
+
+def _compile_excludes(patterns: list[str]) -> Callable[[str], object]:
+    """Compile fnmatch-style exclude patterns into a single matcher."""
+    if not patterns:
+        return lambda _: None
+    return re.compile("|".join(fnmatch.translate(pat) for pat in patterns)).match
+
+
+def _clone(source: str, target: Path) -> None:
+    """Clone *source* onto *target* copy-on-write (Linux FICLONE), keeping metadata."""
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    shutil.copystat(source, target)
+
+
+# Project name given to skeletons (pool entries, bakes) until they become an
+# experiment; rename_project swaps in the real one.
+PLACEHOLDER_NAME = "novo-skeleton"
+
+# Files generated by `uv init` / `uv add` that carry the project name.
+_NAMED_FILES = ("pyproject.toml", "uv.lock", "main.py", "hello.py", "README.md")
+
+
+def build_skeleton(seed: Seed | None, path: Path, python: str | None = None) -> None:
+    """Run every creation stage into *path* under ``PLACEHOLDER_NAME``.
+
+    Runs ``uv init``, the template copy, dependency install and post-create
+    commands. The resulting ``.venv`` is removed, because virtualenvs embed
+    absolute paths and can't be moved. ``uv.lock`` is kept, so ``uv run`` /
+    ``uv sync`` rebuild the environment from uv's cache without resolving.
+    """
+    uv.uv_init(path, python=python, name=PLACEHOLDER_NAME)
+    if seed is not None:
+        copy_template(seed, path)
+        install_dependencies(seed, path)
+        run_post_create(seed, path)
+    shutil.rmtree(path / ".venv", ignore_errors=True)
+
+
+def rename_project(exp_dir: Path, name: str) -> None:
+    """Replace the skeleton placeholder name in uv-generated files.
+
+    *name* is normalized first, as ``uv init`` writes it.
+    """
+    name = _normalize(name)
+    for filename in _NAMED_FILES:
+        path = exp_dir / filename
+        try:
+            text = path.read_text()
+        except (FileNotFoundError, UnicodeDecodeError):
+            continue
+        if PLACEHOLDER_NAME in text:
+            path.write_text(text.replace(PLACEHOLDER_NAME, name))
+
+
+def _bake_dir(seed_name: str, python: str | None) -> Path:
+    return bakes_dir() / f"{seed_name}@{python or 'default'}"
+
+
+def bake_seed(name: str, python: str | None = None) -> Path:
+    """Bake seed *name* for *python* into a ready-to-copy project tree.
+
+    The tree lives in ``<data dir>/bakes/<seed>@<python>/tree`` with a
+    ``bake.toml`` manifest recording the seed fingerprint it was built
+    from. A rebake replaces the previous artifact atomically. Returns the
+    bake directory.
+    """
+    seed = get_seed(name)
+    if seed is None:
+        raise ValueError(f"Seed '{name}' not found")
+
+    target = _bake_dir(name, python)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".tmp-", dir=target.parent))
+    try:
+        (staging / "tree").mkdir()
+        build_skeleton(seed, staging / "tree", python)
+        manifest = {"seed": name, "python": python or "", "fingerprint": seed_fingerprint(seed)}
+        with open(staging / "bake.toml", "wb") as f:
+            tomli_w.dump(manifest, f)
+
+        old = target.parent / f".old-{staging.name}"
+        if target.exists():
+            os.rename(target, old)
+        os.rename(staging, target)
+        shutil.rmtree(old, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+
+def materialize_bake(seed: Seed, python: str | None, exp_dir: Path) -> bool:
+    """Fill *exp_dir* from the seed's bake, if one matches the seed's current contents.
+
+    Returns False (leaving *exp_dir* untouched) when there is no bake for
+    (seed, python) or the seed changed since it was baked.
+    """
+    bake = _bake_dir(seed.name, python)
+    try:
+        with open(bake / "bake.toml", "rb") as f:
+            manifest = tomllib.load(f)
+    except (FileNotFoundError, tomllib.TOMLDecodeError):
+        return False
+    if manifest.get("fingerprint") != seed_fingerprint(seed):
+        return False
+
+    _copy_template(bake / "tree", exp_dir, [], mode="reflink")  # never hardlinked: rename_project edits in place
+    rename_project(exp_dir, exp_dir.name)
+    return True
+
+
+def _read_manifest(seed_dir: Path) -> dict | None:
+    try:
+        with open(seed_dir / MANIFEST_FILE, "rb") as f:
+            return tomllib.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def _pack_tree(src: Path, seed_dir: Path, exclude: list[str]) -> int:
+    """Store every file under *src* as a blob and write *seed_dir*'s manifest.
+
+    Returns the bytes newly added to the store.
+    """
+    dirs: list[str] = []
+    files: list[dict] = []
+    added = 0
+    for rel, source, size in _walk_template(src, _compile_excludes(exclude)):
+        if source is None:
+            dirs.append(rel)
+            continue
+        digest, new = blobs.put(Path(source))
+        added += size if new else 0
+        files.append({"path": rel, "sha256": digest, "size": size, "mode": os.stat(source).st_mode & 0o777})
+
+    manifest = {"dirs": sorted(dirs), "file": sorted(files, key=lambda entry: entry["path"])}
+    tmp = seed_dir / f".{MANIFEST_FILE}.tmp"
+    with open(tmp, "wb") as f:
+        tomli_w.dump(manifest, f)
+    os.replace(tmp, seed_dir / MANIFEST_FILE)
+    return added
+
+
+def _user_seed(name: str) -> Seed:
+    seed = get_seed(name)
+    if seed is None:
+        raise ValueError(f"Seed '{name}' not found")
+    if seed.builtin:
+        raise ValueError(f"Built-in seed '{name}' can't be changed")
+    return seed
+
+
+def pack_seed(name: str) -> int:
+    """Move a user seed's ``template/`` into the blob store, leaving a manifest.
+
+    Returns the bytes newly added to the store; the rest were already
+    stored for another seed.
+    """
+    return _pack(_user_seed(name))
+
+
+def _pack(seed: Seed) -> int:
+    seed_dir = Path(seed.path)
+    template_dir = seed_dir / "template"
+    if not template_dir.exists():
+        raise ValueError(f"Seed '{seed.name}' has no template/ to pack")
+    added = _pack_tree(template_dir, seed_dir, seed.files.exclude)
+    shutil.rmtree(template_dir)
+    return added
+
+
+def unpack_seed(name: str) -> None:
+    """Restore a packed seed's ``template/`` directory (e.g. to edit it)."""
+    seed = _user_seed(name)
+    seed_dir = Path(seed.path)
+    manifest = _read_manifest(seed_dir)
+    if manifest is None:
+        raise ValueError(f"Seed '{name}' is not packed")
+    staging = Path(tempfile.mkdtemp(prefix=".template-", dir=seed_dir))
+    try:
+        _copy_manifest(manifest, staging, [], mode="copy")
+        os.rename(staging, seed_dir / "template")
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    (seed_dir / MANIFEST_FILE).unlink()
+    collect_garbage()
+
+
+def collect_garbage() -> int:
+    """Delete blobs no user seed's manifest refers to. Returns the bytes freed."""
+    referenced = set()
+    for seed in list_seeds():
+        manifest = _read_manifest(Path(seed.path))
+        if manifest is not None:
+            referenced.update(entry["sha256"] for entry in manifest.get("file", []))
+    return blobs.gc(referenced)
+
+
+class SeedUsage(NamedTuple):
+    """Template size of a seed (or of all seeds)."""
+
+    logical: int  # Sum of file sizes, as copied into an experiment
+    physical: int  # Bytes on disk, counting each stored blob / inode once
+
+
+def template_usage(seeds: list[Seed]) -> tuple[dict[str, SeedUsage], SeedUsage]:
+    """Logical vs physical template size per seed, and for all *seeds* together.
+
+    Files shared through the blob store (or hardlinks) count toward the
+    physical size once per seed, and once in the total.
+    """
+    per_seed: dict[str, SeedUsage] = {}
+    everywhere: dict[object, int] = {}
+    for seed in seeds:
+        template_dir = Path(seed.path) / "template"
+        manifest = None if template_dir.exists() else _read_manifest(Path(seed.path))
+        objects: dict[object, int] = {}
+        logical = 0
+        if manifest is not None:
+            for entry in manifest.get("file", []):
+                objects[entry["sha256"]] = entry["size"]
+                logical += entry["size"]
+        elif template_dir.exists():
+            for _, source, size in _walk_template(template_dir, _compile_excludes([])):
+                if source is not None:
+                    st = os.stat(source)
+                    objects[(st.st_dev, st.st_ino)] = size
+                    logical += size
+        per_seed[seed.name] = SeedUsage(logical, sum(objects.values()))
+        everywhere.update(objects)
+    total = SeedUsage(sum(usage.logical for usage in per_seed.values()), sum(everywhere.values()))
+    return per_seed, total
 
 
 def add_from_git(url: str, name: str | None = None) -> Seed:
@@ -154,19 +821,13 @@ def create_from_experiment(experiment_dir: Path, name: str, description: str = "
         raise FileExistsError(f"Seed '{name}' already exists")
 
     target.mkdir(parents=True)
-    template_dir = target / "template"
-    template_dir.mkdir()
 
-    # Copy relevant files from experiment
-    exclude = {"__pycache__", ".git", ".venv", "*.pyc", ".novo.toml"}
-    for item in experiment_dir.iterdir():
-        if item.name in exclude or item.name.startswith(".venv"):
-            continue
-        dest = template_dir / item.name
-        if item.is_dir():
-            shutil.copytree(item, dest, ignore=shutil.ignore_patterns(*exclude))
-        else:
-            shutil.copy2(item, dest)
+    # Store relevant files from experiment; identical files already stored for other seeds are shared
+    _pack_tree(
+        experiment_dir,
+        target,
+        ["__pycache__", ".git", ".venv*", "*.pyc", ".novo.toml", ".novo-timings.toml"],
+    )
 
     # Write seed.toml
     seed_data = {
@@ -228,4 +889,5 @@ def remove_seed(name: str) -> bool:
         return False
 
     shutil.rmtree(target)
+    collect_garbage()
     return True
@@ -0,0 +1,116 @@
+"""Workspace trash for deleted experiments.
+
+Deleting an experiment renames its directory into ``.novo/trash/`` (one
+``rename``, however large the ``.venv`` and data inside), so it can be
+restored until ``trash.retention_hours`` have passed. Reclaiming the space
+is left to a detached ``novo trash purge``.
+
+Entries are named ``<deleted_at_ns>-<dir_name>``. A purge first renames an
+entry to ``.purging-<entry>``; whichever of a purge and a restore renames
+the entry first wins, so neither ever sees a half-deleted directory.
+"""
+
+import errno
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from novo.core.workspace import state_dir
+
+TRASH_DIR = "trash"
+_PURGING = ".purging-"
+
+
+class TrashEntry(NamedTuple):
+    """An experiment directory waiting in the trash."""
+
+    dir_name: str
+    deleted_at: float  # Unix time
+    path: Path
+
+
+def trash_dir(workspace: Path) -> Path:
+    """Return the workspace's trash directory, creating it if needed."""
+    path = state_dir(workspace) / TRASH_DIR
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def move(workspace: Path, exp_path: Path) -> TrashEntry:
+    """Move an experiment directory into the trash."""
+    deleted_at = time.time_ns()
+    target = trash_dir(workspace) / f"{deleted_at}-{exp_path.name}"
+    try:
+        os.rename(exp_path, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(exp_path, target)  # experiment on another filesystem (a mount point)
+    return TrashEntry(exp_path.name, deleted_at / 1e9, target)
+
+
+def entries(workspace: Path) -> list[TrashEntry]:
+    """Return everything in the trash, most recently deleted first."""
+    root = state_dir(workspace) / TRASH_DIR
+    if not root.exists():
+        return []
+    found = []
+    with os.scandir(root) as it:
+        for entry in it:
+            stamp, sep, dir_name = entry.name.partition("-")
+            if sep and stamp.isdigit() and entry.is_dir(follow_symlinks=False):
+                found.append(TrashEntry(dir_name, int(stamp) / 1e9, Path(entry.path)))
+    return sorted(found, key=lambda e: e.deleted_at, reverse=True)
+
+
+def restore(entry: TrashEntry, target: Path) -> bool:
+    """Move a trashed directory back to *target*. False if it was purged meanwhile."""
+    try:
+        os.rename(entry.path, target)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def expired(workspace: Path, retention: float) -> list[TrashEntry]:
+    """Return entries deleted more than *retention* seconds ago."""
+    cutoff = time.time() - retention
+    return [entry for entry in entries(workspace) if entry.deleted_at <= cutoff]
+
+
+def purge(workspace: Path, retention: float = 0) -> int:
+    """Delete entries older than *retention* seconds for good. Returns the number removed."""
+    root = state_dir(workspace) / TRASH_DIR
+    if not root.exists():
+        return 0
+    removed = 0
+    for entry in expired(workspace, retention):
+        doomed = root / f"{_PURGING}{entry.path.name}"
+        try:
+            os.rename(entry.path, doomed)
+        except FileNotFoundError:
+            continue  # restored or claimed by another purge
+        shutil.rmtree(doomed, ignore_errors=True)
+        removed += 1
+    # Leftovers of an interrupted purge
+    for leftover in root.glob(f"{_PURGING}*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+    return removed
+
+
+def purge_async(workspace: Path, retention: float) -> None:
+    """Reclaim entries older than *retention* seconds in a detached `novo trash purge` process."""
+    subprocess.Popen(
+        [
+            sys.executable, "-m", "novo", "trash", "purge",
+            "--workspace", str(workspace), "--retention", str(retention),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
@@ -0,0 +1,141 @@
+"""Disk usage of experiments, split into venv, data and source.
+
+Sizes are allocated bytes (``st_blocks``, as ``du`` reports them), with
+symlinks counted as themselves. A file is *venv* if it's under a top-level
+``.venv``/``venv``, *data* if it's under a top-level data directory
+(``DATA_DIRS``) or has a data-like suffix (``DATA_SUFFIXES``), and
+*source* otherwise. Hard-linked files (uv links venvs from its cache) are
+counted in full wherever they appear.
+
+Walks are parallel and incremental. Each level of the tree, across every
+experiment being measured, is listed on a thread pool. Each directory is
+remembered as ``(mtime_ns, venv, data, source)`` for the files directly in
+it, and a directory whose mtime is unchanged keeps those totals and its
+known subdirectories without being listed again. As with
+``core.activity``, a file that grows in place (a log being appended to)
+doesn't change its directory's mtime; a full rescan picks it up.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+VENV_DIRS = frozenset({".venv", "venv"})
+DATA_DIRS = frozenset(
+    {"data", "datasets", "outputs", "output", "results", "checkpoints", "models", "runs", "logs", "wandb", "mlruns"}
+)
+DATA_SUFFIXES = frozenset(
+    {
+        ".csv", ".tsv", ".parquet", ".feather", ".arrow", ".jsonl",
+        ".npy", ".npz", ".h5", ".hdf5", ".pkl", ".pickle",
+        ".pt", ".pth", ".ckpt", ".safetensors", ".onnx", ".bin",
+        ".db", ".sqlite", ".zip", ".gz", ".tar", ".zst", ".xz",
+    }
+)
+
+# Relative directory path ("" for the experiment root) -> (mtime_ns, venv, data, source)
+DirCache = dict[str, tuple[int, int, int, int]]
+
+
+class Usage(NamedTuple):
+    """Bytes on disk for one experiment."""
+
+    venv: int = 0
+    data: int = 0
+    source: int = 0
+    archive: int = 0  # compressed archive in .novo/archive (see core.archive)
+
+    @property
+    def total(self) -> int:
+        return self.venv + self.data + self.source + self.archive
+
+
+def _parent(rel: str) -> str:
+    return rel.rpartition("/")[0]
+
+
+def _visit(root: str, rel: str, cached: tuple[int, int, int, int] | None, known: list[str]):
+    """Measure one directory's own files. Returns ``(entry, subdirectories)``, or ``(None, [])`` if gone."""
+    path = os.path.join(root, rel) if rel else root
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return None, []
+    if cached is not None and cached[0] == mtime_ns:
+        return cached, known
+
+    top = rel.partition("/")[0]
+    in_venv = top in VENV_DIRS
+    in_data = top in DATA_DIRS
+    venv = data = source = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(f"{rel}/{entry.name}" if rel else entry.name)
+                        continue
+                    size = entry.stat(follow_symlinks=False).st_blocks * 512
+                except OSError:
+                    continue
+                if in_venv:
+                    venv += size
+                elif in_data or os.path.splitext(entry.name)[1].lower() in DATA_SUFFIXES:
+                    data += size
+                else:
+                    source += size
+    except OSError:
+        return None, []
+    return (mtime_ns, venv, data, source), subdirs
+
+
+def scan(
+    roots: Mapping[str, str | os.PathLike],
+    caches: Mapping[str, DirCache] | None = None,
+    workers: int = 1,
+) -> dict[str, DirCache]:
+    """Walk every root (keyed by name), reusing *caches* where directory mtimes are unchanged.
+
+    Returns the new cache per key; ``total(result[key])`` is that root's usage.
+    """
+    caches = caches or {}
+    children: dict[tuple[str, str], list[str]] = {}
+    for key, cache in caches.items():
+        for rel in cache:
+            if rel:
+                children.setdefault((key, _parent(rel)), []).append(rel)
+
+    def visit(item: tuple[str, str]):
+        key, rel = item
+        cache = caches.get(key, {})
+        return _visit(os.fspath(roots[key]), rel, cache.get(rel), children.get((key, rel), []))
+
+    results: dict[str, DirCache] = {key: {} for key in roots}
+    level = [(key, "") for key in roots]
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    run: Callable[[Callable, Iterable], Iterable] = pool.map if pool else map
+    try:
+        while level:
+            next_level = []
+            for (key, rel), (entry, subdirs) in zip(level, run(visit, level)):
+                if entry is None:
+                    continue
+                results[key][rel] = entry
+                next_level.extend((key, sub) for sub in subdirs)
+            level = next_level
+    finally:
+        if pool:
+            pool.shutdown()
+    return results
+
+
+def total(dirs: DirCache, archive: int = 0) -> Usage:
+    """Sum a scan's per-directory entries into a ``Usage``."""
+    venv = data = source = 0
+    for _, v, d, s in dirs.values():
+        venv += v
+        data += d
+        source += s
+    return Usage(venv, data, source, archive)
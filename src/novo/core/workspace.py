@@ -1,20 +1,56 @@
 """Workspace init and management."""
 
+import json
+import os
 from pathlib import Path
 
 from novo.core import git
-from novo.core.config import get_workspace_path, load_config, save_config
+from novo.core.config import current_config, get_workspace_path, save_config
+from novo.models.config import NovoConfig
 
+STATE_DIR = ".novo"
+STATE_FILE = "state"  # marker: the git dir the workspace was last verified against
 
-def ensure_initialized() -> Path:
-    """Ensure the workspace exists and is a git repo. Returns workspace path."""
-    config = load_config()
+# Per-process memo: workspace -> (git dir, st_dev, st_ino) verified this process
+_verified: dict[Path, tuple[str, int, int]] = {}
+
+
+def state_dir(workspace: Path) -> Path:
+    """Return the workspace's private state directory, creating it if needed.
+
+    Holds novo's own bookkeeping (index, caches). A ``.gitignore`` containing
+    ``*`` keeps it out of the workspace repo, including for workspaces
+    initialized before the directory existed.
+    """
+    path = workspace / STATE_DIR
+    if not path.is_dir():
+        path.mkdir(parents=True, exist_ok=True)
+        (path / ".gitignore").write_text("*\n")
+    return path
+
+
+def ensure_initialized(config: NovoConfig | None = None) -> Path:
+    """Ensure the workspace exists and is a git repo. Returns workspace path.
+
+    Verified once: ``.novo/state`` records the git dir and its inode, and a
+    per-process memo remembers it. Afterwards the check is a single ``stat``
+    of the git dir; ``git rev-parse`` (and ``git init`` if needed) only runs
+    again when the marker is missing or the git dir was removed or replaced.
+    """
+    if config is None:
+        config = current_config()
     workspace = get_workspace_path(config)
 
+    known = _verified.get(workspace) or _read_marker(workspace)
+    if known is not None and _identity(known[0]) == known[1:]:
+        _verified[workspace] = known
+        return workspace
+
     if not workspace.exists():
         workspace.mkdir(parents=True, exist_ok=True)
 
-    if not git.is_git_repo(workspace):
+    git_dir = git.git_dir(workspace)
+    if git_dir is None:
         git.init(workspace)
         # Create .gitignore
         gitignore = workspace / ".gitignore"
@@ -22,6 +58,7 @@ def ensure_initialized() -> Path:
             "# Python\n__pycache__/\n*.pyc\n*.pyo\n.venv/\n*.egg-info/\ndist/\nbuild/\n"
         )
         git.add_and_commit(workspace, "novo: initialize workspace")
+        git_dir = git.git_dir(workspace)
 
     # Save config if it doesn't exist yet
     from novo.utils.paths import config_file
@@ -29,4 +66,30 @@ def ensure_initialized() -> Path:
     if not config_file().exists():
         save_config(config)
 
+    _verified[workspace] = _write_marker(workspace, str(git_dir))
     return workspace
+
+
+def _identity(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _read_marker(workspace: Path) -> tuple[str, int, int] | None:
+    try:
+        data = json.loads((workspace / STATE_DIR / STATE_FILE).read_text())
+        return data["git_dir"], data["dev"], data["ino"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_marker(workspace: Path, git_dir: str) -> tuple[str, int, int]:
+    dev, ino = _identity(git_dir)
+    marker = state_dir(workspace) / STATE_FILE
+    tmp = marker.with_name(f".{STATE_FILE}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"git_dir": git_dir, "dev": dev, "ino": ino}) + "\n")
+    os.replace(tmp, marker)
+    return git_dir, dev, ino
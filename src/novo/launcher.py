@@ -0,0 +1,78 @@
+"""Console entry point for the `novo` script.
+
+`novo _open-path NAME` runs on every `novo open` through the shell
+integration, so it is answered here from the precomputed name→path map
+(see ``core.index.write_path_map``) without importing Typer, Rich, Pydantic
+or the CLI modules, and without touching git. Anything the map can't answer
+— a missing or stale map, an unknown name, a vanished directory, an
+archived experiment that needs unpacking — falls through to the full CLI,
+which revalidates the index and rewrites the map.
+"""
+
+import os
+import sys
+
+# Mirrors core.archive (ARCHIVE_DIR, SUFFIXES), which is too heavy to import here.
+_ARCHIVES = (".novo", "archive")
+_ARCHIVE_SUFFIXES = (".tar.zst", ".tar.xz")
+
+
+def _fast_open_path(name: str) -> str | None:
+    """Resolve *name* to an experiment path from the map, or None to fall back."""
+    from novo.utils.paths import config_file, open_paths_file
+
+    map_file = open_paths_file()
+    try:
+        map_mtime = os.stat(map_file).st_mtime_ns
+        with open(map_file, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    # A config edit (e.g. a new workspace.path) may have made the map stale.
+    try:
+        if os.stat(config_file()).st_mtime_ns > map_mtime:
+            return None
+    except OSError:
+        pass
+
+    if not lines or not lines[0].startswith("workspace\t"):
+        return None
+    workspace = lines[0].partition("\t")[2]
+
+    # Directory names win over experiment names, like core.index.find.
+    match = None
+    for line in lines[1:]:
+        dir_name, _, exp_name = line.partition("\t")
+        if dir_name == name:
+            match = dir_name
+            break
+        if match is None and exp_name == name:
+            match = dir_name
+    if match is None:
+        return None
+
+    path = os.path.join(workspace, match)
+    if not os.path.isdir(path):
+        return None
+    for suffix in _ARCHIVE_SUFFIXES:
+        if os.path.exists(os.path.join(workspace, *_ARCHIVES, match + suffix)):
+            return None
+    return path
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run novo, short-circuiting `_open-path` when the map can answer it."""
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) == 2 and args[0] == "_open-path":
+        path = _fast_open_path(args[1])
+        if path is not None:
+            sys.stdout.write(path + "\n")
+            return
+
+    from novo.cli import app
+
+    if argv is None:
+        app()
+    else:
+        app(args)
@@ -1,6 +1,8 @@
 """NovoConfig pydantic model."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class WorkspaceConfig(BaseModel):
@@ -23,9 +25,79 @@ class NamingConfig(BaseModel):
     date_prefix: bool = True
 
 
+class IndexConfig(BaseModel):
+    """Workspace metadata index settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    scan_workers: int = Field(default=8, ge=1)  # Threads reading .novo.toml on a full scan
+    activity_interval: float = Field(default=60.0, ge=0)  # Seconds between background activity rescans (0: always)
+
+
+class BatchConfig(BaseModel):
+    """Batch creation settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    workers: int = Field(default=4, ge=1)  # Experiments scaffolded concurrently by `novo new --from-file`
+
+
+class PoolConfig(BaseModel):
+    """Pre-warmed experiment pool settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    size: int = Field(default=0, ge=0)  # Skeletons kept ready per (seed, python); 0 disables the pool
+    evict_stale: bool = True  # Discard skeletons built from an older version of their seed
+
+
+class TemplateConfig(BaseModel):
+    """Seed template copy settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    copy_mode: Literal["copy", "hardlink", "reflink"] = "reflink"  # reflink falls back to copy where unsupported
+    copy_workers: int = Field(default=4, ge=1)  # Threads copying template files
+
+
+class CommitConfig(BaseModel):
+    """Auto-commit batching settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    deferred: bool = False  # Journal mutations and let a background committer batch them
+    window: float = Field(default=2.0, ge=0)  # Seconds a journaled change waits for others to share its commit
+    max_ops: int = Field(default=50, ge=1)  # Commit as soon as this many changes are waiting
+
+
+class TrashConfig(BaseModel):
+    """Deleted-experiment trash settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    retention_hours: float = Field(default=24.0, ge=0)  # How long `novo restore` can undo a delete; 0 reclaims at once
+
+
+class ArchiveConfig(BaseModel):
+    """Cold-storage archive settings."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    compression: Literal["zst", "xz"] = "zst"  # zst needs the zstandard package (novo[archive]); else xz
+    level: int = Field(default=6, ge=1, le=19)  # zstd level; capped to 9 as an xz preset
+    workers: int = Field(default=0, ge=0)  # zstd compression threads; 0 = one per core
+
+
 class NovoConfig(BaseModel):
     """Global novo configuration, stored in config.toml."""
 
     workspace: WorkspaceConfig = Field(default_factory=WorkspaceConfig)
     defaults: DefaultsConfig = Field(default_factory=DefaultsConfig)
     naming: NamingConfig = Field(default_factory=NamingConfig)
+    index: IndexConfig = Field(default_factory=IndexConfig)
+    batch: BatchConfig = Field(default_factory=BatchConfig)
+    pool: PoolConfig = Field(default_factory=PoolConfig)
+    template: TemplateConfig = Field(default_factory=TemplateConfig)
+    commit: CommitConfig = Field(default_factory=CommitConfig)
+    trash: TrashConfig = Field(default_factory=TrashConfig)
+    archive: ArchiveConfig = Field(default_factory=ArchiveConfig)
@@ -1,8 +1,10 @@
 """Experiment pydantic model."""
 
+from collections.abc import Sequence
 from datetime import datetime
+from operator import itemgetter
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class Experiment(BaseModel):
@@ -15,3 +17,109 @@ class Experiment(BaseModel):
     python: str = ""
     created_at: datetime = Field(default_factory=datetime.now)
     dir_name: str = ""  # The actual directory name (may include date prefix)
+
+
+class ExperimentSpec(BaseModel):
+    """Request to create one experiment, as read from a batch spec file.
+
+    Unset fields fall back to the configured defaults, as with `novo new`.
+    """
+
+    name: str
+    seed: str | None = None
+    python: str | None = None
+    description: str = ""
+    tags: list[str] = Field(default_factory=list)
+    no_date: bool = False
+
+
+# Separator for tags packed into a single string (see ExperimentRecord).
+TAG_SEPARATOR = "\x1f"
+
+
+def pack_tags(tags: list[str] | tuple[str, ...]) -> str:
+    """Pack tags into one string for compact storage."""
+    return TAG_SEPARATOR.join(tags)
+
+
+class ExperimentRecord(tuple):
+    """Read-only, tuple-backed view of an experiment for bulk read paths.
+
+    Built directly from an index row, skipping pydantic entirely. Fields are
+    stored in row order — ``(dir_name, name, seed, tags, description, python,
+    created_at)`` — with tags packed by ``pack_tags`` and ``created_at`` as an
+    ISO string; both are decoded only when accessed. ``to_dict`` dumps the
+    stored values straight back out. Call ``to_experiment()`` when a
+    validated, mutable ``Experiment`` is needed.
+    """
+
+    __slots__ = ()
+
+    #: Keys of ``to_dict``, in output order; valid ``fields`` projections.
+    FIELDS = ("name", "seed", "tags", "description", "python", "created_at", "dir_name")
+
+    def __new__(
+        cls,
+        dir_name: str,
+        name: str,
+        seed: str,
+        tags: str,
+        description: str,
+        python: str,
+        created_at: str,
+    ) -> "ExperimentRecord":
+        return tuple.__new__(cls, (dir_name, name, seed, tags, description, python, created_at))
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "ExperimentRecord":
+        """Wrap an index row without copying or validating its fields."""
+        return tuple.__new__(cls, row)
+
+    dir_name = property(itemgetter(0), doc="The actual directory name.")
+    name = property(itemgetter(1))
+    seed = property(itemgetter(2))
+    description = property(itemgetter(4))
+    python = property(itemgetter(5))
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        packed = self[3]
+        return tuple(packed.split(TAG_SEPARATOR)) if packed else ()
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self[6])
+
+    def __repr__(self) -> str:
+        return f"ExperimentRecord(name={self.name!r}, dir_name={self.dir_name!r})"
+
+    def to_dict(self, fields: Sequence[str] | None = None) -> dict:
+        """JSON-ready dict, matching ``Experiment.model_dump(mode="json")``.
+
+        *fields* projects the output onto those keys, in that order.
+        """
+        dir_name, name, seed, _, description, python, created_at = self
+        data = {
+            "name": name,
+            "seed": seed,
+            "tags": list(self.tags),
+            "description": description,
+            "python": python,
+            "created_at": created_at,
+            "dir_name": dir_name,
+        }
+        if fields is None:
+            return data
+        return {field: data[field] for field in fields}
+
+    def to_experiment(self) -> Experiment:
+        """Validate into a full pydantic ``Experiment``."""
+        return Experiment.model_validate(self.to_dict())
+
+
+_EXPERIMENT_LIST = TypeAdapter(list[Experiment])
+
+
+def validate_experiments(items: list[dict]) -> list[Experiment]:
+    """Validate many raw experiment dicts in one batched pydantic call."""
+    return _EXPERIMENT_LIST.validate_python(items)
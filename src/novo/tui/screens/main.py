@@ -102,11 +102,13 @@ class MainScreen(Screen):
     # ---- Experiments tab ----
 
     def _refresh_experiments(self) -> None:
-        from novo.core.experiment import list_all
+        from novo.core.config import current_config
+        from novo.core.experiment import archived_names, list_all
 
-        experiments = list_all()
+        config = current_config()
+        experiments = list_all(config=config)
         exp_list = self.query_one("#experiment-list", ExperimentList)
-        exp_list.set_experiments(experiments)
+        exp_list.set_experiments(experiments, archived_names(config))
 
         self.app.title = f"novo - {len(experiments)} experiments"
 
@@ -119,10 +121,19 @@ class MainScreen(Screen):
         card.update_experiment(event.experiment)
 
     def on_experiment_list_activated(self, event: ExperimentList.Activated) -> None:
-        from novo.core.experiment import get_path
+        from novo.core.config import current_config
+        from novo.core.experiment import archived_names, get_path, unarchive
         from novo.utils.terminal import open_terminal_at
 
-        path = get_path(event.experiment.name)
+        config = current_config()
+        if event.experiment.dir_name in archived_names(config):
+            try:
+                unarchive(event.experiment.dir_name, config=config)
+            except Exception as e:
+                self.notify(f"Unarchive: {e}", severity="warning")
+            self._refresh_experiments()
+
+        path = get_path(event.experiment.name, config)
         if path:
             open_terminal_at(path)
             self.notify(f"Opened terminal at {path.name}")
@@ -252,7 +263,8 @@ class MainScreen(Screen):
         if confirmed:
             from novo.core.experiment import delete
 
-            delete(name)
+            if delete(name):
+                self.notify(f"Deleted: {name} (undo with `novo restore`)")
             self._refresh_experiments()
 
     def action_help(self) -> None:
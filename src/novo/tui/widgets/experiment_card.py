@@ -1,14 +1,19 @@
 """Detail panel for the selected experiment."""
 
 from datetime import datetime
+from pathlib import Path
 
 from rich.console import Group
 from rich.text import Text
 
+from textual import work
 from textual.containers import VerticalScroll
 from textual.widgets import Static
 
-from novo.models.experiment import Experiment
+from novo.core.usage import Usage
+from novo.models.config import NovoConfig
+from novo.models.experiment import Experiment, ExperimentRecord
+from novo.utils.format import format_size
 from novo.tui.widgets.file_tree import build_tree
 
 # Tag badge colors: amber, cyan, teal, pink, purple (shared with experiment_list)
@@ -97,7 +102,8 @@ class ExperimentCard(VerticalScroll):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._experiment: Experiment | None = None
+        self._experiment: Experiment | ExperimentRecord | None = None
+        self._usage: Usage | None = None
 
     def compose(self):
         yield Static("", id="card-content")
@@ -140,28 +146,59 @@ class ExperimentCard(VerticalScroll):
         parts.append(Text(""))
 
         # Workspace path
-        from novo.core.config import load_config
+        from novo.core.config import get_workspace_path
 
-        config = load_config()
         ws = Text()
         ws.append("  Workspace: ", style="dim")
-        ws.append(str(config.workspace_dir), style="dim italic")
+        ws.append(str(get_workspace_path()), style="dim italic")
         parts.append(ws)
 
         content.update(Group(*parts))
 
-    def update_experiment(self, experiment: Experiment | None) -> None:
-        """Update the displayed experiment details."""
+    def update_experiment(self, experiment: Experiment | ExperimentRecord | None) -> None:
+        """Update the displayed experiment details.
+
+        The size field fills in once ``_load_size`` finishes, so moving the
+        highlight never waits on a disk usage scan.
+        """
         self._experiment = experiment
-        content = self.query_one("#card-content", Static)
+        self._usage = None
 
         if experiment is None:
             self.show_welcome()
             return
 
+        from novo.core.config import current_config
         from novo.core.experiment import get_path
 
-        path = get_path(experiment.name)
+        config = current_config()
+        path = get_path(experiment.name, config)
+        self._render_experiment(experiment, path)
+        if path:
+            self._load_size(experiment, path, config)
+
+    @work(thread=True, exclusive=True, group="experiment-size")
+    def _load_size(self, experiment: Experiment | ExperimentRecord, path: Path, config: NovoConfig) -> None:
+        """Compute *experiment*'s disk usage off the UI thread, then show it."""
+        from textual.worker import get_current_worker
+
+        from novo.core.experiment import disk_usage
+
+        size = disk_usage([experiment.dir_name], config=config).get(experiment.dir_name)
+        if not get_current_worker().is_cancelled:
+            self.app.call_from_thread(self._show_size, experiment, path, size)
+
+    def _show_size(self, experiment: Experiment | ExperimentRecord, path: Path, size: Usage | None) -> None:
+        """Re-render with *size*, unless the selection has moved on."""
+        if experiment is not self._experiment or size is None:
+            return
+        self._usage = size
+        self._render_experiment(experiment, path)
+
+    def _render_experiment(self, experiment: Experiment | ExperimentRecord, path: Path | None) -> None:
+        """Render *experiment*'s details (size from ``self._usage``, if known yet)."""
+        content = self.query_one("#card-content", Static)
+        size = self._usage
 
         has_claude = bool(path and (path / ".claude").exists())
         has_agents = bool(path and (path / ".agents").exists())
@@ -190,6 +227,14 @@ class ExperimentCard(VerticalScroll):
         parts.append(_field("\u2736", "Seed", experiment.seed))
         parts.append(_field("\u2666", "Python", experiment.python or "system default"))
         parts.append(_field("\u2192", "Directory", experiment.dir_name))
+        if path and size is None:
+            parts.append(_field("\u25a4", "Size", "\u2026"))
+        elif size is not None:
+            breakdown = " \u00b7 ".join(
+                f"{label} {format_size(part)}"
+                for label, part in (("venv", size.venv), ("data", size.data), ("source", size.source))
+            )
+            parts.append(_field("\u25a4", "Size", f"{format_size(size.total)}  ({breakdown})"))
 
         parts.append(Text(""))
 
@@ -8,19 +8,22 @@ from textual.message import Message
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
 
-from novo.models.experiment import Experiment
+from novo.models.experiment import ExperimentRecord
 
 # Tag badge colors: amber, cyan, teal, pink, purple
 TAG_COLORS = ["#FAC898", "#89DDFF", "#5DE4C7", "#D0679D", "#C792EA"]
 TAG_BG_COLORS = ["#3a2e1a", "#1a2e3a", "#1a3a32", "#3a1a2e", "#2e1a3a"]
 
 
-def _render_experiment(exp: Experiment) -> Text:
+def _render_experiment(exp: ExperimentRecord, archived: bool = False) -> Text:
     """Build a rich multi-line renderable for a list item."""
     text = Text()
 
     # Line 1: experiment name
-    text.append(f"  {exp.dir_name}\n", style="bold")
+    text.append(f"  {exp.dir_name}", style="bold")
+    if archived:
+        text.append("  archived", style="#FAC898")
+    text.append("\n")
 
     # Line 2: date + seed
     created = exp.created_at.strftime("%b %d, %Y")
@@ -54,28 +57,30 @@ class ExperimentList(OptionList):
     class Selected(Message):
         """Posted when an experiment is selected."""
 
-        def __init__(self, experiment: Experiment) -> None:
+        def __init__(self, experiment: ExperimentRecord) -> None:
             self.experiment = experiment
             super().__init__()
 
     class Activated(Message):
         """Posted when an experiment is activated (Enter)."""
 
-        def __init__(self, experiment: Experiment) -> None:
+        def __init__(self, experiment: ExperimentRecord) -> None:
             self.experiment = experiment
             super().__init__()
 
-    def __init__(self, experiments: list[Experiment] | None = None, **kwargs) -> None:
+    def __init__(self, experiments: list[ExperimentRecord] | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
-        self._experiments: list[Experiment] = experiments or []
-        self._filtered: list[Experiment] = list(self._experiments)
+        self._experiments: list[ExperimentRecord] = experiments or []
+        self._filtered: list[ExperimentRecord] = list(self._experiments)
+        self._archived: set[str] = set()
 
     def on_mount(self) -> None:
         self._refresh_options()
 
-    def set_experiments(self, experiments: list[Experiment]) -> None:
-        """Update the experiment list."""
+    def set_experiments(self, experiments: list[ExperimentRecord], archived: set[str] | None = None) -> None:
+        """Update the experiment list (*archived*: dir_names to mark as archived)."""
         self._experiments = experiments
+        self._archived = archived or set()
         self._filtered = list(experiments)
         self._refresh_options()
 
@@ -98,7 +103,7 @@ class ExperimentList(OptionList):
         """Rebuild the option list."""
         self.clear_options()
         for exp in self._filtered:
-            self.add_option(Option(_render_experiment(exp), id=exp.dir_name))
+            self.add_option(Option(_render_experiment(exp, exp.dir_name in self._archived), id=exp.dir_name))
 
         if self._filtered and self.option_count > 0:
             self.highlighted = 0
@@ -114,7 +119,7 @@ class ExperimentList(OptionList):
         if event.option and event.option_index < len(self._filtered):
             self.post_message(self.Activated(self._filtered[event.option_index]))
 
-    def get_selected_experiment(self) -> Experiment | None:
+    def get_selected_experiment(self) -> ExperimentRecord | None:
         """Get the currently highlighted experiment."""
         if self.highlighted is not None and self.highlighted < len(self._filtered):
             return self._filtered[self.highlighted]
@@ -0,0 +1,11 @@
+"""Human-readable formatting shared by the CLI and TUI."""
+
+
+def format_size(size: int) -> str:
+    """Human-readable byte count (``1.4 MB``)."""
+    value = float(size)
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024 or unit == "GB":
+            break
+        value /= 1024
+    return f"{size} B" if unit == "B" else f"{value:.1f} {unit}"
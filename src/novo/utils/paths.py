@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from platformdirs import user_config_dir, user_data_dir
+from platformdirs import user_cache_dir, user_config_dir, user_data_dir
 
 APP_NAME = "novo"
 
@@ -17,11 +17,21 @@ def data_dir() -> Path:
     return Path(user_data_dir(APP_NAME))
 
 
+def cache_dir() -> Path:
+    """Return the novo cache directory (~/.cache/novo/)."""
+    return Path(user_cache_dir(APP_NAME))
+
+
 def config_file() -> Path:
     """Return the path to config.toml."""
     return config_dir() / "config.toml"
 
 
+def open_paths_file() -> Path:
+    """Return the precomputed name→path map read by the `_open-path` fast path."""
+    return data_dir() / "open-paths"
+
+
 def default_workspace_dir() -> Path:
     """Return the default workspace directory."""
     return data_dir() / "workspace"
@@ -32,6 +42,26 @@ def seeds_dir() -> Path:
     return data_dir() / "seeds"
 
 
+def bakes_dir() -> Path:
+    """Return the directory of baked seed artifacts."""
+    return data_dir() / "bakes"
+
+
+def blobs_dir() -> Path:
+    """Return the content-addressed store of seed template files."""
+    return data_dir() / "blobs"
+
+
+def seed_registry_file() -> Path:
+    """Return the cached registry of parsed seed manifests."""
+    return cache_dir() / "seeds.json"
+
+
+def lock_cache_dir() -> Path:
+    """Return the directory of cached seed lockfiles."""
+    return cache_dir() / "locks"
+
+
 def builtin_seeds_dir() -> Path:
     """Return the built-in seeds directory (ships with package)."""
     return Path(__file__).parent.parent.parent / "seeds"
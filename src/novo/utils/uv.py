@@ -4,11 +4,13 @@ import subprocess
 from pathlib import Path
 
 
-def uv_init(directory: Path, python: str | None = None) -> None:
-    """Run `uv init` in the given directory."""
+def uv_init(directory: Path, python: str | None = None, name: str | None = None) -> None:
+    """Run `uv init` in the given directory (project *name* defaults to the directory name)."""
     cmd = ["uv", "init", "--no-workspace"]
     if python:
         cmd.extend(["--python", python])
+    if name:
+        cmd.extend(["--name", name])
     subprocess.run(cmd, cwd=directory, check=True, capture_output=True, text=True)
 
 
@@ -20,6 +22,14 @@ def uv_add(directory: Path, packages: list[str]) -> None:
     subprocess.run(cmd, cwd=directory, check=True, capture_output=True, text=True)
 
 
+def uv_sync_locked(directory: Path, offline: bool = False) -> None:
+    """Run `uv sync --locked`: install exactly what uv.lock pins, without re-resolving."""
+    cmd = ["uv", "sync", "--locked"]
+    if offline:
+        cmd.append("--offline")
+    subprocess.run(cmd, cwd=directory, check=True, capture_output=True, text=True)
+
+
 def list_python_versions() -> list[str]:
     """Get installed Python versions via `uv python list --only-installed`."""
     try:
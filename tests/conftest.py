@@ -6,6 +6,19 @@ from pathlib import Path
 import pytest
 
 
+def fake_uv_init(path, python=None, name=None):
+    """Stand-in for ``uv init``: a minimal project plus an empty ``.venv``."""
+    project = name or path.name
+    (path / "pyproject.toml").write_text(f'[project]\nname = "{project}"\n')
+    (path / "main.py").write_text(f'print("Hello from {project}!")\n')
+    (path / ".venv").mkdir()
+
+
+def scaffolded_from_scratch(mock_init):
+    """The ``uv init`` calls made for experiments rather than for skeletons or bakes."""
+    return [c for c in mock_init.call_args_list if c.kwargs.get("name") is None]
+
+
 @pytest.fixture
 def tmp_workspace(tmp_path, monkeypatch):
     """Create a temporary workspace for testing."""
@@ -21,6 +34,7 @@ def tmp_workspace(tmp_path, monkeypatch):
     # Patch paths to use temp directories
     monkeypatch.setattr("novo.utils.paths.config_dir", lambda: config_dir)
     monkeypatch.setattr("novo.utils.paths.data_dir", lambda: data_dir)
+    monkeypatch.setattr("novo.utils.paths.cache_dir", lambda: tmp_path / "cache")
     monkeypatch.setattr("novo.utils.paths.config_file", lambda: config_dir / "config.toml")
     monkeypatch.setattr("novo.utils.paths.default_workspace_dir", lambda: workspace)
     monkeypatch.setattr("novo.utils.paths.seeds_dir", lambda: data_dir / "seeds")
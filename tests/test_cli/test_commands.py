@@ -1,5 +1,6 @@
 """Tests for CLI commands."""
 
+import json
 from unittest.mock import patch
 
 from typer.testing import CliRunner
@@ -23,6 +24,29 @@ def test_new_command(mock_uv, tmp_workspace):
     assert "test-proj" in result.output
 
 
+@patch("novo.core.experiment.uv.uv_init")
+def test_new_timings(mock_uv, tmp_workspace):
+    result = runner.invoke(app, ["new", "timed", "--no-date", "--timings"])
+    assert result.exit_code == 0
+    assert "uv_init" in result.output
+    assert "total" in result.output
+    assert "Template:" in result.output
+    assert (tmp_workspace / "timed" / ".novo-timings.toml").exists()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_new_from_file(mock_uv, tmp_workspace, tmp_path):
+    spec_file = tmp_path / "specs.toml"
+    spec_file.write_text('[defaults]\nno_date = true\n\n[[experiment]]\nname = "b-1"\n\n[[experiment]]\nname = "b-2"\n')
+    result = runner.invoke(app, ["new", "--from-file", str(spec_file), "-j", "2"])
+    assert result.exit_code == 0
+    assert "2 created, 0 failed" in result.output
+
+    result = runner.invoke(app, ["new", "--from-file", str(spec_file)])
+    assert result.exit_code == 1
+    assert "0 created, 2 failed" in result.output
+
+
 @patch("novo.core.experiment.uv.uv_init")
 def test_list_command(mock_uv, tmp_workspace):
     runner.invoke(app, ["new", "list-test", "--no-date"])
@@ -47,6 +71,33 @@ def test_search_command(mock_uv, tmp_workspace):
     assert "searchable" in result.output
 
 
+@patch("novo.core.experiment.uv.uv_init")
+def test_list_ndjson_fields(mock_uv, tmp_workspace):
+    for name in ["nd-a", "nd-b", "nd-c"]:
+        runner.invoke(app, ["new", name, "--no-date", "--tag", "x"])
+    result = runner.invoke(
+        app, ["list", "--ndjson", "--sort", "name", "--fields", "name,tags", "--limit", "2", "--offset", "1"]
+    )
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert lines == [{"name": "nd-b", "tags": ["x"]}, {"name": "nd-c", "tags": ["x"]}]
+
+
+def test_list_unknown_field(tmp_workspace):
+    result = runner.invoke(app, ["list", "--json", "--fields", "name,bogus"])
+    assert result.exit_code == 1
+    assert "bogus" in result.output
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_search_ndjson(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "vision-a", "--no-date"])
+    runner.invoke(app, ["new", "vision-b", "--no-date"])
+    result = runner.invoke(app, ["search", "vision", "--ndjson", "--fields", "dir_name", "--offset", "1"])
+    assert result.exit_code == 0
+    assert [json.loads(line) for line in result.output.splitlines()] == [{"dir_name": "vision-b"}]
+
+
 @patch("novo.core.experiment.uv.uv_init")
 def test_delete_command(mock_uv, tmp_workspace):
     runner.invoke(app, ["new", "delete-test", "--no-date"])
@@ -55,6 +106,22 @@ def test_delete_command(mock_uv, tmp_workspace):
     assert "Deleted" in result.output
 
 
+@patch("novo.core.experiment.uv.uv_init")
+def test_info_resolves_typo(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "image-classifier", "--no-date"])
+    result = runner.invoke(app, ["info", "imge-clasifier"])
+    assert result.exit_code == 0
+    assert "Experiment: image-classifier" in result.output
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_delete_force_requires_exact_name(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "image-classifier", "--no-date"])
+    result = runner.invoke(app, ["delete", "imge-clasifier", "--force"])
+    assert result.exit_code == 1
+    assert "Did you mean: image-classifier" in result.output
+
+
 def test_info_workspace(tmp_workspace):
     result = runner.invoke(app, ["info"])
     assert result.exit_code == 0
@@ -113,12 +180,39 @@ def test_config_set_bool(tmp_workspace):
     assert "False" in result.output
 
 
+def test_config_set_int(tmp_workspace):
+    runner.invoke(app, ["config", "set", "index.scan_workers", "4"])
+    result = runner.invoke(app, ["config", "get", "index.scan_workers"])
+    assert result.exit_code == 0
+    assert "4" in result.output
+
+
 def test_config_set_bool_invalid(tmp_workspace):
     result = runner.invoke(app, ["config", "set", "defaults.auto_commit", "maybe"])
     assert result.exit_code == 1
     assert "Invalid value" in result.output
 
 
+def test_config_set_out_of_range(tmp_workspace):
+    for key, value in [
+        ("index.scan_workers", "0"),
+        ("index.activity_interval", "-1"),
+        ("batch.workers", "0"),
+        ("pool.size", "-1"),
+        ("commit.window", "-1"),
+        ("commit.max_ops", "0"),
+        ("trash.retention_hours", "-1"),
+    ]:
+        result = runner.invoke(app, ["config", "set", "--", key, value])  # "--": "-1" isn't an option
+        assert result.exit_code == 1, key
+        assert "Invalid value" in result.output
+
+    # Nothing was saved: the config still loads
+    result = runner.invoke(app, ["config", "get", "index.scan_workers"])
+    assert result.exit_code == 0
+    assert "8" in result.output
+
+
 # --- seed init tests ---
 
 
@@ -170,3 +264,132 @@ def test_seed_init_visible_in_list(tmp_workspace):
     result = runner.invoke(app, ["seed", "list"])
     assert result.exit_code == 0
     assert "listed-seed" in result.output
+
+
+def test_seed_pack_and_unpack(tmp_workspace):
+    runner.invoke(app, ["seed", "init", "packable"])
+    seed_dir = tmp_workspace.parent / "data" / "seeds" / "packable"
+    (seed_dir / "template" / "data.csv").write_text("a,b\n1,2\n")
+
+    result = runner.invoke(app, ["seed", "pack", "packable"])
+    assert result.exit_code == 0
+    assert not (seed_dir / "template").exists()
+
+    result = runner.invoke(app, ["seed", "list"])
+    assert "on disk" in result.output
+
+    result = runner.invoke(app, ["seed", "unpack", "packable"])
+    assert result.exit_code == 0
+    assert (seed_dir / "template" / "data.csv").read_text() == "a,b\n1,2\n"
+
+    result = runner.invoke(app, ["seed", "unpack", "packable"])
+    assert result.exit_code == 1
+    assert "not packed" in result.output
+
+
+# --- index tests ---
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_index_rebuild(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "idx-a", "--no-date"])
+    runner.invoke(app, ["new", "idx-b", "--no-date"])
+    result = runner.invoke(app, ["index", "rebuild"])
+    assert result.exit_code == 0
+    assert "2 experiments" in result.output
+
+
+# --- commit tests ---
+
+
+@patch("novo.core.journal._spawn_committer")
+@patch("novo.core.experiment.uv.uv_init")
+def test_commit_flush(mock_uv, mock_spawn, tmp_workspace):
+    runner.invoke(app, ["config", "set", "commit.deferred", "true"])
+    runner.invoke(app, ["new", "queued", "--no-date"])
+
+    result = runner.invoke(app, ["commit"])
+    assert result.exit_code == 0
+    assert "1 change waiting" in result.output
+    assert "novo: create queued" in result.output
+
+    result = runner.invoke(app, ["commit", "--flush"])
+    assert result.exit_code == 0
+    assert "Committed 1 change" in result.output
+
+    result = runner.invoke(app, ["commit"])
+    assert "Nothing to commit" in result.output
+
+
+# --- trash tests ---
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_delete_and_restore(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "restorable", "--no-date"])
+    result = runner.invoke(app, ["delete", "restorable", "--force"])
+    assert "novo restore restorable" in result.output
+
+    result = runner.invoke(app, ["trash", "list"])
+    assert "restorable" in result.output
+
+    result = runner.invoke(app, ["restore", "restorable"])
+    assert result.exit_code == 0
+    assert "Restored" in result.output
+    assert (tmp_workspace / "restorable").is_dir()
+
+    result = runner.invoke(app, ["restore", "restorable"])
+    assert result.exit_code == 1
+    assert "Not in trash" in result.output
+
+
+# --- archive tests ---
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_archive_and_open(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "shelved", "--no-date"])
+    (tmp_workspace / "shelved" / "notes.md").write_text("findings")
+
+    result = runner.invoke(app, ["archive", "shelved"])
+    assert result.exit_code == 0
+    assert "Archived:" in result.output
+    assert not (tmp_workspace / "shelved" / "notes.md").exists()
+
+    result = runner.invoke(app, ["list"])
+    assert "(archived)" in result.output
+
+    result = runner.invoke(app, ["_open-path", "shelved"])
+    assert result.output.strip() == str(tmp_workspace / "shelved")
+    assert (tmp_workspace / "shelved" / "notes.md").read_text() == "findings"
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_du_top_json(mock_uv, tmp_workspace):
+    runner.invoke(app, ["new", "small", "--no-date"])
+    runner.invoke(app, ["new", "large", "--no-date"])
+    (tmp_workspace / "large" / "data").mkdir()
+    (tmp_workspace / "large" / "data" / "train.bin").write_bytes(b"x" * 100000)
+
+    result = runner.invoke(app, ["du", "--top", "1", "--json"])
+    assert result.exit_code == 0
+    [entry] = json.loads(result.output)
+    assert entry["dir_name"] == "large"
+    assert entry["data"] >= 100000
+    assert entry["total"] == entry["venv"] + entry["data"] + entry["source"] + entry["archive"]
+
+    result = runner.invoke(app, ["du"])
+    assert result.exit_code == 0
+    assert "2 experiments" in result.output
+
+    result = runner.invoke(app, ["info", "large"])
+    assert "Size" in result.output
+
+
+def test_archive_needs_name_or_age(tmp_workspace):
+    result = runner.invoke(app, ["archive"])
+    assert result.exit_code == 1
+
+    result = runner.invoke(app, ["archive", "--older-than", "ninety"])
+    assert result.exit_code == 1
+    assert "Invalid age" in result.output
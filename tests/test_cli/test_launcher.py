@@ -0,0 +1,86 @@
+"""Tests for the `_open-path` fast path in novo.launcher."""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+from novo import launcher
+from novo.core.experiment import create, list_all
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_fast_open_path_resolves_name_and_dir_name(mock_uv, tmp_workspace):
+    create(name="fast", no_date=True)
+
+    assert launcher._fast_open_path("fast") == str(tmp_workspace / "fast")
+    assert launcher._fast_open_path("missing") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_fast_open_path_falls_back_when_directory_vanished(mock_uv, tmp_workspace):
+    import shutil
+
+    create(name="moved", no_date=True)
+    shutil.rmtree(tmp_workspace / "moved")
+
+    assert launcher._fast_open_path("moved") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_fast_open_path_ignores_map_older_than_config(mock_uv, tmp_workspace):
+    import os
+
+    from novo.utils.paths import config_file, open_paths_file
+
+    create(name="stale", no_date=True)
+    config_mtime = config_file().stat().st_mtime_ns
+    os.utime(open_paths_file(), ns=(config_mtime - 10**9, config_mtime - 10**9))
+
+    assert launcher._fast_open_path("stale") is None
+    list_all()  # full path rewrites the map
+    assert launcher._fast_open_path("stale") == str(tmp_workspace / "stale")
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_fast_open_path_leaves_archived_to_full_cli(mock_uv, tmp_workspace):
+    from novo.core.experiment import archive
+
+    create(name="frozen", no_date=True)
+    archive(["frozen"])
+
+    assert launcher._fast_open_path("frozen") is None
+
+
+def test_main_prints_path(tmp_workspace, capsys):
+    from novo.utils.paths import open_paths_file
+
+    (tmp_workspace / "2026-01-01-demo").mkdir()
+    open_paths_file().write_text(f"workspace\t{tmp_workspace}\n2026-01-01-demo\tdemo\n")
+
+    launcher.main(["_open-path", "demo"])
+
+    assert capsys.readouterr().out.strip() == str(tmp_workspace / "2026-01-01-demo")
+
+
+def test_fast_path_does_not_import_cli_stack(tmp_path):
+    workspace = tmp_path / "workspace"
+    (workspace / "demo").mkdir(parents=True)
+    map_file = tmp_path / "open-paths"
+    map_file.write_text(f"workspace\t{workspace}\ndemo\tdemo\n")
+
+    script = f"""
+import sys
+from pathlib import Path
+import novo.utils.paths as paths
+paths.open_paths_file = lambda: Path({str(map_file)!r})
+paths.config_file = lambda: Path({str(tmp_path / "missing.toml")!r})
+from novo.launcher import main
+main(["_open-path", "demo"])
+heavy = {{"typer", "rich", "pydantic", "sqlite3", "novo.cli"}} & set(sys.modules)
+print(sorted(heavy))
+"""
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    path_line, heavy_line = result.stdout.strip().splitlines()
+    assert path_line == str(workspace / "demo")
+    assert heavy_line == "[]"
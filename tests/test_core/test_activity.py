@@ -0,0 +1,59 @@
+"""Tests for activity timestamps."""
+
+import os
+from unittest.mock import patch
+
+from novo.core.activity import latest, scan
+
+
+def _touch(path, mtime):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x")
+    os.utime(path, (mtime, mtime))
+
+
+def _age_dirs(root, mtime):
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (mtime, mtime))
+
+
+def test_scan_finds_deep_files_and_skips_venv(tmp_path):
+    _touch(tmp_path / "src" / "pkg" / "model.py", 2000)
+    _touch(tmp_path / ".venv" / "lib" / "site.py", 9000)
+    _touch(tmp_path / "src" / "__pycache__" / "model.pyc", 9000)
+    _age_dirs(tmp_path, 1000)
+
+    dirs = scan(tmp_path)
+    assert latest(dirs) == 2000
+    assert ".venv" not in dirs
+    assert "src/pkg" in dirs
+
+
+def test_scan_relists_only_changed_dirs(tmp_path):
+    _touch(tmp_path / "src" / "a.py", 2000)
+    _touch(tmp_path / "notes" / "b.md", 1500)
+    _age_dirs(tmp_path, 1000)
+    cache = scan(tmp_path)
+
+    _touch(tmp_path / "src" / "c.py", 3000)  # new file bumps src's mtime
+    with patch("novo.core.activity.os.scandir", wraps=os.scandir) as spy:
+        dirs = scan(tmp_path, cache)
+
+    assert latest(dirs) >= 3000
+    assert [call.args[0] for call in spy.call_args_list] == [os.path.join(tmp_path, "src")]
+    assert dirs["notes"] == cache["notes"]
+
+
+def test_scan_sees_files_rewritten_in_place(tmp_path):
+    _touch(tmp_path / "src" / "m.py", 2000)
+    _age_dirs(tmp_path, 1000)
+    cache = scan(tmp_path)
+
+    # An in-place write moves the file's mtime but not its directory's
+    (tmp_path / "src" / "m.py").write_text("edited")
+    os.utime(tmp_path / "src" / "m.py", (5000, 5000))
+    with patch("novo.core.activity.os.scandir", wraps=os.scandir) as spy:
+        dirs = scan(tmp_path, cache)
+
+    assert latest(dirs) == 5000
+    assert spy.call_count == 0
@@ -0,0 +1,129 @@
+"""Tests for compressed cold-storage archives."""
+
+import os
+import subprocess
+import time
+from unittest.mock import patch
+
+import pytest
+
+from novo.core import archive as archives
+from novo.core.experiment import (
+    archive,
+    archived_names,
+    create,
+    delete,
+    get,
+    inactive,
+    restore,
+    search,
+    unarchive,
+)
+
+
+def _fill(exp_dir):
+    (exp_dir / "data").mkdir()
+    (exp_dir / "data" / "results.csv").write_text("epoch,loss\n" + "1,0.5\n" * 1000)
+    (exp_dir / "run.sh").write_text("#!/bin/sh\n")
+    (exp_dir / "run.sh").chmod(0o755)
+    (exp_dir / ".venv").mkdir()
+    (exp_dir / ".venv" / "big").write_bytes(b"v" * 1000)
+    (exp_dir / "uv.lock").write_text("version = 1\n")
+
+
+def _tracked(workspace):
+    return subprocess.run(
+        ["git", "ls-files"], cwd=workspace, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+@pytest.fixture
+def experiment(tmp_workspace):
+    with patch("novo.core.experiment.uv.uv_init"):
+        create(name="cold", tags=["old"], no_date=True)
+    exp_dir = tmp_workspace / "cold"
+    _fill(exp_dir)
+    return exp_dir
+
+
+def test_archive_keeps_only_metadata(experiment, tmp_workspace):
+    [(dir_name, stats)] = archive(["cold"])
+
+    assert dir_name == "cold"
+    assert stats.path.name in ("cold.tar.zst", "cold.tar.xz")
+    assert stats.compressed < stats.size
+    assert os.listdir(experiment) == [".novo.toml"]
+    assert archived_names() == {"cold"}
+    # Still listed and searchable
+    assert get("cold") is not None
+    assert [r.dir_name for r in search("old")] == ["cold"]
+    assert [path for path in _tracked(tmp_workspace) if path.startswith("cold/")] == ["cold/.novo.toml"]
+
+    assert archive(["cold"]) == []  # already archived
+
+
+@patch("novo.core.experiment.uv.uv_sync_locked")
+def test_unarchive_restores_files_and_resyncs(mock_sync, experiment):
+    archive(["cold"])
+
+    assert unarchive("cold")
+
+    assert (experiment / "data" / "results.csv").read_text().startswith("epoch,loss")
+    assert os.access(experiment / "run.sh", os.X_OK)
+    assert not (experiment / ".venv").exists()
+    mock_sync.assert_called_once_with(experiment)
+    assert archived_names() == set()
+    assert not unarchive("cold")
+
+
+def test_zstd_archive_roundtrip(experiment, tmp_workspace):
+    pytest.importorskip("zstandard")
+    stats = archives.pack(tmp_workspace, experiment, "zst", level=3, workers=2)
+    assert stats.path.name == "cold.tar.zst"
+    assert archives.unpack(tmp_workspace, experiment)
+    assert (experiment / "run.sh").exists()
+
+
+def test_xz_without_zstandard(experiment, tmp_workspace):
+    with patch("novo.core.archive.zstandard", None):
+        stats = archives.pack(tmp_workspace, experiment, "zst")
+    assert stats.path.name == "cold.tar.xz"
+    assert archives.unpack(tmp_workspace, experiment)
+    assert (experiment / "data" / "results.csv").exists()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_inactive_selects_stale_experiments(mock_uv_init, experiment, tmp_workspace):
+    create(name="fresh", no_date=True)
+    past = time.time() - 100 * 86400
+    for dirpath, dirnames, filenames in os.walk(experiment):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past), follow_symlinks=False)
+    os.utime(experiment, (past, past))
+
+    assert inactive(90 * 86400) == ["cold"]
+    archive(["cold"])
+    assert inactive(90 * 86400) == []
+
+
+def test_inactive_sees_in_place_edits(experiment):
+    past = time.time() - 100 * 86400
+    for dirpath, dirnames, filenames in os.walk(experiment):
+        for name in dirnames + filenames:
+            os.utime(os.path.join(dirpath, name), (past, past), follow_symlinks=False)
+    os.utime(experiment, (past, past))
+    assert inactive(90 * 86400) == ["cold"]
+
+    with open(experiment / "data" / "results.csv", "a") as f:  # a run still appending
+        f.write("2,0.4\n")
+    assert inactive(90 * 86400) == []
+
+
+def test_archive_follows_experiment_through_trash(experiment, tmp_workspace):
+    archive(["cold"])
+
+    delete("cold")
+    assert archived_names() == set()
+
+    restore("cold")
+    assert archived_names() == {"cold"}
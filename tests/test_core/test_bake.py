@@ -0,0 +1,85 @@
+"""Tests for baked seed artifacts."""
+
+import subprocess
+from unittest.mock import call, patch
+
+import pytest
+
+from novo.core.experiment import create, read_timings
+from novo.core.seed import bake_seed
+from novo.core.workspace import ensure_initialized
+from tests.conftest import fake_uv_init, scaffolded_from_scratch
+
+
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_bake_writes_tree_without_venv(mock_init, tmp_workspace):
+    bake = bake_seed("default")
+
+    assert (bake / "bake.toml").exists()
+    assert (bake / "tree" / ".agents" / "agents.toml").exists()
+    assert not (bake / "tree" / ".venv").exists()
+
+    # Rebaking replaces the artifact in place
+    assert bake_seed("default") == bake
+    assert sorted(p.name for p in bake.parent.iterdir()) == [bake.name]
+
+
+def test_bake_unknown_seed(tmp_workspace):
+    with pytest.raises(ValueError, match="not found"):
+        bake_seed("nope")
+
+
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_create_materializes_from_bake(mock_init, tmp_workspace):
+    ensure_initialized()
+    bake_seed("default")
+
+    exp = create(name="baked", no_date=True)
+
+    assert scaffolded_from_scratch(mock_init) == []
+    exp_dir = tmp_workspace / exp.dir_name
+    assert 'name = "baked"' in (exp_dir / "pyproject.toml").read_text()
+    assert (exp_dir / ".agents" / "agents.toml").exists()
+    assert (exp_dir / ".novo.toml").exists()
+    assert "bake" in read_timings("baked")
+
+
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_bake_project_name_is_normalized(mock_init, tmp_workspace):
+    ensure_initialized()
+    bake_seed("default")
+
+    exp = create(name="Third_One")
+
+    exp_dir = tmp_workspace / exp.dir_name
+    assert exp.dir_name.endswith("-Third_One")
+    project = exp.dir_name.replace("_", "-").lower()
+    assert f'name = "{project}"' in (exp_dir / "pyproject.toml").read_text()
+    assert f"Hello from {project}!" in (exp_dir / "main.py").read_text()
+
+
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_stale_bake_falls_back(mock_init, tmp_workspace):
+    ensure_initialized()
+    bake_seed("default")
+
+    with patch("novo.core.seed.seed_fingerprint", return_value="changed"):
+        create(name="fresh", no_date=True)
+
+    assert len(scaffolded_from_scratch(mock_init)) == 1
+    assert "uv_init" in read_timings("fresh")
+    assert "bake" not in read_timings("fresh")
+
+
+@patch("novo.utils.uv.uv_sync_locked", side_effect=[subprocess.CalledProcessError(1, "uv sync"), None])
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_create_from_bake_syncs_venv(mock_init, mock_sync, tmp_workspace):
+    ensure_initialized()
+    bake = bake_seed("default")
+    (bake / "tree" / "uv.lock").write_text("version = 1\n")
+
+    exp = create(name="synced", no_date=True)
+
+    exp_dir = tmp_workspace / exp.dir_name
+    assert mock_sync.call_args_list == [call(exp_dir, offline=True), call(exp_dir)]  # cache miss: online
+    assert "sync" in read_timings("synced")
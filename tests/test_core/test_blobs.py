@@ -0,0 +1,124 @@
+"""Tests for the content-addressed seed template store."""
+
+import os
+import stat
+import subprocess
+
+import pytest
+
+from novo.core.seed import (
+    MANIFEST_FILE,
+    add_from_git,
+    copy_template,
+    create_from_experiment,
+    get_seed,
+    init_seed,
+    list_seeds,
+    pack_seed,
+    remove_seed,
+    template_usage,
+    unpack_seed,
+)
+from novo.utils.paths import blobs_dir
+
+
+def _experiment(path, weights=b"w" * 10_000):
+    (path / "data").mkdir(parents=True)
+    (path / "data" / "weights.bin").write_bytes(weights)
+    (path / "run.sh").write_text("#!/bin/sh\n")
+    (path / "run.sh").chmod(0o755)
+    (path / ".novo.toml").write_text("[experiment]\n")
+    (path / ".venv").mkdir()
+    (path / ".venv" / "big").write_bytes(b"v" * 100)
+    return path
+
+
+def _blob_count():
+    return sum(1 for _ in blobs_dir().glob("*/*"))
+
+
+def test_identical_files_stored_once(tmp_workspace, tmp_path):
+    create_from_experiment(_experiment(tmp_path / "a"), "seed-a")
+    create_from_experiment(_experiment(tmp_path / "b"), "seed-b")
+
+    seed = get_seed("seed-a")
+    assert (tmp_path / "data" / "seeds" / "seed-a" / MANIFEST_FILE).exists()
+    assert not (tmp_path / "data" / "seeds" / "seed-a" / "template").exists()
+    assert _blob_count() == 2  # weights.bin + run.sh, shared by both seeds
+
+    usage, total = template_usage([seed, get_seed("seed-b")])
+    assert usage["seed-a"].logical == 10_000 + len("#!/bin/sh\n")
+    assert total.logical == 2 * usage["seed-a"].logical
+    assert total.physical == usage["seed-a"].logical
+
+
+def test_packed_seed_copies_from_store(tmp_workspace, tmp_path):
+    seed = create_from_experiment(_experiment(tmp_path / "exp"), "packed")
+
+    dst = tmp_path / "new"
+    stats = copy_template(seed, dst, mode="copy")
+
+    assert stats.files == 2
+    assert (dst / "data" / "weights.bin").read_bytes() == b"w" * 10_000
+    assert stat.S_IMODE((dst / "run.sh").stat().st_mode) == 0o755
+    assert not (dst / ".novo.toml").exists()
+    assert not (dst / ".venv").exists()
+
+
+def test_hardlinked_experiments_share_blobs(tmp_workspace, tmp_path):
+    seed = create_from_experiment(_experiment(tmp_path / "exp"), "packed")
+
+    copy_template(seed, tmp_path / "one", mode="hardlink")
+    copy_template(seed, tmp_path / "two", mode="hardlink")
+
+    assert os.path.samefile(tmp_path / "one" / "data" / "weights.bin", tmp_path / "two" / "data" / "weights.bin")
+    assert stat.S_IMODE((tmp_path / "one" / "data" / "weights.bin").stat().st_mode) == 0o444
+
+
+def test_add_from_git_keeps_the_clone(tmp_workspace, tmp_path):
+    repo = tmp_path / "seed-repo"
+    (repo / "template").mkdir(parents=True)
+    (repo / "seed.toml").write_text('[seed]\nname = "cloned"\n')
+    (repo / "template" / "notes.md").write_text("hello")
+    subprocess.run(["git", "init", "-q"], cwd=repo, check=True)
+    subprocess.run(["git", "add", "."], cwd=repo, check=True)
+    subprocess.run(["git", "commit", "-qm", "seed"], cwd=repo, check=True)
+
+    seed = add_from_git(str(repo))
+
+    seed_dir = tmp_path / "data" / "seeds" / "seed-repo"
+    assert seed.name == "cloned"
+    assert (seed_dir / ".git").is_dir()  # still a clone: `git pull` updates it
+    assert (seed_dir / "template" / "notes.md").read_text() == "hello"
+    assert not (seed_dir / MANIFEST_FILE).exists()  # packing is explicit: `novo seed pack`
+    assert _blob_count() == 0
+
+
+def test_pack_unpack_roundtrip(tmp_workspace, tmp_path):
+    init_seed("editable")
+    template = tmp_path / "data" / "seeds" / "editable" / "template"
+    (template / "notes.md").write_text("hello")
+
+    pack_seed("editable")
+    assert not template.exists()
+    assert _blob_count() == 1
+
+    unpack_seed("editable")
+    assert (template / "notes.md").read_text() == "hello"
+    assert not (template.parent / MANIFEST_FILE).exists()
+    assert _blob_count() == 0  # no packed seed refers to it any more
+
+
+def test_remove_seed_collects_garbage(tmp_workspace, tmp_path):
+    create_from_experiment(_experiment(tmp_path / "a"), "seed-a")
+    create_from_experiment(_experiment(tmp_path / "b", weights=b"other"), "seed-b")
+    assert _blob_count() == 3
+
+    remove_seed("seed-b")
+    assert _blob_count() == 2
+    assert [s.name for s in list_seeds() if not s.builtin] == ["seed-a"]
+
+
+def test_builtin_seed_cannot_be_packed(tmp_workspace):
+    with pytest.raises(ValueError, match="Built-in"):
+        pack_seed("default")
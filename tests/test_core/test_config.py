@@ -1,6 +1,9 @@
 """Tests for config module."""
 
-from novo.core.config import load_config, save_config
+import os
+from unittest.mock import patch
+
+from novo.core.config import current_config, load_config, save_config
 from novo.models.config import NovoConfig
 
 
@@ -22,3 +25,40 @@ def test_save_and_load_config(tmp_workspace):
     loaded = load_config()
     assert loaded.defaults.seed == "custom"
     assert loaded.defaults.python == "3.12"
+
+
+def test_scan_workers_roundtrip(tmp_workspace):
+    config = NovoConfig()
+    assert config.index.scan_workers == 8
+    config.index.scan_workers = 2
+    save_config(config)
+
+    assert load_config().index.scan_workers == 2
+
+
+def test_current_config_parses_once(tmp_workspace):
+    save_config(NovoConfig())
+    first = current_config()
+
+    with patch("novo.core.config.load_config") as load:
+        assert current_config() is first
+    load.assert_not_called()
+
+
+def test_current_config_sees_edits(tmp_workspace):
+    from novo.utils.paths import config_file
+
+    save_config(NovoConfig())
+    assert current_config().defaults.seed == "default"
+
+    # Edited by another process
+    path = config_file()
+    path.write_text(path.read_text().replace('seed = "default"', 'seed = "edited"'))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert current_config().defaults.seed == "edited"
+
+    config = load_config()
+    config.defaults.seed = "saved"
+    save_config(config)
+    assert current_config().defaults.seed == "saved"
@@ -1,21 +1,31 @@
 """Tests for experiment module."""
 
+import os
 import subprocess
+import time
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
+from novo.core import index
 from novo.core.experiment import (
     _make_dir_name,
     _read_novo_toml,
     _write_novo_toml,
     create,
+    create_many,
     delete,
     get,
+    iter_all,
     list_all,
+    load_specs,
+    read_timings,
+    rebuild_index,
+    refresh_activity,
     search,
 )
-from novo.models.experiment import Experiment
+from novo.models.experiment import Experiment, ExperimentSpec
 
 
 def test_make_dir_name_with_date():
@@ -95,3 +105,390 @@ def test_delete_experiment(mock_uv_init, tmp_workspace):
 
     result = delete("delete-me")
     assert result is True
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_create_writes_through_to_index(mock_uv_init, tmp_workspace):
+    create(name="indexed", tags=["ml"], no_date=True)
+
+    assert index.index_path(tmp_workspace).exists()
+    with index.open_index(tmp_workspace) as conn:
+        found = index.find(conn, "indexed")
+    assert found is not None
+    assert found.tags == ("ml",)
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_delete_removes_from_index(mock_uv_init, tmp_workspace):
+    create(name="gone", no_date=True)
+    delete("gone")
+
+    with index.open_index(tmp_workspace) as conn:
+        assert index.find(conn, "gone") is None
+    assert get("gone") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_list_builds_missing_index(mock_uv_init, tmp_workspace):
+    create(name="exp-a", no_date=True)
+    index.index_path(tmp_workspace).unlink()
+
+    assert [e.name for e in list_all()] == ["exp-a"]
+    assert index.index_path(tmp_workspace).exists()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_rebuild_index_picks_up_manual_edits(mock_uv_init, tmp_workspace):
+    create(name="edited", no_date=True)
+    exp = _read_novo_toml(tmp_workspace / "edited")
+    exp.description = "changed by hand"
+    _write_novo_toml(tmp_workspace / "edited", exp)
+
+    assert rebuild_index() == 1
+    assert get("edited").description == "changed by hand"
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_list_reparses_only_changed_entries(mock_uv_init, tmp_workspace):
+    from novo.core import experiment
+
+    for name in ("exp-a", "exp-b", "exp-c"):
+        create(name=name, no_date=True)
+    list_all()
+
+    exp = _read_novo_toml(tmp_workspace / "exp-b")
+    exp.description = "edited"
+    _write_novo_toml(tmp_workspace / "exp-b", exp)
+
+    with patch.object(experiment, "_parse_novo_toml", wraps=experiment._parse_novo_toml) as spy:
+        experiments = {e.name: e for e in list_all()}
+
+    assert spy.call_count == 1
+    assert experiments["exp-b"].description == "edited"
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_refresh_picks_up_added_and_removed_dirs(mock_uv_init, tmp_workspace):
+    import shutil
+
+    create(name="keep", no_date=True)
+    create(name="drop", no_date=True)
+    list_all()
+
+    shutil.rmtree(tmp_workspace / "drop")
+    (tmp_workspace / "manual").mkdir()
+    _write_novo_toml(tmp_workspace / "manual", Experiment(name="manual"))
+
+    names = sorted(e.name for e in list_all())
+    assert names == ["keep", "manual"]
+    assert get("drop") is None
+
+
+def test_scan_workspace_parallel_matches_sequential(tmp_path):
+    from novo.core.experiment import _scan_workspace
+
+    for i in range(12):
+        exp_dir = tmp_path / f"exp-{i:02d}"
+        exp_dir.mkdir()
+        _write_novo_toml(exp_dir, Experiment(name=f"exp-{i:02d}"))
+    (tmp_path / "not-an-experiment").mkdir()
+    (tmp_path / ".hidden").mkdir()
+
+    sequential = [exp.name for exp, _, _ in _scan_workspace(tmp_path, workers=1)]
+    parallel = [exp.name for exp, _, _ in _scan_workspace(tmp_path, workers=4)]
+
+    assert sequential == [f"exp-{i:02d}" for i in range(12)]
+    assert parallel == sequential
+
+
+def test_experiment_record_matches_model_dump():
+    from novo.models.experiment import ExperimentRecord, pack_tags
+
+    exp = Experiment(name="rec", tags=["a", "b"], description="d", python="3.12", dir_name="2026-01-01-rec")
+    record = ExperimentRecord(
+        exp.dir_name, exp.name, exp.seed, pack_tags(exp.tags), exp.description, exp.python,
+        exp.created_at.isoformat(),
+    )
+
+    assert record.tags == ("a", "b")
+    assert record.created_at == exp.created_at
+    assert record.to_dict() == exp.model_dump(mode="json")
+    assert record.to_experiment() == exp
+    with pytest.raises(AttributeError):
+        record.name = "other"
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_list_all_returns_records(mock_uv_init, tmp_workspace):
+    from novo.models.experiment import ExperimentRecord
+
+    create(name="untagged", no_date=True)
+
+    [record] = list_all()
+    assert isinstance(record, ExperimentRecord)
+    assert record.tags == ()
+    assert isinstance(get("untagged"), Experiment)
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_search_ranks_name_hit_above_description_hit(mock_uv_init, tmp_workspace):
+    create(name="notes", description="vision transformer baseline", no_date=True)
+    create(name="vision-transformer", description="notes", no_date=True)
+
+    results = search("vision")
+    assert [e.name for e in results] == ["vision-transformer", "notes"]
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_search_prefix_limit_and_incremental_updates(mock_uv_init, tmp_workspace):
+    create(name="image-classifier", tags=["cv"], no_date=True)
+    create(name="image-segmenter", tags=["cv"], no_date=True)
+    create(name="text-classifier", tags=["nlp"], no_date=True)
+
+    assert {e.name for e in search("clas")} == {"image-classifier", "text-classifier"}
+    assert [e.name for e in search("image classifier", limit=1)] == ["image-classifier"]
+
+    delete("image-classifier")
+    assert {e.name for e in search("image classifier")} == {"image-segmenter", "text-classifier"}
+    assert search("") == []
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_resolve_tolerates_unambiguous_typos(mock_uv_init, tmp_workspace):
+    from novo.core.experiment import resolve, suggest
+
+    create(name="image-classifier", tags=["vision"], no_date=True)
+    create(name="text-generator", no_date=True)
+
+    assert resolve("imge-clasifier").name == "image-classifier"
+    assert resolve("imge-clasifier", fuzzy=False) is None
+    assert resolve("text-generator").name == "text-generator"
+    assert [e.name for e in suggest("vison")] == ["image-classifier"]
+    assert resolve("zzzz") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_resolve_refuses_ambiguous_fuzzy_match(mock_uv_init, tmp_workspace):
+    from novo.core.experiment import resolve, suggest
+
+    create(name="model-v1", no_date=True)
+    create(name="model-v2", no_date=True)
+
+    assert resolve("model-v") is None
+    assert {e.name for e in suggest("model-v")} == {"model-v1", "model-v2"}
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_iter_all_pages_and_filters(mock_uv_init, tmp_workspace):
+    for name in ["exp-c", "exp-a", "exp-b"]:
+        create(name=name, no_date=True, tags=["ml"] if name != "exp-b" else [])
+
+    stream = iter_all(sort_by="name")
+    assert not isinstance(stream, list)
+    assert [e.name for e in stream] == ["exp-a", "exp-b", "exp-c"]
+    assert [e.name for e in iter_all(sort_by="name", limit=1, offset=1)] == ["exp-b"]
+    assert [e.name for e in iter_all(sort_by="name", tags=["ml"])] == ["exp-a", "exp-c"]
+    # Newest first
+    assert [e.name for e in iter_all(sort_by="created", limit=2)] == ["exp-b", "exp-a"]
+
+
+def _indexed(tmp_path, experiments):
+    with index.open_index(tmp_path) as conn:
+        index.replace_all(conn, [(exp, 0.0, (0, 0, i)) for i, exp in enumerate(experiments)])
+
+
+def test_iter_experiments_filters(tmp_path):
+    def exp(name, seed, tags, python, month):
+        return Experiment(
+            name=name, dir_name=name, seed=seed, tags=tags, python=python, created_at=datetime(2026, month, 5)
+        )
+
+    _indexed(
+        tmp_path,
+        [
+            exp("a", "torch", ["ml", "gpu"], "3.12.4", 1),
+            exp("b", "torch", ["ml"], "3.11", 2),
+            exp("c", "default", ["gpu"], "3.12", 3),
+        ],
+    )
+
+    def names(**filters):
+        with index.open_index(tmp_path) as conn:
+            return [e.name for e in index.iter_experiments(conn, "name", **filters)]
+
+    assert names(seed="torch") == ["a", "b"]
+    assert names(tags=["ml", "gpu"]) == ["a"]
+    assert names(tags=["ml", "gpu"], any_tag=True) == ["a", "b", "c"]
+    assert names(since=datetime(2026, 2, 1), until=datetime(2026, 3, 1)) == ["b"]
+    assert names(python="3.12") == ["a", "c"]
+    assert names(python="3.1") == []
+    assert names(seed="torch", tags=["gpu"]) == ["a"]
+
+
+def test_iter_experiments_uses_indexes(tmp_path):
+    _indexed(tmp_path, [])
+    with index.open_index(tmp_path) as conn:
+        for order in index.ORDERINGS:
+            sql = f"SELECT name FROM experiments ORDER BY {index.ORDERINGS[order]}"
+            plan = " ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+            assert "TEMP B-TREE" not in plan, order
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT dir_name FROM experiment_tags WHERE tag IN ('x')"
+            )
+        )
+        assert "SEARCH" in plan
+
+
+@patch("novo.core.activity.refresh_async")
+@patch("novo.core.experiment.uv.uv_init")
+def test_list_sorted_by_activity(mock_uv_init, mock_refresh, tmp_workspace):
+    for name in ["old", "new"]:
+        create(name=name, no_date=True)
+    (tmp_workspace / "old" / "src" / "pkg").mkdir(parents=True)
+    (tmp_workspace / "old" / "src" / "pkg" / "train.py").write_text("")
+    for name, mtime in [("old", 1000), ("new", 2000)]:
+        for dirpath, _, filenames in os.walk(tmp_workspace / name):
+            for path in [dirpath, *(os.path.join(dirpath, f) for f in filenames)]:
+                os.utime(path, (mtime, mtime))
+    assert [e.name for e in list_all(sort_by="modified")] == ["new", "old"]  # first listing scans all
+
+    # Rewritten in place, deep inside "old": no directory mtime moves
+    (tmp_workspace / "old" / "src" / "pkg" / "train.py").write_text("lr = 1e-3\n")
+    assert [e.name for e in list_all(sort_by="modified")] == ["new", "old"]  # stored timestamps only
+    mock_refresh.assert_not_called()
+
+    assert refresh_activity() == 1  # what the background `novo index activity` runs
+    assert [e.name for e in list_all(sort_by="modified")] == ["old", "new"]
+
+    # Past index.activity_interval, a listing starts one background rescan
+    with index.open_index(tmp_workspace) as conn:
+        index.mark_activity_refreshed(conn, time.time() - 3600)
+    list_all(sort_by="modified")
+    list_all(sort_by="modified")
+    mock_refresh.assert_called_once_with(tmp_workspace)
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_create_many_single_commit_and_partial_failure(mock_uv_init, tmp_workspace):
+    create(name="taken", no_date=True)
+
+    def flaky_init(path, python=None):
+        if path.name == "broken":
+            raise RuntimeError("uv init failed")
+
+    mock_uv_init.side_effect = flaky_init
+    specs = [ExperimentSpec(name=n, no_date=True) for n in ["sweep-1", "broken", "taken", "sweep-2"]]
+    results = create_many(specs, workers=3)
+
+    outcomes = {spec.name: outcome for spec, outcome in results}
+    assert isinstance(outcomes["sweep-1"], Experiment)
+    assert isinstance(outcomes["sweep-2"], Experiment)
+    assert isinstance(outcomes["broken"], RuntimeError)
+    assert isinstance(outcomes["taken"], FileExistsError)
+    assert not (tmp_workspace / "broken").exists()
+    assert {e.name for e in list_all()} == {"taken", "sweep-1", "sweep-2"}
+
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=tmp_workspace, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert log[0] == "novo: create 2 experiments"
+    assert log[1].startswith("novo: create taken")
+
+
+def _git(workspace, *args):
+    return subprocess.run(["git", *args], cwd=workspace, capture_output=True, text=True, check=True).stdout
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_commits_touch_only_the_experiment(mock_uv_init, tmp_workspace):
+    create(name="first", no_date=True)
+    (tmp_workspace / "stray.txt").write_text("untracked")
+    (tmp_workspace / "first" / "notes.md").write_text("work in progress")
+    (tmp_workspace / ".gitignore").write_text("changed\n")
+    _git(tmp_workspace, "add", ".gitignore")
+
+    create(name="second", no_date=True)
+    committed = _git(tmp_workspace, "show", "--name-only", "--format=", "HEAD").split()
+    assert "second/.novo.toml" in committed
+    assert all(path.startswith("second/") for path in committed)
+
+    delete("second")
+    assert _git(tmp_workspace, "show", "--name-only", "--format=", "HEAD").split() == committed
+
+    # Unrelated changes are left as they were
+    status = _git(tmp_workspace, "status", "--porcelain").splitlines()
+    assert sorted(status) == ["?? first/notes.md", "?? stray.txt", "M  .gitignore"]
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_commits_honor_commit_hooks(mock_uv_init, tmp_workspace):
+    create(name="first", no_date=True)
+    hook = tmp_workspace / ".git" / "hooks" / "pre-commit"
+    hook.write_text(f"#!/bin/sh\necho ran >> {tmp_workspace / 'hook.log'}\n")
+    hook.chmod(0o755)
+
+    create(name="second", no_date=True)
+    assert (tmp_workspace / "hook.log").read_text() == "ran\n"
+    assert _git(tmp_workspace, "log", "-1", "--format=%s").startswith("novo: create second")
+
+    hook.write_text("#!/bin/sh\nexit 1\n")
+    with pytest.raises(subprocess.CalledProcessError):
+        create(name="third", no_date=True)
+    assert _git(tmp_workspace, "log", "-1", "--format=%s").startswith("novo: create second")
+
+
+def test_load_specs_applies_defaults(tmp_path):
+    spec_file = tmp_path / "specs.toml"
+    spec_file.write_text(
+        '[defaults]\nseed = "torch"\ntags = ["sweep"]\n\n'
+        '[[experiment]]\nname = "a"\n\n'
+        '[[experiment]]\nname = "b"\ntags = ["base"]\n'
+    )
+    specs = load_specs(spec_file)
+    assert [(s.name, s.seed, s.tags) for s in specs] == [("a", "torch", ["sweep"]), ("b", "torch", ["base"])]
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_create_overlaps_template_copy_with_uv_init(mock_uv_init, tmp_workspace):
+    def fake_init(path, python=None):
+        (path / "pyproject.toml").write_text("[project]\nname = 'from-uv'\n")
+        (path / "README.md").write_text("from uv")
+        time.sleep(0.2)
+
+    def slow_copy(seed, target, **kwargs):
+        time.sleep(0.2)
+        (target / "README.md").write_text("from template")
+        (target / "pyproject.toml").write_text("[project]\nname = 'from-template'\n")
+
+    mock_uv_init.side_effect = fake_init
+    with patch("novo.core.seed.copy_template", side_effect=slow_copy):
+        exp = create(name="piped", no_date=True)
+
+    exp_dir = tmp_workspace / exp.dir_name
+    assert (exp_dir / "README.md").read_text() == "from template"
+    assert "from-uv" in (exp_dir / "pyproject.toml").read_text()
+
+    timings = read_timings("piped")
+    assert {"uv_init", "copy_template", "merge_template", "metadata", "total"} <= set(timings)
+    assert timings["total"] < timings["uv_init"] + timings["copy_template"]
+    assert not list((tmp_workspace / ".novo").glob("piped-*"))  # staging cleaned up
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_explicit_config_targets_its_workspace(mock_uv_init, tmp_workspace, tmp_path):
+    from novo.models.config import NovoConfig
+
+    other = NovoConfig()
+    other.workspace.path = str(tmp_path / "other")
+    create(name="x", no_date=True)
+    create(name="x", no_date=True, config=other)
+
+    assert delete("x", config=other)
+
+    assert (tmp_workspace / "x").is_dir()
+    assert not (tmp_path / "other" / "x").exists()
+    assert [p.name.split("-", 1)[1] for p in (tmp_path / "other" / ".novo" / "trash").iterdir()] == ["x"]
+    assert get("x") is not None
+    assert get("x", config=other) is None
@@ -0,0 +1,93 @@
+"""Tests for the deferred commit journal."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from novo.core import journal
+from novo.core.config import load_config, save_config
+from novo.core.experiment import create, delete
+from novo.core.workspace import ensure_initialized, state_dir
+
+
+@pytest.fixture
+def deferred(tmp_workspace):
+    config = load_config()
+    config.commit.deferred = True
+    save_config(config)
+    workspace = ensure_initialized()
+    with patch("novo.core.journal._spawn_committer") as spawn:
+        yield workspace, spawn
+
+
+def _log(workspace):
+    return subprocess.run(
+        ["git", "log", "--format=%s"], cwd=workspace, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_mutations_are_journaled_not_committed(mock_uv_init, deferred):
+    workspace, spawn = deferred
+    create(name="one", no_date=True)
+    create(name="two", no_date=True)
+
+    assert _log(workspace) == ["novo: initialize workspace"]
+    assert [e["paths"] for e in journal.pending(workspace)] == [["one"], ["two"]]
+    assert spawn.call_count == 2  # no committer actually started
+
+    assert journal.flush(workspace) == 2
+    assert _log(workspace)[0] == "novo: 2 changes"
+    assert journal.pending(workspace) == []
+    assert journal.flush(workspace) == 0
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_created_then_deleted_in_one_batch(mock_uv_init, deferred):
+    workspace, _ = deferred
+    create(name="kept", no_date=True)
+    create(name="fleeting", no_date=True)
+    delete("fleeting")
+
+    journal.flush(workspace)
+    tracked = subprocess.run(
+        ["git", "ls-tree", "--name-only", "HEAD"], cwd=workspace, capture_output=True, text=True
+    ).stdout.split()
+    assert "kept" in tracked
+    assert "fleeting" not in tracked
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_committer_batches_and_exits(mock_uv_init, deferred):
+    workspace, _ = deferred
+    for name in ("a", "b", "c"):
+        create(name=name, no_date=True)
+
+    journal.run_committer(workspace, window=60, max_ops=2)  # batch size reached: no waiting
+
+    assert _log(workspace)[0] == "novo: 3 changes"
+    assert not journal.committer_running(workspace)
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_interrupted_flush_is_retried(mock_uv_init, deferred):
+    workspace, _ = deferred
+    create(name="first", no_date=True)
+    with patch("novo.core.journal.git.add_and_commit", side_effect=subprocess.CalledProcessError(1, "git")):
+        with pytest.raises(subprocess.CalledProcessError):
+            journal.flush(workspace)
+    assert (state_dir(workspace) / journal.FLUSHING_FILE).exists()
+
+    create(name="second", no_date=True)
+    assert journal.flush(workspace) == 1  # the stranded batch goes first
+    assert journal.flush(workspace) == 1
+    assert _log(workspace)[:2] == ["novo: create second (seed: default)", "novo: create first (seed: default)"]
+
+
+def test_running_committer_is_not_duplicated(deferred):
+    workspace, spawn = deferred
+    with journal._locked(workspace, "committer.lock", journal.fcntl.LOCK_EX):
+        assert journal.committer_running(workspace)
+        journal.record(workspace, "novo: something", ["x"])
+    spawn.assert_not_called()
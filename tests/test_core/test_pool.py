@@ -0,0 +1,76 @@
+"""Tests for the pre-warmed experiment pool."""
+
+from unittest.mock import patch
+
+import pytest
+
+from novo.core import pool
+from novo.core.config import load_config, save_config
+from novo.core.experiment import create, read_timings
+from novo.core.workspace import ensure_initialized
+from tests.conftest import fake_uv_init, scaffolded_from_scratch
+
+
+@pytest.fixture
+def pooled(tmp_workspace):
+    config = load_config()
+    config.pool.size = 2
+    save_config(config)
+    return ensure_initialized()
+
+
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_fill_builds_up_to_size(mock_init, pooled):
+    assert pool.fill(pooled, "default", None, 2) == 2
+    assert pool.fill(pooled, "default", None, 2) == 0
+    assert pool.status(pooled) == [("default", "default", 2)]
+    assert pool.clear(pooled) == 2
+    assert pool.status(pooled) == [("default", "default", 0)]
+
+
+@patch("novo.utils.uv.uv_sync_locked")
+@patch("novo.core.pool.refill_async")
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_create_claims_skeleton(mock_init, mock_refill, mock_sync, pooled):
+    pool.fill(pooled, "default", None, 2)
+    for skeleton in (pool.pool_dir(pooled) / "default@default" / "ready").iterdir():
+        (skeleton / "uv.lock").write_text("version = 1\n")
+
+    exp = create(name="fast", no_date=True)
+
+    assert scaffolded_from_scratch(mock_init) == []
+    exp_dir = pooled / exp.dir_name
+    assert 'name = "fast"' in (exp_dir / "pyproject.toml").read_text()
+    assert "Hello from fast!" in (exp_dir / "main.py").read_text()
+    assert (exp_dir / ".novo.toml").exists()
+    assert not (exp_dir / pool.MARKER_FILE).exists()
+    mock_sync.assert_called_once_with(exp_dir, offline=True)
+    assert {"pool_claim", "sync"} <= read_timings("fast").keys()
+    assert pool.status(pooled) == [("default", "default", 1)]
+    mock_refill.assert_called_once_with(pooled, "default", None, 2, True)
+
+
+@patch("novo.core.pool.refill_async")
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_claimed_project_name_is_normalized(mock_init, mock_refill, pooled):
+    pool.fill(pooled, "default", None, 2)
+
+    exp = create(name="Third_One")
+
+    assert scaffolded_from_scratch(mock_init) == []
+    exp_dir = pooled / exp.dir_name
+    project = exp.dir_name.replace("_", "-").lower()
+    assert f'name = "{project}"' in (exp_dir / "pyproject.toml").read_text()
+    assert f"Hello from {project}!" in (exp_dir / "main.py").read_text()
+
+
+@patch("novo.core.pool.refill_async")
+@patch("novo.utils.uv.uv_init", side_effect=fake_uv_init)
+def test_stale_skeletons_are_evicted(mock_init, mock_refill, pooled):
+    pool.fill(pooled, "default", None, 2)
+
+    with patch("novo.core.pool.seed_fingerprint", return_value="changed"):
+        create(name="fresh", no_date=True)
+
+    assert len(scaffolded_from_scratch(mock_init)) == 1
+    assert pool.status(pooled) == [("default", "default", 0)]
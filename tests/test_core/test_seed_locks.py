@@ -0,0 +1,106 @@
+"""Tests for the seed lockfile cache."""
+
+import re
+import subprocess
+import tomllib
+from unittest.mock import patch
+
+from novo.core.seed import install_dependencies, refresh_locks
+from novo.models.seed import Seed, SeedDependencies
+
+LOCK = """version = 1
+requires-python = ">=3.12"
+
+[[package]]
+name = "{name}"
+version = "0.1.0"
+source = {{ virtual = "." }}
+dependencies = [
+    {{ name = "numpy" }},
+]
+
+[[package]]
+name = "numpy"
+version = "2.3.4"
+"""
+
+
+def _project(path, name):
+    path.mkdir()
+    (path / "pyproject.toml").write_text(
+        f'[project]\nname = "{name}"\nversion = "0.1.0"\nrequires-python = ">=3.12"\ndependencies = []\n'
+    )
+    return path
+
+
+def fake_uv_add(directory, packages):
+    pyproject = directory / "pyproject.toml"
+    name = re.sub(r"[-_.]+", "-", directory.name).lower()  # as uv normalizes it
+    pyproject.write_text(
+        pyproject.read_text().replace("dependencies = []", 'dependencies = [\n    "numpy>=2.3.4",\n]')
+    )
+    (directory / "uv.lock").write_text(LOCK.format(name=name))
+
+
+def _seed(tmp_path):
+    seed_dir = tmp_path / "seed"
+    seed_dir.mkdir(exist_ok=True)
+    (seed_dir / "seed.toml").write_text('[seed]\nname = "sci"\n')
+    return Seed(name="sci", path=str(seed_dir), dependencies=SeedDependencies(packages=["numpy"]))
+
+
+@patch("novo.utils.uv.uv_sync_locked")
+@patch("novo.utils.uv.uv_add", side_effect=fake_uv_add)
+def test_second_install_reuses_cached_lock(mock_add, mock_sync, tmp_workspace, tmp_path):
+    seed = _seed(tmp_path)
+    install_dependencies(seed, _project(tmp_path / "first", "first"))
+    install_dependencies(seed, _project(tmp_path / "My_Exp", "My_Exp"))
+
+    assert mock_add.call_count == 1
+    mock_sync.assert_called_once_with(tmp_path / "My_Exp", offline=True)
+    second = tmp_path / "My_Exp"
+    assert '"numpy>=2.3.4"' in (second / "pyproject.toml").read_text()
+    lock = (second / "uv.lock").read_text()
+    assert 'name = "my-exp"' in lock
+    assert 'name = "first"' not in lock
+
+    assert refresh_locks("other") == 0
+    assert refresh_locks("sci") == 1
+    install_dependencies(seed, _project(tmp_path / "third", "third"))
+    assert mock_add.call_count == 2
+
+
+@patch("novo.utils.uv.uv_sync_locked", side_effect=subprocess.CalledProcessError(1, "uv sync"))
+@patch("novo.utils.uv.uv_add", side_effect=fake_uv_add)
+def test_stale_lock_falls_back_to_uv_add(mock_add, mock_sync, tmp_workspace, tmp_path):
+    seed = _seed(tmp_path)
+    install_dependencies(seed, _project(tmp_path / "first", "first"))
+    install_dependencies(seed, _project(tmp_path / "second", "second"))
+
+    assert mock_add.call_count == 2
+    assert mock_sync.call_count == 2  # offline, then online
+    assert 'name = "second"' in (tmp_path / "second" / "uv.lock").read_text()
+
+
+def fake_uv_add_extras(directory, packages):
+    pyproject = directory / "pyproject.toml"
+    name = re.sub(r"[-_.]+", "-", directory.name).lower()
+    pyproject.write_text(
+        pyproject.read_text().replace(
+            "dependencies = []",
+            'dependencies = [\n    "uvicorn[standard]>=0.30",\n    "numpy>=2.3.4",\n]',
+        )
+    )
+    (directory / "uv.lock").write_text(LOCK.format(name=name))
+
+
+@patch("novo.utils.uv.uv_sync_locked")
+@patch("novo.utils.uv.uv_add", side_effect=fake_uv_add_extras)
+def test_cached_lock_keeps_dependencies_with_extras(mock_add, mock_sync, tmp_workspace, tmp_path):
+    seed = _seed(tmp_path)
+    install_dependencies(seed, _project(tmp_path / "first", "first"))
+    install_dependencies(seed, _project(tmp_path / "second", "second"))
+
+    assert mock_add.call_count == 1
+    text = (tmp_path / "second" / "pyproject.toml").read_text()
+    assert tomllib.loads(text)["project"]["dependencies"] == ["uvicorn[standard]>=0.30", "numpy>=2.3.4"]
@@ -0,0 +1,76 @@
+"""Tests for the cached seed registry."""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from novo.core import seed as seed_mod
+from novo.core.seed import get_seed, init_seed, list_seeds
+
+
+def _settle(root):
+    """Backdate mtimes so the registry trusts them (they're past the racy window)."""
+    past = time.time() - 60
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), (past, past))
+        os.utime(dirpath, (past, past))
+
+
+@pytest.fixture
+def seeds(tmp_workspace, tmp_path):
+    init_seed("alpha", "first")
+    init_seed("beta", "second")
+    root = tmp_path / "data" / "seeds"
+    _settle(root)
+    list_seeds()  # warm the registry
+    return root
+
+
+def test_lookups_skip_unchanged_manifests(seeds):
+    with patch("novo.core.seed._load_seed_from_dir", wraps=seed_mod._load_seed_from_dir) as load:
+        assert get_seed("alpha").description == "first"
+        assert get_seed("missing") is None
+        assert [s.name for s in list_seeds()] == ["default", "alpha", "beta"]
+    load.assert_not_called()
+
+
+def test_registry_persists_across_processes(seeds):
+    seed_mod._registry = None  # as in a fresh invocation
+    with patch("novo.core.seed._load_seed_from_dir", wraps=seed_mod._load_seed_from_dir) as load:
+        assert get_seed("beta").files.exclude == ["__pycache__", "*.pyc", ".git"]
+    load.assert_not_called()
+
+
+def test_edited_manifest_is_reparsed(seeds):
+    toml = seeds / "alpha" / "seed.toml"
+    toml.write_text(toml.read_text().replace('"first"', '"edited"'))
+
+    with patch("novo.core.seed._load_seed_from_dir", wraps=seed_mod._load_seed_from_dir) as load:
+        assert get_seed("alpha").description == "edited"
+    assert [call.args[0].name for call in load.call_args_list] == ["alpha"]
+
+
+def test_new_and_removed_seeds_are_noticed(seeds):
+    init_seed("gamma")
+    assert get_seed("gamma") is not None
+
+    seed_mod.remove_seed("alpha")
+    assert get_seed("alpha") is None
+    assert [s.name for s in list_seeds()] == ["default", "beta", "gamma"]
+
+
+def test_concurrent_lookups_share_the_registry(seeds):
+    init_seed("gamma")  # too fresh to trust, so every lookup refreshes and saves
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        found = list(executor.map(get_seed, ["alpha", "beta", "gamma", "missing"] * 16))
+
+    assert [s.name if s else None for s in found[:4]] == ["alpha", "beta", "gamma", None]
+    registry_file = seed_mod.seed_registry_file()
+    assert set(json.loads(registry_file.read_text())["names"]) == {"default", "alpha", "beta", "gamma"}
+    assert [p.name for p in registry_file.parent.iterdir() if p.name.endswith(".tmp")] == []
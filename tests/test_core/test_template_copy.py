@@ -0,0 +1,82 @@
+"""Tests for seed template materialization."""
+
+import errno
+import os
+from unittest.mock import patch
+
+import pytest
+
+from novo.core.seed import _copy_template
+
+
+@pytest.fixture
+def template(tmp_path):
+    src = tmp_path / "template"
+    (src / "data").mkdir(parents=True)
+    (src / "data" / "fixture.bin").write_bytes(b"x" * 4096)
+    (src / "notes.md").write_text("notes")
+    (src / "pyproject.toml").write_text("[project]\n")
+    (src / "__pycache__").mkdir()
+    (src / "__pycache__" / "stale.txt").write_text("never copied")
+    (src / "mod.pyc").write_bytes(b"")
+    return src
+
+
+def test_excluded_dirs_are_pruned(template, tmp_path):
+    dst = tmp_path / "exp"
+    stats = _copy_template(template, dst, ["__pycache__", "*.pyc"], mode="copy")
+
+    assert sorted(p.relative_to(dst).as_posix() for p in dst.rglob("*")) == [
+        "data",
+        "data/fixture.bin",
+        "notes.md",
+        "pyproject.toml",
+    ]
+    assert stats.files == 3
+    assert stats.shared == 0
+
+
+def test_existing_pyproject_kept(template, tmp_path):
+    dst = tmp_path / "exp"
+    dst.mkdir()
+    (dst / "pyproject.toml").write_text("from uv init")
+
+    _copy_template(template, dst, [], mode="copy", workers=4)
+    assert (dst / "pyproject.toml").read_text() == "from uv init"
+    assert (dst / "data" / "fixture.bin").stat().st_size == 4096
+
+
+def test_hardlink_shares_only_read_only_sources(template, tmp_path):
+    os.chmod(template / "data" / "fixture.bin", 0o444)
+    dst = tmp_path / "exp"
+    with patch("novo.core.seed.fcntl.ioctl", side_effect=OSError(errno.EOPNOTSUPP, "Operation not supported")):
+        stats = _copy_template(template, dst, ["__pycache__", "*.pyc"], mode="hardlink", workers=2)
+
+    assert os.path.samefile(template / "data" / "fixture.bin", dst / "data" / "fixture.bin")
+    # Writable template files are copied: editing them must not edit the seed
+    assert not os.path.samefile(template / "notes.md", dst / "notes.md")
+    (dst / "notes.md").write_text("edited")
+    assert (template / "notes.md").read_text() == "notes"
+    assert stats.mode == "hardlink"
+    assert stats.shared == 4096
+
+
+def test_reflink_falls_back_to_copy_once(template, tmp_path):
+    unsupported = OSError(errno.EOPNOTSUPP, "Operation not supported")
+    with patch("novo.core.seed.fcntl.ioctl", side_effect=unsupported) as ioctl:
+        stats = _copy_template(template, tmp_path / "exp", ["__pycache__"], mode="reflink")
+
+    assert ioctl.call_count == 1
+    assert stats.mode == "copy"
+    assert (tmp_path / "exp" / "notes.md").read_text() == "notes"
+
+
+def test_reflink_counts_cloned_bytes(template, tmp_path):
+    def fake_clone(dst_fd, request, src_fd):
+        os.write(dst_fd, os.read(src_fd, 1 << 16))
+
+    with patch("novo.core.seed.fcntl.ioctl", side_effect=fake_clone):
+        stats = _copy_template(template, tmp_path / "exp", ["__pycache__", "*.pyc"], mode="reflink")
+
+    assert stats.mode == "reflink"
+    assert stats.shared == stats.bytes == 4096 + len("notes") + len("[project]\n")
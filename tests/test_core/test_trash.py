@@ -0,0 +1,85 @@
+"""Tests for trash-based delete and restore."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from novo.core import trash
+from novo.core.config import load_config, save_config
+from novo.core.experiment import create, delete, get, restore
+
+
+def _tracked(workspace):
+    return subprocess.run(
+        ["git", "ls-tree", "--name-only", "HEAD"], cwd=workspace, capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_delete_moves_to_trash_and_commits(mock_uv_init, tmp_workspace):
+    create(name="binned", no_date=True)
+    (tmp_workspace / "binned" / ".venv").mkdir()
+    (tmp_workspace / "binned" / ".venv" / "big").write_bytes(b"x" * 1000)
+
+    with patch("novo.core.trash.purge_async") as purge_async:
+        assert delete("binned")
+
+    purge_async.assert_not_called()  # still within the retention window
+    assert not (tmp_workspace / "binned").exists()
+    assert "binned" not in _tracked(tmp_workspace)
+    [entry] = trash.entries(tmp_workspace)
+    assert entry.dir_name == "binned"
+    assert (entry.path / ".venv" / "big").exists()
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_restore_brings_back_everything(mock_uv_init, tmp_workspace):
+    create(name="undo-me", tags=["keep"], no_date=True)
+    (tmp_workspace / "undo-me" / ".venv").mkdir()
+    delete("undo-me")
+
+    exp = restore("undo-me")
+
+    assert exp.tags == ["keep"]
+    assert (tmp_workspace / "undo-me" / ".venv").is_dir()
+    assert get("undo-me") is not None
+    assert "undo-me" in _tracked(tmp_workspace)
+    assert trash.entries(tmp_workspace) == []
+    assert restore("undo-me") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_restore_refuses_to_overwrite(mock_uv_init, tmp_workspace):
+    create(name="twice", no_date=True)
+    delete("twice")
+    create(name="twice", no_date=True)
+
+    with pytest.raises(FileExistsError):
+        restore("twice")
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_expired_entries_are_purged(mock_uv_init, tmp_workspace):
+    config = load_config()
+    config.trash.retention_hours = 0
+    save_config(config)
+    create(name="gone-for-good", no_date=True)
+
+    with patch("novo.core.trash.purge_async") as purge_async:
+        delete("gone-for-good")
+    purge_async.assert_called_once()
+
+    assert trash.purge(tmp_workspace) == 1
+    assert trash.entries(tmp_workspace) == []
+    assert list((tmp_workspace / ".novo" / "trash").iterdir()) == []
+    assert restore("gone-for-good") is None
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_purge_keeps_entries_within_retention(mock_uv_init, tmp_workspace):
+    create(name="recent", no_date=True)
+    delete("recent")
+
+    assert trash.purge(tmp_workspace, retention=3600) == 0
+    assert [e.dir_name for e in trash.entries(tmp_workspace)] == ["recent"]
@@ -0,0 +1,95 @@
+"""Tests for disk usage accounting."""
+
+import os
+from unittest.mock import patch
+
+from novo.core import usage
+from novo.core.experiment import archive, create, disk_usage
+
+
+def _write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def _blocks(path):
+    return os.lstat(path).st_blocks * 512
+
+
+def test_scan_splits_venv_data_and_source(tmp_path):
+    _write(tmp_path / ".venv" / "lib" / "torch.so", 20000)
+    _write(tmp_path / "data" / "raw" / "train.txt", 10000)
+    _write(tmp_path / "features.parquet", 5000)
+    _write(tmp_path / "src" / "model.py", 100)
+
+    dirs = usage.scan({"exp": tmp_path}, workers=4)["exp"]
+    result = usage.total(dirs)
+
+    assert set(dirs) == {"", ".venv", ".venv/lib", "data", "data/raw", "src"}
+    assert result.venv == _blocks(tmp_path / ".venv" / "lib" / "torch.so")
+    assert result.data == _blocks(tmp_path / "data" / "raw" / "train.txt") + _blocks(tmp_path / "features.parquet")
+    assert result.source == _blocks(tmp_path / "src" / "model.py")
+    assert result.total == result.venv + result.data + result.source
+
+
+def test_scan_reuses_unchanged_directories(tmp_path):
+    _write(tmp_path / ".venv" / "lib" / "torch.so", 20000)
+    _write(tmp_path / "src" / "model.py", 100)
+    first = usage.scan({"exp": tmp_path})["exp"]
+
+    with patch("novo.core.usage.os.scandir", wraps=os.scandir) as scandir:
+        assert usage.scan({"exp": tmp_path}, {"exp": first})["exp"] == first
+    assert scandir.call_count == 0
+
+    _write(tmp_path / "src" / "train.py", 5000)
+    with patch("novo.core.usage.os.scandir", wraps=os.scandir) as scandir:
+        second = usage.scan({"exp": tmp_path}, {"exp": first})["exp"]
+    assert [call.args[0] for call in scandir.call_args_list] == [str(tmp_path / "src")]
+    assert usage.total(second).source > usage.total(first).source
+
+
+def test_scan_drops_removed_directories(tmp_path):
+    _write(tmp_path / "outputs" / "run1" / "log.txt", 100)
+    first = usage.scan({"exp": tmp_path})["exp"]
+
+    (tmp_path / "outputs" / "run1" / "log.txt").unlink()
+    (tmp_path / "outputs" / "run1").rmdir()
+    second = usage.scan({"exp": tmp_path}, {"exp": first})["exp"]
+
+    assert "outputs/run1" not in second
+    assert usage.total(second).data == 0
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_disk_usage_is_cached_in_index(mock_uv, tmp_workspace):
+    create(name="big", no_date=True)
+    create(name="small", no_date=True)
+    _write(tmp_workspace / "big" / "checkpoints" / "model.pt", 50000)
+
+    sizes = disk_usage()
+    assert set(sizes) == {"big", "small"}
+    assert sizes["big"].data >= 50000
+    assert sizes["small"].data == 0
+
+    def listed(scandir):
+        return [call.args[0] for call in scandir.call_args_list if str(call.args[0]).startswith(str(tmp_workspace / "big"))]
+
+    with patch("novo.core.usage.os.scandir", wraps=os.scandir) as scandir:
+        assert disk_usage(["big"]) == {"big": sizes["big"]}
+    assert listed(scandir) == []
+
+    with patch("novo.core.usage.os.scandir", wraps=os.scandir) as scandir:
+        assert disk_usage(["big"], rescan=True) == {"big": sizes["big"]}
+    assert str(tmp_workspace / "big" / "checkpoints") in listed(scandir)
+
+
+@patch("novo.core.experiment.uv.uv_init")
+def test_disk_usage_counts_archive(mock_uv, tmp_workspace):
+    create(name="cold", no_date=True)
+    _write(tmp_workspace / "cold" / "results.csv", 50000)
+
+    [(_, stats)] = archive(["cold"])
+    size = disk_usage(["cold"])["cold"]
+
+    assert size.data == 0
+    assert size.archive == stats.compressed
@@ -0,0 +1,48 @@
+"""Tests for workspace initialization."""
+
+import json
+import shutil
+from unittest.mock import patch
+
+from novo.core import workspace as ws
+from novo.core.workspace import STATE_DIR, STATE_FILE, ensure_initialized
+
+
+def test_initializes_once_and_writes_marker(tmp_workspace):
+    assert ensure_initialized() == tmp_workspace
+    assert (tmp_workspace / ".git").is_dir()
+
+    marker = json.loads((tmp_workspace / STATE_DIR / STATE_FILE).read_text())
+    assert marker["git_dir"] == str(tmp_workspace / ".git")
+
+    with patch("novo.core.workspace.git.git_dir") as git_dir:
+        assert ensure_initialized() == tmp_workspace
+    git_dir.assert_not_called()
+
+
+def test_marker_skips_git_in_new_process(tmp_workspace):
+    ensure_initialized()
+    ws._verified.clear()  # as in a fresh process
+
+    with patch("novo.core.workspace.git.git_dir") as git_dir:
+        ensure_initialized()
+    git_dir.assert_not_called()
+
+
+def test_reverifies_when_git_dir_is_gone(tmp_workspace):
+    ensure_initialized()
+    shutil.rmtree(tmp_workspace / ".git")
+
+    ensure_initialized()
+    assert (tmp_workspace / ".git").is_dir()
+
+
+def test_reverifies_when_marker_is_missing(tmp_workspace):
+    ensure_initialized()
+    ws._verified.clear()
+    (tmp_workspace / STATE_DIR / STATE_FILE).unlink()
+
+    with patch("novo.core.workspace.git.git_dir", wraps=ws.git.git_dir) as git_dir:
+        ensure_initialized()
+    git_dir.assert_called_once()
+    assert (tmp_workspace / STATE_DIR / STATE_FILE).exists()